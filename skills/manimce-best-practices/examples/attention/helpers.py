@@ -7,9 +7,9 @@ Contains utility functions and classes for attention visualization.
 
 from manim import *
 import numpy as np
-import warnings
 import random
 import itertools as it
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
@@ -17,23 +17,61 @@ from typing import Optional, Tuple
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def softmax(logits, temperature=1.0):
-    """Numerically stable softmax function."""
-    logits = np.array(logits)
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore')
-        logits = logits - np.max(logits)
-        exps = np.exp(np.divide(logits, temperature, where=temperature != 0))
+# Number of precomputed steps in each color ramp
+COLOR_RESOLUTION = 256
 
-    if np.isinf(exps).any() or np.isnan(exps).any() or temperature == 0:
+
+def softmax(logits, temperature=1.0, axis=-1, mask=None):
+    """Numerically stable softmax of an N-D array along `axis`.
+
+    Entries where `mask` (broadcastable to `logits`) is False, as well as
+    -inf logits, get probability 0; a row with no valid entry is all zeros.
+    A temperature of 0 puts all the weight on the largest logit.
+    """
+    logits = np.asarray(logits, dtype=float)
+    if mask is not None:
+        logits = np.where(mask, logits, -np.inf)
+
+    if temperature == 0:
         result = np.zeros_like(logits)
-        result[np.argmax(logits)] = 1
-        return result
-    return exps / np.sum(exps)
+        index = np.expand_dims(np.argmax(logits, axis=axis), axis)
+        np.put_along_axis(result, index, 1.0, axis=axis)
+        return np.where(np.isfinite(logits), result, 0.0)
+
+    peak = np.max(logits, axis=axis, keepdims=True)
+    peak = np.where(np.isfinite(peak), peak, 0.0)
+    exps = np.exp((logits - peak) / temperature)
+    totals = exps.sum(axis=axis, keepdims=True)
+    return np.divide(exps, totals, out=np.zeros_like(exps), where=totals > 0)
+
+
+def _color_ramp(low_color, high_color):
+    """(rgbs, hex_colors) sampled along the line between two colors."""
+    return _hex_color_ramp(ManimColor(low_color).to_hex(), ManimColor(high_color).to_hex())
+
+
+@lru_cache(maxsize=32)
+def _hex_color_ramp(low_color, high_color):
+    alphas = np.linspace(0, 1, COLOR_RESOLUTION)[:, np.newaxis]
+    low_rgb = color_to_rgb(low_color)
+    high_rgb = color_to_rgb(high_color)
+    rgbs = low_rgb + alphas * (high_rgb - low_rgb)
+    hex_colors = np.array([rgb_to_hex(rgb) for rgb in rgbs])
+    return rgbs, hex_colors
 
 
-def value_to_color(
-    value,
+def _ramp_indices(values, min_value, max_value):
+    values = np.asarray(values, dtype=float)
+    if max_value == min_value:
+        alphas = np.full(values.shape, 0.5)
+    else:
+        alphas = np.clip(np.abs(values - min_value) / (max_value - min_value), 0, 1)
+    indices = np.round(alphas * (COLOR_RESOLUTION - 1)).astype(int)
+    return values >= 0, indices
+
+
+def values_to_colors(
+    values,
     low_positive_color=BLUE_E,
     high_positive_color=BLUE_B,
     low_negative_color=RED_E,
@@ -41,14 +79,38 @@ def value_to_color(
     min_value=0.0,
     max_value=10.0
 ):
-    """Map a numeric value to a color based on sign and magnitude."""
-    # Clamp alpha between 0 and 1
-    alpha = max(0, min(1, abs(value - min_value) / (max_value - min_value))) if max_value != min_value else 0.5
+    """Hex colors for an array of values, in the array's shape.
 
-    if value >= 0:
-        return interpolate_color(low_positive_color, high_positive_color, alpha)
-    else:
-        return interpolate_color(low_negative_color, high_negative_color, alpha)
+    Sign picks the blue or red ramp, magnitude the position along it.
+    """
+    positive, indices = _ramp_indices(values, min_value, max_value)
+    _, positive_hex = _color_ramp(low_positive_color, high_positive_color)
+    _, negative_hex = _color_ramp(low_negative_color, high_negative_color)
+    return np.where(positive, positive_hex[indices], negative_hex[indices])
+
+
+def values_to_rgbas(
+    values,
+    opacity=1.0,
+    low_positive_color=BLUE_E,
+    high_positive_color=BLUE_B,
+    low_negative_color=RED_E,
+    high_negative_color=RED_B,
+    min_value=0.0,
+    max_value=10.0
+):
+    """RGBA array of shape (*values.shape, 4) for an array of values."""
+    positive, indices = _ramp_indices(values, min_value, max_value)
+    positive_rgbs, _ = _color_ramp(low_positive_color, high_positive_color)
+    negative_rgbs, _ = _color_ramp(low_negative_color, high_negative_color)
+    rgbs = np.where(positive[..., np.newaxis], positive_rgbs[indices], negative_rgbs[indices])
+    opacities = np.full((*rgbs.shape[:-1], 1), opacity, dtype=float)
+    return np.concatenate([rgbs, opacities], axis=-1)
+
+
+def value_to_color(value, *args, **kwargs):
+    """Color of a single value, see `values_to_colors`."""
+    return values_to_colors(value, *args, **kwargs).item()
 
 
 def get_paragraph(words, line_len=40, font_size=48):
@@ -152,10 +214,26 @@ class NumericEmbedding(VGroup):
         return self.elements
 
 
+@lru_cache(maxsize=2048)
+def number_template(num_string, font_size, num_decimal_places, include_sign):
+    """Laid-out DecimalNumber showing `num_string`, shared by all matrices."""
+    number = float(num_string.replace(",", ""))
+    return DecimalNumber(
+        number,
+        num_decimal_places=num_decimal_places,
+        include_sign=include_sign,
+        font_size=font_size,
+    )
+
+
 class WeightMatrix(VGroup):
     """
     A matrix of decimal numbers with color-coded entries.
     Used to represent weight matrices in neural networks.
+
+    The values are kept in one array; `set_values` updates the text and
+    color of all entries in one pass, copying glyphs from numbers that are
+    laid out once per formatted string.
     """
 
     def __init__(
@@ -185,11 +263,21 @@ class WeightMatrix(VGroup):
         if values is None:
             values = np.random.uniform(*value_range, size=shape)
 
-        self.values = values
+        self.values = np.array(values, dtype=float)
+        self.color_config = dict(
+            low_positive_color=low_positive_color,
+            high_positive_color=high_positive_color,
+            low_negative_color=low_negative_color,
+            high_negative_color=high_negative_color,
+            min_value=0,
+            max_value=max(abs(value_range[0]), abs(value_range[1])),
+        )
 
         # Create matrix entries
         self.rows = VGroup()
         n_rows, n_cols = shape
+        colors = values_to_colors(values, **self.color_config)
+        positions = []
 
         for i in range(n_rows):
             row = VGroup()
@@ -206,14 +294,8 @@ class WeightMatrix(VGroup):
                         include_sign=True,
                         font_size=24
                     )
-                    entry.set_color(value_to_color(
-                        val,
-                        low_positive_color,
-                        high_positive_color,
-                        low_negative_color,
-                        high_negative_color,
-                        0, max(abs(value_range[0]), abs(value_range[1]))
-                    ))
+                    entry.set_color(colors[i, j])
+                    positions.append((i, j))
                 row.add(entry)
             row.arrange(RIGHT, buff=0.2)
             self.rows.add(row)
@@ -232,6 +314,11 @@ class WeightMatrix(VGroup):
 
         self.add(self.left_bracket, self.rows, self.right_bracket)
 
+        # Array position of each DecimalNumber entry, in get_entries() order
+        self.entry_rows, self.entry_cols = np.array(positions, dtype=int).reshape(-1, 2).T
+        self.num_strings = np.array([entry._get_num_string(entry.number) for entry in self.get_entries()])
+        self.entry_colors = colors[self.entry_rows, self.entry_cols].astype(object)
+
     def get_entries(self):
         entries = VGroup()
         for row in self.rows:
@@ -243,6 +330,56 @@ class WeightMatrix(VGroup):
     def get_rows(self):
         return self.rows
 
+    def get_values(self):
+        return self.values
+
+    def set_values(self, values):
+        """Show a new array of values, recoloring the entries to match.
+
+        Only entries whose formatted text or color changed are updated.
+        """
+        self.values = np.array(values, dtype=float).reshape(self.shape)
+        entries = self.get_entries()
+        if not entries:
+            return self
+        entry_values = self.values[self.entry_rows, self.entry_cols]
+        formatter = entries[0]
+        num_strings = np.array([formatter._get_num_string(value) for value in entry_values])
+        colors = values_to_colors(entry_values, **self.color_config).astype(object)
+
+        text_changed = num_strings != self.num_strings
+        changed = text_changed | (colors != self.entry_colors)
+        for index in np.flatnonzero(changed):
+            entry = entries[index]
+            opacity = entry.get_fill_opacity()
+            if text_changed[index]:
+                template = number_template(
+                    num_strings[index],
+                    round(entry.font_size, 3),
+                    entry.num_decimal_places,
+                    entry.include_sign,
+                )
+                self.set_entry_glyphs(entry, template, entry_values[index])
+            entry.set_fill(colors[index], opacity)
+
+        self.num_strings = num_strings
+        self.entry_colors = colors
+        return self
+
+    def set_entry_glyphs(self, entry, template, value):
+        """Make `entry` show the glyphs of `template`, keeping its fixed edge in place."""
+        anchor = entry.get_critical_point(entry.edge_to_fix)
+        if len(entry.submobjects) == len(template.submobjects):
+            for glyph, template_glyph in zip(entry.submobjects, template.submobjects):
+                glyph.become(template_glyph)
+        else:
+            entry.submobjects = [glyph.copy() for glyph in template.submobjects]
+        # font_size is measured against initial_height, so rebase it on the
+        # template's glyphs to keep it at the template's size
+        entry.initial_height = template.initial_height * entry._font_size / template._font_size
+        entry.number = value
+        entry.move_to(anchor, entry.edge_to_fix)
+
 
 class ContextAnimation(LaggedStart):
     """
@@ -409,24 +546,16 @@ class RandomizeMatrixEntries(Animation):
 
     def __init__(self, matrix, **kwargs):
         self.matrix = matrix
-        self.entries = matrix.get_entries()
-        self.start_values = [
-            entry.get_value() if hasattr(entry, 'get_value') else 0
-            for entry in self.entries
-        ]
+        self.start_values = matrix.get_values().copy()
         self.target_values = np.random.uniform(
             matrix.value_range[0],
             matrix.value_range[1],
-            len(self.entries)
+            matrix.shape
         )
         super().__init__(matrix, **kwargs)
 
     def interpolate_mobject(self, alpha: float) -> None:
-        for index, entry in enumerate(self.entries):
-            if hasattr(entry, 'set_value'):
-                start = self.start_values[index]
-                target = self.target_values[index]
-                entry.set_value(interpolate(start, target, alpha))
+        self.matrix.set_values(interpolate(self.start_values, self.target_values, alpha))
 
 
 def show_attention_flow(scene, source_mobs, target_mob, weights=None, run_time=2):
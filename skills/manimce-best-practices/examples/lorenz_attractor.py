@@ -8,28 +8,72 @@ Run with: manim -pql lorenz_attractor.py LorenzAttractor
 """
 
 from manim import *
+from pathlib import Path
 from scipy.integrate import solve_ivp
+import hashlib
+import inspect
+import os
 import numpy as np
 
 
 def lorenz_system(t, state, sigma=10, rho=28, beta=8 / 3):
-    """The Lorenz system of differential equations."""
-    x, y, z = state
+    """The Lorenz system of differential equations, for one state or an (N, 3) array."""
+    state = np.asarray(state)
+    x, y, z = state[..., 0], state[..., 1], state[..., 2]
     dxdt = sigma * (y - x)
     dydt = x * (rho - z) - y
     dzdt = x * y - beta * z
-    return [dxdt, dydt, dzdt]
-
+    return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def ode_cache_path(function, params, states0, time, dt):
+    """Cache file for a bundle of solutions, keyed by everything that determines them."""
+    key = hashlib.sha256()
+    key.update(function.__qualname__.encode())
+    key.update(function.__code__.co_code)
+    key.update(repr(function.__code__.co_consts).encode())
+    # Hash the arguments `function` is actually called with, defaults included,
+    # so that changing a default does not reuse a stale solution
+    arguments = inspect.signature(function).bind(0, states0, **params)
+    arguments.apply_defaults()
+    key.update(repr(list(arguments.arguments.items())[2:]).encode())
+    key.update(repr((states0.shape, float(time), float(dt))).encode())
+    key.update(states0.tobytes())
+    return Path(config.media_dir, "ode_solutions", f"{function.__name__}-{key.hexdigest()[:20]}.npy")
+
+
+def ode_solution_bundle(function, states0, time, dt=0.01, cache=True, **params):
+    """Solve ODE for N initial states at once and return points of shape (N, n_points, dim).
+
+    All trajectories are advanced by one RK45 solve over the stacked state,
+    and solutions are memoized on disk under the media directory.
+    """
+    states0 = np.array(states0, dtype=float)
+    path = ode_cache_path(function, params, states0, time, dt)
+    if cache and path.exists():
+        return np.load(path)
 
-def ode_solution_points(function, state0, time, dt=0.01):
-    """Solve ODE and return solution points."""
+    shape = states0.shape
     solution = solve_ivp(
-        function,
+        lambda t, y: np.reshape(function(t, y.reshape(shape), **params), -1),
         t_span=(0, time),
-        y0=state0,
+        y0=states0.reshape(-1),
         t_eval=np.arange(0, time, dt)
     )
-    return solution.y.T
+    points = solution.y.T.reshape(-1, *shape).swapaxes(0, 1)
+
+    if cache:
+        # Write then rename, so parallel renders never read a partial file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(temp_path, points)
+        os.replace(temp_path, path)
+    return points
+
+
+def ode_solution_points(function, state0, time, dt=0.01, **params):
+    """Solve ODE and return solution points."""
+    return ode_solution_bundle(function, [state0], time, dt, **params)[0]
 
 
 class LorenzAttractor(ThreeDScene):
@@ -79,10 +123,10 @@ class LorenzAttractor(ThreeDScene):
         ]
         colors = color_gradient([BLUE_E, BLUE_A], len(states))
 
-        # Create curves from ODE solutions
+        # Create curves from ODE solutions, all integrated together
         curves = VGroup()
-        for state, color in zip(states, colors):
-            points = ode_solution_points(lorenz_system, state, evolution_time)
+        solutions = ode_solution_bundle(lorenz_system, states, evolution_time)
+        for points, color in zip(solutions, colors):
             # Scale points to fit axes
             scaled_points = [axes.c2p(p[0], p[1], p[2]) for p in points]
             curve = VMobject()
@@ -11,6 +11,87 @@ from manim import *
 import numpy as np
 
 
+class BufferedTracedPath(VMobject):
+    """
+    TracedPath with bounded memory.
+
+    TracedPath appends a line to its points every frame, which copies the
+    whole array, so long scenes slow down frame by frame. Here the lines
+    go into a buffer of 2 * max_lines preallocated slots, and the path's
+    points are a view of the live window of it. Appending or dropping a
+    line only moves the window, and when it reaches the end of the buffer
+    the live lines are copied back to the front, once every max_lines
+    frames. Lines older than dissipating_time seconds, or further back
+    than dissipating_length along the path, are dropped, as is the oldest
+    one once max_lines are live.
+    """
+
+    def __init__(
+        self,
+        traced_point_func,
+        stroke_width=2,
+        stroke_color=WHITE,
+        dissipating_time=None,
+        dissipating_length=None,
+        max_lines=None,
+        **kwargs
+    ):
+        super().__init__(stroke_color=stroke_color, stroke_width=stroke_width, **kwargs)
+        if max_lines is None:
+            max_lines = 10000 if dissipating_time is None else int(np.ceil(dissipating_time * config.frame_rate)) + 1
+        self.max_lines = max_lines
+        self.traced_point_func = traced_point_func
+        self.dissipating_time = dissipating_time
+        self.dissipating_length = dissipating_length
+        self.time = 0
+        self.last_point = None
+        # Each line is a straight cubic Bezier curve of four points
+        self.line_buffer = np.zeros((2 * max_lines, 4, 3))
+        self.line_times = np.zeros(2 * max_lines)
+        self.line_lengths = np.zeros(2 * max_lines)  # Path length up to each line's end
+        self.start = self.end = 0
+        self.add_updater(lambda m, dt: m.update_path(dt))
+
+    def update_path(self, dt):
+        point = np.array(self.traced_point_func())
+        self.time += dt
+        if self.last_point is not None and not np.allclose(point, self.last_point):
+            self.add_line(self.last_point, point)
+        self.last_point = point
+        self.dissipate()
+        self.points = self.line_buffer[self.start:self.end].reshape((-1, 3))
+
+    def add_line(self, start, end):
+        if self.end == len(self.line_buffer):
+            # Move the live window back to the front of the buffer
+            live = slice(self.start, self.end)
+            n_live = self.end - self.start
+            for buffer in (self.line_buffer, self.line_times, self.line_lengths):
+                buffer[:n_live] = buffer[live]
+            self.start, self.end = 0, n_live
+        prev_length = self.line_lengths[self.end - 1] if self.end > self.start else 0
+        self.line_buffer[self.end] = np.linspace(start, end, 4)
+        self.line_times[self.end] = self.time
+        self.line_lengths[self.end] = prev_length + np.linalg.norm(end - start)
+        self.end += 1
+        if self.end - self.start > self.max_lines:
+            self.start += 1
+
+    def dissipate(self):
+        while self.end - self.start > 1:
+            too_old = (
+                self.dissipating_time is not None
+                and self.time - self.line_times[self.start] > self.dissipating_time
+            )
+            too_far = (
+                self.dissipating_length is not None
+                and self.line_lengths[self.end - 1] - self.line_lengths[self.start] > self.dissipating_length
+            )
+            if not (too_old or too_far):
+                break
+            self.start += 1
+
+
 class BasicUpdater(Scene):
     """Simple updater that makes an object follow another."""
 
@@ -126,8 +207,8 @@ class TracedPathExample(Scene):
         dot = Dot(color=RED, radius=0.15)
         dot.move_to(LEFT * 3)
 
-        # Traced path follows the dot
-        traced_path = TracedPath(
+        # Traced path follows the dot, from a fixed-size buffer
+        traced_path = BufferedTracedPath(
             dot.get_center,
             stroke_color=YELLOW,
             stroke_width=3
@@ -151,6 +232,26 @@ class TracedPathExample(Scene):
         self.wait()
 
 
+class DissipatingTrailExample(Scene):
+    """A long-running orbit whose trails fade out by time and by length."""
+
+    def construct(self):
+        # Two dots circling at different speeds
+        fast_dot = Dot(RIGHT * 2, color=RED)
+        slow_dot = Dot(RIGHT * 3, color=BLUE)
+        fast_dot.add_updater(lambda m, dt: m.rotate(2 * dt, about_point=ORIGIN))
+        slow_dot.add_updater(lambda m, dt: m.rotate(-0.5 * dt, about_point=ORIGIN))
+
+        # The last second of motion, and the last 3 units of path
+        fast_trail = BufferedTracedPath(fast_dot.get_center, stroke_color=RED, dissipating_time=1)
+        slow_trail = BufferedTracedPath(slow_dot.get_center, stroke_color=BLUE, dissipating_length=3)
+
+        self.add(fast_trail, slow_trail, fast_dot, slow_dot)
+
+        # Per-frame cost stays flat for the whole wait
+        self.wait(30)
+
+
 class SineWaveTracker(Scene):
     """Animated sine wave using ValueTracker."""
 
@@ -255,7 +356,7 @@ class ParametricCurveTracer(Scene):
         )
 
         # Traced path
-        path = TracedPath(
+        path = BufferedTracedPath(
             dot.get_center,
             stroke_color=BLUE,
             stroke_width=2
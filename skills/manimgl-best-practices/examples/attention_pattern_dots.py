@@ -6,15 +6,11 @@ where dot size represents attention weight.
 
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def softmax(logits, temperature=1.0):
-    """Compute softmax of logits array."""
-    logits = np.array(logits, dtype=float)
-    # Mask future tokens (causal attention)
-    logits = logits - np.max(logits)
-    exps = np.exp(logits / temperature)
-    return exps / np.sum(exps)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import softmax
 
 
 class AttentionPatternDots(InteractiveScene):
@@ -58,14 +54,9 @@ class AttentionPatternDots(InteractiveScene):
 
         # Generate attention pattern (causal masking)
         values = np.random.normal(0, 1, (N, N))
-        # Apply causal mask
-        for n, row in enumerate(values):
-            row[:n] = -np.inf
-
-        # Softmax each column
-        attention_pattern = np.zeros_like(values)
-        for k in range(N):
-            attention_pattern[:, k] = softmax(values[:, k])
+        # Softmax each column, with a causal mask hiding later keys
+        causal_mask = np.triu(np.ones((N, N), dtype=bool))
+        attention_pattern = softmax(values, axis=0, mask=causal_mask)
 
         # Create dots based on attention weights
         dots = VGroup()
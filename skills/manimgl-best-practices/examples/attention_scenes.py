@@ -21,46 +21,17 @@ import numpy as np
 import re
 import itertools as it
 import random
-import warnings
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import softmax
 
 
 # ============================================================
 # Helper Functions
 # ============================================================
 
-def softmax(logits, temperature=1.0):
-    """Compute softmax of logits array."""
-    logits = np.array(logits)
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore')
-        logits = logits - np.max(logits)
-        exps = np.exp(np.divide(logits, temperature, where=temperature != 0))
-
-    if np.isinf(exps).any() or np.isnan(exps).any() or temperature == 0:
-        result = np.zeros_like(logits)
-        result[np.argmax(logits)] = 1
-        return result
-    return exps / np.sum(exps)
-
-
-def value_to_color(
-    value,
-    low_positive_color=BLUE_E,
-    high_positive_color=BLUE_B,
-    low_negative_color=RED_E,
-    high_negative_color=RED_B,
-    min_value=0.0,
-    max_value=10.0
-):
-    """Map a value to a color using interpolation."""
-    alpha = clip(float(inverse_interpolate(min_value, max_value, abs(value))), 0, 1)
-    if value >= 0:
-        colors = (low_positive_color, high_positive_color)
-    else:
-        colors = (low_negative_color, high_negative_color)
-    return interpolate_color_by_hsl(*colors, alpha)
-
-
 def break_into_pieces(phrase_mob, offsets):
     """Break a Text mobject into pieces at given character offsets."""
     phrase = phrase_mob.get_string()
@@ -121,62 +92,6 @@ def get_piece_rectangles(
     return rects
 
 
-class WeightMatrix(DecimalMatrix):
-    """A matrix display for neural network weights."""
-    def __init__(
-        self,
-        values=None,
-        shape=(6, 8),
-        value_range=(-9.9, 9.9),
-        ellipses_row=-2,
-        ellipses_col=-2,
-        num_decimal_places=1,
-        bracket_h_buff=0.1,
-        decimal_config=dict(include_sign=True),
-        low_positive_color=BLUE_E,
-        high_positive_color=BLUE_B,
-        low_negative_color=RED_E,
-        high_negative_color=RED_B,
-    ):
-        if values is not None:
-            shape = values.shape
-        self.shape = shape
-        self.value_range = value_range
-        self.low_positive_color = low_positive_color
-        self.high_positive_color = high_positive_color
-        self.low_negative_color = low_negative_color
-        self.high_negative_color = high_negative_color
-        self.ellipses_row = ellipses_row
-        self.ellipses_col = ellipses_col
-
-        if values is None:
-            values = np.random.uniform(*self.value_range, size=shape)
-
-        super().__init__(
-            values,
-            num_decimal_places=num_decimal_places,
-            bracket_h_buff=bracket_h_buff,
-            decimal_config=decimal_config,
-            ellipses_row=ellipses_row,
-            ellipses_col=ellipses_col,
-        )
-        self.set_entry_colors()
-
-    def set_entry_colors(self):
-        for entry in self.get_entries():
-            if isinstance(entry, DecimalNumber):
-                entry.set_color(value_to_color(
-                    entry.get_value(),
-                    self.low_positive_color,
-                    self.high_positive_color,
-                    self.low_negative_color,
-                    self.high_negative_color,
-                    min_value=0.0,
-                    max_value=self.value_range[1],
-                ))
-        return self
-
-
 class NumericEmbedding(DecimalMatrix):
     """A vector display for embeddings."""
     def __init__(
@@ -250,20 +165,6 @@ class ContextAnimation(LaggedStart):
         )
 
 
-class RandomizeMatrixEntries(Animation):
-    """Animation that randomizes matrix entries."""
-    def __init__(self, matrix, **kwargs):
-        self.matrix = matrix
-        super().__init__(matrix, **kwargs)
-
-    def interpolate_mobject(self, alpha):
-        if random.random() < 0.1:
-            for entry in self.matrix.get_entries():
-                if isinstance(entry, DecimalNumber):
-                    new_val = random.uniform(-9.9, 9.9)
-                    entry.set_value(new_val)
-
-
 # ============================================================
 # Scene Definitions
 # ============================================================
@@ -335,10 +236,7 @@ class ShowMasking(Scene):
         self.wait()
 
         # Normalized values
-        normalized_array = np.array([
-            softmax(col)
-            for col in values_array.T
-        ]).T
+        normalized_array = softmax(values_array, axis=0)
         normalized_values = VGroup(
             DecimalNumber(value, font_size=font_size).move_to(square)
             for square, value in zip(right_grid, normalized_array.flatten())
@@ -373,12 +271,11 @@ class ScalingAPattern(Scene):
 
         # Dots representing attention weights
         values = np.random.normal(0, 1, (N, N))
+        pattern = softmax(values, axis=0, mask=np.triu(np.ones((N, N), dtype=bool)))
         dots = VGroup()
-        for n, row in enumerate(values):
-            row[:n] = -np.inf
-        for k, col in enumerate(values.T):
-            for n, value in enumerate(softmax(col)):
-                dot = Dot(radius=0.3 * value**0.75)
+        for k in range(N):
+            for n in range(N):
+                dot = Dot(radius=0.3 * pattern[n, k]**0.75)
                 dot.move_to(grid[n * N + k])
                 dots.add(dot)
         dots.set_fill(GREY_C, 1)
@@ -541,9 +438,7 @@ class CrossAttention(Scene):
             [0, 0, 0, 0, 0, 3],
             [0, 0, 0, 0, 3, 0],
         ]
-        attention_pattern = np.array([
-            softmax(col) for col in unnormalized_pattern
-        ]).T
+        attention_pattern = softmax(unnormalized_pattern).T
 
         # Show connections
         lines = VGroup()
@@ -1007,10 +902,8 @@ class MultiHeadedAttention(Scene):
         grid.set_height(3.0)
 
         pattern = np.random.normal(0, 1, (n_rows, n_rows))
-        for n in range(len(pattern[0])):
-            pattern[:, n][n + 1:] = -np.inf
-            pattern[:, n] = softmax(pattern[:, n])
-        pattern = pattern.T
+        causal_mask = np.triu(np.ones((n_rows, n_rows), dtype=bool))
+        pattern = softmax(pattern, axis=0, mask=causal_mask).T
 
         dots = VGroup()
         for col, values in zip(grid, pattern):
@@ -6,18 +6,11 @@ before softmax, producing zeros in the attention pattern.
 
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def softmax(logits, temperature=1.0):
-    """Compute softmax of logits array."""
-    logits = np.array(logits)
-    logits = logits - np.max(logits)  # For numerical stability
-    exps = np.exp(logits / temperature)
-    if np.isinf(exps).any() or np.isnan(exps).any():
-        result = np.zeros_like(logits)
-        result[np.argmax(logits)] = 1
-        return result
-    return exps / np.sum(exps)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import softmax
 
 
 class AttentionSoftmaxMasking(InteractiveScene):
@@ -90,10 +83,7 @@ class AttentionSoftmaxMasking(InteractiveScene):
         self.wait()
 
         # Compute and show normalized values
-        normalized_array = np.array([
-            softmax(col)
-            for col in values_array.T
-        ]).T
+        normalized_array = softmax(values_array, axis=0)
 
         normalized_values = VGroup(
             DecimalNumber(value, font_size=font_size).move_to(square)
@@ -5,13 +5,11 @@ Run with: manimgl basic_multihead.py MultiHeadBasic -w -l
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def softmax(logits):
-    logits = np.array(logits)
-    logits = logits - np.max(logits)
-    exps = np.exp(logits)
-    return exps / np.sum(exps)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import softmax
 
 
 class AttentionGrid(VGroup):
@@ -33,11 +31,7 @@ class AttentionGrid(VGroup):
 
         # Causal pattern
         pattern = np.random.randn(n, n)
-        for col in range(n):
-            pattern[:, col][col + 1:] = -np.inf
-            valid = pattern[:, col][:col + 1]
-            pattern[:, col][:col + 1] = softmax(valid)
-            pattern[:, col][col + 1:] = 0
+        pattern = softmax(pattern, axis=0, mask=np.triu(np.ones((n, n), dtype=bool)))
 
         dots = VGroup()
         for i in range(n):
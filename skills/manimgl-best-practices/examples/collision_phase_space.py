@@ -5,58 +5,14 @@ Based on the famous 3b1b pi-computing collision video.
 """
 from manimlib import *
 import math
+import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import StateTracker
 
-LITTLE_BLOCK_COLOR = "#51463E"
-
-
-class StateTracker(ValueTracker):
-    """
-    Tracks the state of the block collision process.
-    """
-
-    def __init__(self, blocks, initial_positions=[8, 5], initial_velocities=[-1, 0]):
-        sqrt_m1, sqrt_m2 = self.sqrt_mass_vect = np.sqrt([b.mass for b in blocks])
-        self.theta = math.atan2(sqrt_m2, sqrt_m1)
-
-        self.state0 = np.array([
-            *np.array(initial_positions) * self.sqrt_mass_vect,
-            *np.array(initial_velocities) * self.sqrt_mass_vect,
-        ])
-
-        super().__init__(self.state0.copy())
 
-    def set_time(self, t):
-        pos0 = self.state0[0:2]
-        vel0 = self.state0[2:4]
-        self.set_value([*(pos0 + t * vel0), *vel0])
-
-    def rotate_2d(self, vect, angle):
-        c, s = math.cos(angle), math.sin(angle)
-        return np.array([c * vect[0] - s * vect[1], s * vect[0] + c * vect[1]])
-
-    def reflect_vect(self, vect):
-        n_reflections = self.get_n_collisions()
-        rot_angle = -2 * self.theta * ((n_reflections + 1) // 2)
-        result = self.rotate_2d(vect, rot_angle)
-        result[1] *= (-1)**(n_reflections % 2)
-        return result
-
-    def get_block_positions(self):
-        scaled_pos = self.get_value()[0:2]
-        rot_scaled_pos = self.reflect_vect(scaled_pos)
-        return rot_scaled_pos / self.sqrt_mass_vect
-
-    def get_scaled_block_velocities(self):
-        return self.reflect_vect(self.get_value()[2:4])
-
-    def get_block_velocities(self):
-        return self.get_scaled_block_velocities() / self.sqrt_mass_vect
-
-    def get_n_collisions(self):
-        state = self.get_value()
-        angle = math.atan2(state[1], state[0])
-        return int(angle / self.theta)
+LITTLE_BLOCK_COLOR = "#51463E"
 
 
 class CollisionPhaseSpace(Scene):
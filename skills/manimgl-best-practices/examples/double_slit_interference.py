@@ -10,6 +10,11 @@ Run: manimgl double_slit_interference.py DoubleSlitExperiment -w
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import WaveRingPool
 
 
 class DoubleSlitExperiment(Scene):
@@ -73,60 +78,45 @@ class DoubleSlitExperiment(Scene):
                     waves.add(line)
             return waves
 
-        # Create outgoing waves from slits
-        def get_outgoing_waves(time):
-            rings = VGroup()
-            colors = [RED_B, BLUE_B]
-            positions = [slit1_pos, slit2_pos]
-
-            for pos, color in zip(positions, colors):
-                for phase_offset in np.arange(0, 12, 0.5 / wave_number):
-                    radius = (time * frequency / wave_number + phase_offset)
-                    if 0.1 < radius < 8:
-                        # Only show upper semicircle
-                        arc = Arc(
-                            start_angle=0,
-                            angle=PI,
-                            radius=radius
-                        )
-                        arc.move_arc_center_to(pos)
-                        amplitude = np.exp(-0.15 * radius)
-                        arc.set_stroke(color, width=1.5 + 2 * amplitude, opacity=0.6 * amplitude)
-                        rings.add(arc)
-            return rings
-
-        # Create intensity pattern on screen
-        def get_intensity_pattern(time):
-            dots = VGroup()
-            screen_y = 4
-            for x in np.linspace(-3, 3, 120):
-                point = np.array([x, screen_y, 0])
-
-                # Calculate path difference
-                r1 = np.linalg.norm(point - slit1_pos)
-                r2 = np.linalg.norm(point - slit2_pos)
-
-                # Interference
-                phase1 = TAU * (wave_number * r1 - frequency * time)
-                phase2 = TAU * (wave_number * r2 - frequency * time)
-
-                amp1 = np.cos(phase1) / np.sqrt(1 + 0.1 * r1)
-                amp2 = np.cos(phase2) / np.sqrt(1 + 0.1 * r2)
-
-                total_intensity = ((amp1 + amp2) / 2) ** 2
-
-                # Create dot
-                dot = Dot([x, screen_y - 0.1 + 0.2 * total_intensity, 0], radius=0.03)
-                brightness = 0.2 + 0.8 * total_intensity
-                dot.set_fill(interpolate_color(BLACK, WHITE, brightness), opacity=1)
-                dots.add(dot)
-
-            return dots
+        # Outgoing waves from slits: one recycled pool of upper semicircles
+        outgoing = WaveRingPool(
+            [slit1_pos, slit2_pos],
+            spacing=0.5 / wave_number,
+            speed=frequency / wave_number,
+            max_radius=8,
+            colors=[RED_B, BLUE_B],
+        )
+
+        # Intensity pattern on screen, sampled at fixed points
+        screen_y = 4
+        screen_points = np.zeros((120, 3))
+        screen_points[:, 0] = np.linspace(-3, 3, 120)
+        screen_points[:, 1] = screen_y
+        # Path lengths from each slit, shape (120, 2)
+        path_lengths = np.linalg.norm(
+            screen_points[:, np.newaxis, :] - np.array([slit1_pos, slit2_pos]),
+            axis=2
+        )
+
+        def get_intensities(time):
+            phases = TAU * (wave_number * path_lengths - frequency * time)
+            amplitudes = np.cos(phases) / np.sqrt(1 + 0.1 * path_lengths)
+            return (amplitudes.sum(axis=1) / 2) ** 2
+
+        def update_intensity_pattern(dots):
+            total_intensity = get_intensities(time_tracker.get_value())
+            points = screen_points.copy()
+            points[:, 1] += -0.1 + 0.2 * total_intensity
+            dots.set_points(points)
+            dots.data["rgba"][:, :3] = (0.2 + 0.8 * total_intensity)[:, np.newaxis]
+            dots.data["rgba"][:, 3] = 1
+            dots.note_changed_data()
 
         time_tracker = ValueTracker(0)
         incoming = always_redraw(lambda: get_incoming_wave(time_tracker.get_value()))
-        outgoing = always_redraw(lambda: get_outgoing_waves(time_tracker.get_value()))
-        intensity = always_redraw(lambda: get_intensity_pattern(time_tracker.get_value()))
+        outgoing.add_updater(lambda m: m.set_time(time_tracker.get_value()))
+        intensity = DotCloud(screen_points, radius=0.03)
+        intensity.add_updater(update_intensity_pattern)
 
         # Title
         title = Text("Double Slit Interference", font_size=48)
@@ -276,26 +266,20 @@ class DiffractionGratingSimple(Scene):
             for pos in slit_positions
         )
 
-        # Create outgoing waves from all slits
-        def get_grating_waves(time):
-            rings = VGroup()
-            for pos in slit_positions:
-                for phase_offset in np.arange(0, 8, 0.4 / wave_number):
-                    radius = (time * frequency / wave_number + phase_offset)
-                    if 0.1 < radius < 6:
-                        arc = Arc(
-                            start_angle=0,
-                            angle=PI,
-                            radius=radius
-                        )
-                        arc.move_arc_center_to(pos)
-                        amplitude = np.exp(-0.2 * radius)
-                        arc.set_stroke(BLUE, width=1 + amplitude, opacity=0.3 * amplitude)
-                        rings.add(arc)
-            return rings
-
+        # Outgoing waves from all slits, recycled from one pool
+        waves = WaveRingPool(
+            slit_positions,
+            spacing=0.4 / wave_number,
+            speed=frequency / wave_number,
+            max_radius=6,
+            colors=BLUE,
+            decay=0.2,
+            stroke_width=1,
+            width_amplitude=1,
+            max_opacity=0.3,
+        )
         time_tracker = ValueTracker(0)
-        waves = always_redraw(lambda: get_grating_waves(time_tracker.get_value()))
+        waves.add_updater(lambda m: m.set_time(time_tracker.get_value()))
 
         # Title
         title = Text("Diffraction Grating", font_size=48)
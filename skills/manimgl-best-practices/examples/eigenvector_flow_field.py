@@ -12,6 +12,11 @@ This demonstrates:
 """
 
 from manimlib import *
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import FieldArrows
 
 
 class EigenvectorFlowField(Scene):
@@ -36,40 +41,25 @@ class EigenvectorFlowField(Scene):
 
         # Define the derivative function for the linear system
         def deriv_func(x, y):
-            """Returns the derivative at a point: f(v) = Av"""
-            v = np.array([x, y])
-            result = 0.5 * np.dot(mat, v)
-            return result[0], result[1]
-
-        # Create vector field manually using arrows
-        vector_field = VGroup()
-        for x in np.linspace(-3.5, 3.5, 12):
-            for y in np.linspace(-3.5, 3.5, 12):
-                if abs(x) < 0.4 and abs(y) < 0.4:
-                    continue  # Skip origin area
-                dx, dy = deriv_func(x, y)
-                start = plane.c2p(x, y)
-                direction = np.array([dx, dy, 0])
-                norm = np.linalg.norm(direction)
-                if norm > 0.1:
-                    # Normalize and scale for visibility
-                    direction = direction / norm * min(0.5, norm * 0.3)
-                    end = start + direction
-                    arrow = Arrow(
-                        start, end, buff=0,
-                        stroke_width=2,
-                        max_tip_length_to_length_ratio=0.3
-                    )
-                    # Color based on magnitude
-                    alpha = min(1, norm / 3)
-                    arrow.set_color(interpolate_color(BLUE, RED, alpha))
-                    vector_field.add(arrow)
+            """Returns the derivative at points (x, y): f(v) = Av"""
+            return 0.5 * (mat[0, 0] * x + mat[0, 1] * y), 0.5 * (mat[1, 0] * x + mat[1, 1] * y)
+
+        # Vector field as one mobject; short vectors are hidden, the others
+        # scaled for visibility and colored by magnitude
+        vector_field = FieldArrows(
+            deriv_func,
+            plane,
+            x_samples=np.linspace(-3.5, 3.5, 12),
+            y_samples=np.linspace(-3.5, 3.5, 12),
+            length_func=lambda norms: np.where(norms > 0.1, np.minimum(0.5, norms * 0.3), 0),
+            mask_func=lambda x, y: (np.abs(x) >= 0.4) | (np.abs(y) >= 0.4),  # Skip origin area
+            low_color=BLUE,
+            high_color=RED,
+            magnitude_range=(0, 3),
+        )
 
         # Show vector field
-        self.play(
-            LaggedStartMap(GrowArrow, vector_field, lag_ratio=0.01),
-            run_time=2
-        )
+        self.play(ShowCreation(vector_field), run_time=2)
         self.wait(2)
 
         # Calculate eigenvectors
@@ -187,3 +177,50 @@ class LinearSystemPhasePortrait(Scene):
                 arrows.add(arrow)
 
         return VGroup(plane, arrows)
+
+
+class MorphingFlowField(Scene):
+    """
+    A 50x50 field of dx/dt = Ax while A morphs from a rotation into a
+    saddle. The arrows are recomputed in place every frame.
+    """
+
+    def construct(self):
+        plane = NumberPlane((-4, 4), (-4, 4), faded_line_ratio=1)
+        plane.set_height(FRAME_HEIGHT)
+        plane.background_lines.set_stroke(BLUE, 1, 0.5)
+        plane.faded_lines.set_stroke(BLUE, 0.5, 0.25)
+        self.add(plane)
+
+        rotation = np.array([[0, -1], [1, 0]])
+        saddle = np.array([[1, 0], [0, -1]])
+        alpha = ValueTracker(0)
+
+        def deriv_func(x, y):
+            mat = interpolate(rotation, saddle, alpha.get_value())
+            return mat[0, 0] * x + mat[0, 1] * y, mat[1, 0] * x + mat[1, 1] * y
+
+        samples = np.linspace(-3.9, 3.9, 50)
+        field = FieldArrows(
+            deriv_func,
+            plane,
+            x_samples=samples,
+            y_samples=samples,
+            length_func=lambda norms: 0.12 * np.tanh(norms),
+            tip_length=0.04,
+            stroke_width=1.5,
+            low_color=BLUE,
+            high_color=YELLOW,
+            magnitude_range=(0, 5),
+        )
+        field.add_updater(lambda m: m.update_vectors())
+        self.add(field)
+
+        label = Tex(R"\frac{d\vec{v}}{dt} = A\vec{v}", font_size=36)
+        label.to_corner(UL)
+        label.set_backstroke(BLACK, 5)
+        self.add(label)
+
+        self.play(alpha.animate.set_value(1), run_time=6)
+        self.wait()
+        self.play(alpha.animate.set_value(0), run_time=6)
@@ -0,0 +1,22 @@
+"""
+Shared helpers for the ManimGL example scenes.
+
+The examples are standalone scripts; they import these helpers with
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from helpers import softmax, value_to_color
+"""
+from .numeric import (
+    softmax, value_to_color, values_to_colors, values_to_rgbas
+)
+from .collisions import BlockCollisionEngine, StateTracker
+from .fields import (
+    FieldArrows, RadialWaveField, ScalarFieldImage, WaveRingPool, grid_points,
+    radial_wave_amplitudes
+)
+from .glyphs import GlyphAtlas, LiveDecimalMatrix, LiveDecimalNumber, get_glyph_atlas
+from .matrix import RandomizeMatrixEntries, WeightMatrix
+from .particles import ParticleSystem
+from .random_process import RandomSchedule, Randomize, choice_sampler, uniform_sampler
+from .springs import OscillatorBank, chain_stiffness
+from .trails import RingTracedPath, TrackingDots
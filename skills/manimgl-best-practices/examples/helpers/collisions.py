@@ -0,0 +1,145 @@
+"""
+Closed-form engine for the block collision (pi-counting) examples.
+
+In coordinates scaled by the square roots of the masses, the two blocks
+move as one point inside a wedge of angle theta = atan(sqrt(m2 / m1)),
+reflecting off its sides. Unfolding those reflections turns the motion
+into a straight line, so every collision time is where that line crosses
+a ray at a multiple of theta. All of them are computed up front; the state
+at any time comes from a binary search over that schedule and a linear
+step from the last collision, with no per-frame trigonometry.
+"""
+from manimlib import *
+import math
+import numpy as np
+
+
+class BlockCollisionEngine:
+    """Collision schedule of a block sliding into a smaller one against a wall.
+
+    Positions are those of the big block's left edge and the small block's
+    right edge, measured from where the small block touches the wall, so
+    the blocks collide when they are equal and the small one hits the wall
+    at 0.
+    """
+
+    def __init__(self, masses, initial_positions=(8, 5), initial_velocities=(-1, 0)):
+        self.masses = np.array(masses, dtype=float)
+        self.sqrt_masses = np.sqrt(self.masses)
+        self.theta = math.atan2(self.sqrt_masses[1], self.sqrt_masses[0])
+
+        pos0 = np.array(initial_positions, dtype=float) * self.sqrt_masses
+        vel0 = np.array(initial_velocities, dtype=float) * self.sqrt_masses
+        boundaries = self.get_boundary_indices(pos0, vel0)
+
+        # Unfolded, the state crosses the ray at angle k * theta for each
+        # boundary index k; even rays are images of the wall, odd ones of
+        # the block-to-block contact line
+        angles = boundaries * self.theta
+        cos, sin = np.cos(angles), np.sin(angles)
+        self.collision_times = -(cos * pos0[1] - sin * pos0[0]) / (cos * vel0[1] - sin * vel0[0])
+        self.collision_is_wall = boundaries % 2 == 0
+
+        # Scaled state at the start of each stretch between collisions
+        start_sector = math.floor(math.atan2(pos0[1], pos0[0]) / self.theta)
+        step = 1 if len(boundaries) == 0 or boundaries[0] > start_sector else -1
+        sectors = start_sector + step * np.arange(len(boundaries) + 1)
+        self.segment_start_times = np.concatenate([[0.0], self.collision_times])
+        unfolded_positions = pos0 + self.segment_start_times[:, np.newaxis] * vel0
+        self.segment_positions = self.fold(unfolded_positions, sectors)
+        self.segment_velocities = self.fold(np.tile(vel0, (len(sectors), 1)), sectors)
+
+    def get_boundary_indices(self, pos0, vel0):
+        """Indices k of the rays at k * theta the unfolded path crosses, in order."""
+        turn = pos0[0] * vel0[1] - pos0[1] * vel0[0]
+        if turn == 0:
+            return np.zeros(0, dtype=int)
+        start_angle = math.atan2(pos0[1], pos0[0])
+        end_angle = math.atan2(vel0[1], vel0[0])
+        start_sector = math.floor(start_angle / self.theta)
+        if turn > 0:
+            if end_angle < start_angle:
+                end_angle += TAU
+            return np.arange(start_sector + 1, math.ceil(end_angle / self.theta))
+        if end_angle > start_angle:
+            end_angle -= TAU
+        return np.arange(start_sector, math.floor(end_angle / self.theta), -1)
+
+    def fold(self, vects, sectors):
+        """Map unfolded 2d vectors lying in the given sectors back into the wedge."""
+        angles = -self.theta * (sectors + sectors % 2)
+        cos, sin = np.cos(angles), np.sin(angles)
+        x, y = vects[:, 0], vects[:, 1]
+        signs = np.where(sectors % 2 == 0, 1, -1)
+        return np.stack([cos * x - sin * y, signs * (sin * x + cos * y)], axis=1)
+
+    def get_n_collisions(self, t):
+        """Number of collisions at or before time t (works on arrays of times)."""
+        return np.searchsorted(self.collision_times, t, side="right")
+
+    def get_collision_times(self, t0=-np.inf, t1=np.inf):
+        """Times of the collisions in (t0, t1], e.g. to trigger sounds or flashes."""
+        start, end = np.searchsorted(self.collision_times, [t0, t1], side="right")
+        return self.collision_times[start:end]
+
+    def get_scaled_state(self, t, n_collisions=None):
+        """Scaled positions and velocities, [x1 * sqrt(m1), x2 * sqrt(m2)] and likewise."""
+        n = self.get_n_collisions(t) if n_collisions is None else n_collisions
+        vel = self.segment_velocities[n]
+        pos = self.segment_positions[n] + (t - self.segment_start_times[n]) * vel
+        return pos, vel
+
+    def get_block_positions(self, t):
+        return self.get_scaled_state(t)[0] / self.sqrt_masses
+
+    def get_block_velocities(self, t):
+        return self.get_scaled_state(t)[1] / self.sqrt_masses
+
+
+class StateTracker(ValueTracker):
+    """
+    Tracks the state of the block collision process as a 4d vector
+    [
+        x1 * sqrt(m1),
+        x2 * sqrt(m2),
+        v1 * sqrt(m1),
+        v2 * sqrt(m2),
+    ]
+    read off a BlockCollisionEngine for the current time.
+    """
+
+    def __init__(self, blocks, initial_positions=[8, 5], initial_velocities=[-1, 0]):
+        self.engine = BlockCollisionEngine(
+            [b.mass for b in blocks], initial_positions, initial_velocities
+        )
+        self.sqrt_mass_vect = self.engine.sqrt_masses
+        self.theta = self.engine.theta
+        self.time = 0
+        self.n_collisions = 0
+        pos, vel = self.engine.get_scaled_state(0)
+        super().__init__(np.array([*pos, *vel]))
+
+    def set_time(self, t):
+        self.time = t
+        self.n_collisions = int(self.engine.get_n_collisions(t))
+        pos, vel = self.engine.get_scaled_state(t, self.n_collisions)
+        self.set_value([*pos, *vel])
+
+    def get_block_positions(self):
+        return self.get_value()[0:2] / self.sqrt_mass_vect
+
+    def get_scaled_block_velocities(self):
+        return self.get_value()[2:4]
+
+    def get_block_velocities(self):
+        return self.get_scaled_block_velocities() / self.sqrt_mass_vect
+
+    def get_kinetic_energy(self):
+        v1, v2 = self.get_scaled_block_velocities()
+        return v1**2 + v2**2
+
+    def get_momentum(self):
+        return np.dot(self.engine.masses, self.get_block_velocities())
+
+    def get_n_collisions(self):
+        return self.n_collisions
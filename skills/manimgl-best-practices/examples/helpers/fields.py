@@ -0,0 +1,353 @@
+"""
+Wave fields that update in place.
+
+Field mobjects precompute everything that does not depend on time (grid
+points, distances to the sources) once, then evaluate the field for all
+points in one NumPy expression per frame and rewrite their colors.
+Scalar fields that fill a region are drawn as a single textured quad
+whose pixel buffer is rewritten instead of one square per sample.
+Expanding wavefronts come from a fixed pool of arcs that is recycled
+rather than rebuilt.
+Vector fields are drawn as arrows packed into one stroke buffer.
+"""
+from manimlib import *
+import numpy as np
+
+
+def grid_points(x_range, y_range):
+    """(n, 3) points of an x_range[2] by y_range[2] grid, x-major like nested loops over x then y."""
+    xs = np.linspace(*x_range)
+    ys = np.linspace(*y_range)
+    points = np.zeros((len(xs) * len(ys), 3))
+    points[:, 0] = np.repeat(xs, len(ys))
+    points[:, 1] = np.tile(ys, len(xs))
+    return points
+
+
+def radial_wave_amplitudes(distances, time, wave_number, frequency, decay):
+    """Mean amplitude of radial waves at points given their (n, n_sources) distances."""
+    phases = TAU * (wave_number * distances - frequency * time)
+    return (np.cos(phases) / (1 + decay * distances)).mean(axis=1)
+
+
+class RadialWaveField(DotCloud):
+    """Grid of dots showing the interference of radial waves from point sources.
+
+    Positive amplitudes fade from black to `positive_color`, negative ones
+    to `negative_color`. Call `set_time` (e.g. from an updater) to advance
+    the waves; the cloud keeps its points and only its colors change.
+    """
+
+    def __init__(
+        self,
+        sources,
+        x_range=(-7, 7, 70),
+        y_range=(-4, 4, 40),
+        wave_number=1.5,
+        frequency=0.5,
+        decay=0.3,
+        positive_color=BLUE,
+        negative_color=RED,
+        radius=0.05,
+        **kwargs
+    ):
+        self.wave_number = wave_number
+        self.frequency = frequency
+        self.decay = decay
+        self.positive_rgb = color_to_rgb(positive_color)
+        self.negative_rgb = color_to_rgb(negative_color)
+
+        points = grid_points(x_range, y_range)
+        super().__init__(points, radius=radius, **kwargs)
+
+        sources = np.array(sources, dtype=float).reshape((-1, 3))
+        self.distances = np.linalg.norm(points[:, np.newaxis, :] - sources[np.newaxis, :, :], axis=2)
+        self.time = 0.0
+        self.set_time(0)
+
+    def get_amplitudes(self, time):
+        return radial_wave_amplitudes(
+            self.distances, time, self.wave_number, self.frequency, self.decay
+        )
+
+    def set_time(self, time):
+        self.time = time
+        amplitudes = self.get_amplitudes(time)
+        strength = np.abs(amplitudes)[:, np.newaxis]
+        rgbs = np.where(amplitudes[:, np.newaxis] > 0, self.positive_rgb, self.negative_rgb)
+        rgba = self.data["rgba"]
+        rgba[:, :3] = rgbs * np.clip(strength, 0, 1)
+        rgba[:, 3] = 0.3 + 0.7 * strength[:, 0]
+        self.note_changed_data()
+        return self
+
+
+class WaveRingPool(VGroup):
+    """Expanding wavefront arcs around point sources, drawn from a fixed pool.
+
+    Each source gets one arc per `spacing` out to `max_radius`, created
+    once. `set_time` moves all rings outward at `speed`, wraps the ones
+    that pass `max_radius` back to the source, and only rewrites the arcs'
+    points, stroke widths and opacities. A ring of radius r has amplitude
+    exp(-decay * r), stroke width `stroke_width + width_amplitude * amplitude`
+    and opacity `max_opacity * amplitude`.
+    """
+
+    def __init__(
+        self,
+        sources,
+        spacing,
+        speed,
+        max_radius=8.0,
+        min_radius=0.1,
+        colors=BLUE,
+        start_angle=0,
+        angle=PI,
+        decay=0.15,
+        stroke_width=1.5,
+        width_amplitude=2.0,
+        max_opacity=0.6,
+        **kwargs
+    ):
+        self.speed = speed
+        self.max_radius = max_radius
+        self.min_radius = min_radius
+        self.decay = decay
+        self.stroke_width = stroke_width
+        self.width_amplitude = width_amplitude
+        self.max_opacity = max_opacity
+
+        sources = np.array(sources, dtype=float).reshape((-1, 3))
+        colors = listify(colors)
+        offsets = np.arange(0, max_radius, spacing)
+        self.period = len(offsets) * spacing
+        self.ring_sources = np.repeat(sources, len(offsets), axis=0)
+        self.ring_offsets = np.tile(offsets, len(sources))
+
+        unit_arc = Arc(start_angle=start_angle, angle=angle, radius=1)
+        self.unit_points = unit_arc.get_points().copy()
+        rings = []
+        for i in range(len(sources)):
+            for _ in offsets:
+                ring = unit_arc.copy()
+                ring.set_stroke(colors[i % len(colors)], width=stroke_width, opacity=0)
+                rings.append(ring)
+        super().__init__(*rings, **kwargs)
+        self.time = 0.0
+        self.set_time(0)
+
+    def get_radii(self, time):
+        return (self.speed * time + self.ring_offsets) % self.period
+
+    def set_time(self, time):
+        self.time = time
+        radii = self.get_radii(time)
+        amplitudes = np.exp(-self.decay * radii)
+        visible = (radii > self.min_radius) & (radii < self.max_radius)
+        widths = self.stroke_width + self.width_amplitude * amplitudes
+        opacities = np.where(visible, self.max_opacity * amplitudes, 0)
+        points = self.ring_sources[:, np.newaxis, :] + radii[:, np.newaxis, np.newaxis] * self.unit_points
+
+        # Scaling and shifting an arc leaves its joint angles and normal
+        # alone, so the data arrays are written directly
+        for ring, ring_points, width, opacity in zip(self.submobjects, points, widths, opacities):
+            ring.data["point"][:] = ring_points
+            ring.data["stroke_width"][:, 0] = width
+            ring.data["stroke_rgba"][:, 3] = opacity
+            ring.refresh_bounding_box(recurse_up=False)
+            ring.note_changed_data(recurse_up=False)
+        self.refresh_bounding_box()
+        self.note_changed_data()
+        return self
+
+
+class ScalarFieldImage(ImageMobject):
+    """Scalar field drawn as one textured quad.
+
+    `func(x, y)` receives arrays of coordinates relative to the center of
+    the image (x along a row, y down a column) and returns values in
+    [0, 1], shown from `low_color` to `high_color`. The field is sampled on
+    a grid `resolution` cells wide and blown up into a fixed RGBA buffer of
+    `buffer_size` pixels across, so changing the resolution or the function
+    rewrites that buffer and its GPU texture in place.
+    """
+
+    def __init__(
+        self,
+        func,
+        width=6.0,
+        height=6.0,
+        resolution=100,
+        buffer_size=600,
+        low_color=BLACK,
+        high_color=WHITE,
+        **kwargs
+    ):
+        self.func = func
+        self.field_width = width
+        self.field_height = height
+        self.resolution = resolution
+        self.low_rgba = np.array([*color_to_rgb(low_color), 1.0])
+        self.high_rgba = np.array([*color_to_rgb(high_color), 1.0])
+        buffer_height = max(1, round(buffer_size * height / width))
+        self.pixels = np.zeros((buffer_height, buffer_size, 4), dtype=np.uint8)
+        # ImageMobject.__init__ would load the texture from a file
+        Mobject.__init__(self, **kwargs)
+        self.update_field()
+
+    def init_points(self):
+        self.set_width(self.field_width, stretch=True)
+        self.set_height(self.field_height, stretch=True)
+
+    def init_shader_wrapper(self, ctx):
+        super().init_shader_wrapper(ctx)
+        height, width = self.pixels.shape[:2]
+        texture = ctx.texture(size=(width, height), components=4, data=self.pixels.tobytes())
+        self.shader_wrapper.add_texture("Texture", texture)
+        # Each image has its own texture, so it must not be batched with others
+        self.shader_wrapper.texture_paths = {"Texture": f"{type(self).__name__}-{id(self)}"}
+        self.shader_wrapper.refresh_id()
+
+    def get_field_values(self):
+        """(rows, columns) samples of the field at the current resolution."""
+        columns = self.resolution
+        rows = max(1, round(columns * self.field_height / self.field_width))
+        xs = ((np.arange(columns) + 0.5) / columns - 0.5) * self.field_width
+        ys = (0.5 - (np.arange(rows) + 0.5) / rows) * self.field_height
+        values = self.func(xs[np.newaxis, :], ys[:, np.newaxis])
+        return np.broadcast_to(values, (rows, columns))
+
+    def update_field(self):
+        values = np.clip(self.get_field_values(), 0, 1)[..., np.newaxis]
+        rgbas = self.low_rgba + values * (self.high_rgba - self.low_rgba)
+        cells = np.round(255 * rgbas).astype(np.uint8)
+
+        # Nearest-neighbor upsampling into the fixed pixel buffer
+        buffer_height, buffer_width = self.pixels.shape[:2]
+        row_indices = np.arange(buffer_height) * cells.shape[0] // buffer_height
+        col_indices = np.arange(buffer_width) * cells.shape[1] // buffer_width
+        self.pixels[:] = cells[row_indices[:, np.newaxis], col_indices[np.newaxis, :]]
+        return self.write_texture()
+
+    def write_texture(self):
+        if self.shader_wrapper is not None:
+            self.shader_wrapper.textures[0].write(self.pixels.tobytes())
+        return self
+
+    def copy(self, deep=False):
+        result = super().copy(deep)
+        # Each copy writes into its own pixel buffer
+        result.pixels = self.pixels.copy()
+        return result
+
+    def become(self, mobject, match_updaters=False):
+        super().become(mobject, match_updaters)
+        if isinstance(mobject, ScalarFieldImage) and mobject.pixels.shape == self.pixels.shape:
+            self.func = mobject.func
+            self.resolution = mobject.resolution
+            self.pixels[:] = mobject.pixels
+            self.write_texture()
+        return self
+
+    def set_resolution(self, resolution):
+        if resolution != self.resolution:
+            self.resolution = resolution
+            self.update_field()
+        return self
+
+    def set_func(self, func):
+        self.func = func
+        return self.update_field()
+
+    def point_to_rgb(self, point):
+        x0, y0 = self.get_corner(UL)[:2]
+        x1, y1 = self.get_corner(DR)[:2]
+        buffer_height, buffer_width = self.pixels.shape[:2]
+        col = int(np.clip(inverse_interpolate(x0, x1, point[0]), 0, 1) * (buffer_width - 1))
+        row = int(np.clip(inverse_interpolate(y0, y1, point[1]), 0, 1) * (buffer_height - 1))
+        return self.pixels[row, col, :3] / 255
+
+
+class FieldArrows(VectorField):
+    """VectorField of a 2d field given as `func(X, Y)`, sampled on a grid.
+
+    `func` takes arrays of coordinates and returns the arrays (U, V) of
+    vector components, and the samples are the grid of `x_samples` by
+    `y_samples` in the coordinates of `coordinate_system` (scene
+    coordinates when it is None). Drawing is VectorField's, all arrows in
+    one stroke buffer redrawn in place by `update_vectors`; what differs is
+    that `length_func` maps field magnitudes to drawn lengths in scene
+    units, `mask_func(X, Y)` hides the samples where it is False, and the
+    color runs from `low_color` to `high_color` over `magnitude_range`.
+    """
+
+    def __init__(
+        self,
+        func,
+        coordinate_system=None,
+        x_samples=np.arange(-4, 4.5, 0.5),
+        y_samples=np.arange(-3, 3.5, 0.5),
+        length_func=None,
+        mask_func=None,
+        low_color=BLUE,
+        high_color=YELLOW,
+        magnitude_range=(0, 1),
+        stroke_width=2,
+        stroke_opacity=1.0,
+        tip_width_ratio=4,
+        tip_length=0.1,
+        **kwargs
+    ):
+        X, Y = np.meshgrid(x_samples, y_samples, indexing="ij")
+        self.grid_coords = np.stack([X.ravel(), Y.ravel()], axis=1)
+        if mask_func is None:
+            self.mask = np.ones(X.size, dtype=bool)
+        else:
+            self.mask = np.broadcast_to(mask_func(X, Y), X.shape).ravel()
+        self.xy_func = func
+        self.length_func = length_func or (lambda norms: norms)
+        self.low_rgb = color_to_rgb(low_color)
+        self.high_rgb = color_to_rgb(high_color)
+        self.norms = np.zeros(X.size)
+
+        super().__init__(
+            self.get_outputs,
+            Axes() if coordinate_system is None else coordinate_system,
+            density=1,
+            magnitude_range=magnitude_range,
+            color=low_color,
+            stroke_width=stroke_width,
+            stroke_opacity=stroke_opacity,
+            tip_width_ratio=tip_width_ratio,
+            tip_len_to_width=tip_length / (tip_width_ratio * stroke_width),
+            max_vect_len=np.inf,
+            **kwargs
+        )
+
+    def update_sample_points(self):
+        self.sample_coords = self.grid_coords
+        super().update_sample_points()
+
+    def get_outputs(self, coords):
+        """Field vectors at `coords`, rescaled so they are drawn `length_func` long."""
+        U, V = (np.broadcast_to(c, len(coords)) for c in self.xy_func(coords[:, 0], coords[:, 1]))
+        self.norms = np.sqrt(U**2 + V**2)
+        cs = self.coordinate_system
+        scene_norms = np.linalg.norm(cs.c2p(U, V) - cs.get_origin(), axis=1)
+        lengths = np.where(self.mask, self.length_func(self.norms), 0)
+        scales = np.zeros_like(scene_norms)
+        np.true_divide(lengths, scene_norms, out=scales, where=(scene_norms > 0))
+        return np.stack([U, V], axis=1) * scales[:, np.newaxis]
+
+    def set_func(self, func):
+        self.xy_func = func
+        return self.update_vectors()
+
+    def update_vectors(self):
+        super().update_vectors()
+        low, high = self.magnitude_range
+        alphas = np.clip((self.norms - low) / (high - low), 0, 1)[:, np.newaxis]
+        rgbs = self.low_rgb + alphas * (self.high_rgb - self.low_rgb)
+        self.data["stroke_rgba"][:, :3] = np.repeat(rgbs, 8, axis=0)[:-1]
+        self.note_changed_data()
+        return self
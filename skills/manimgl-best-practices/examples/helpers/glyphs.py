@@ -0,0 +1,102 @@
+"""
+Glyph atlas for numbers that change every frame.
+
+`DecimalNumber.set_value` copies, rescales and re-arranges one cached Text
+per character on every call. Here the glyphs of the characters numbers are
+made of are loaded once per font size, each formatted string is laid out
+once (LRU), and `LiveDecimalNumber` copies the point arrays of that layout
+into the glyphs it already has.
+"""
+from functools import lru_cache
+
+from manimlib import *
+
+# Characters a real number is formatted with ("–" is ManimGL's minus sign)
+NUMBER_CHARS = frozenset("0123456789+–.,")
+
+# Font size Text glyphs are rendered at before scaling
+GLYPH_FONT_SIZE = 48
+
+
+@lru_cache(maxsize=None)
+def _unit_glyph(char, text_config):
+    return Text(char, font_size=GLYPH_FONT_SIZE, **dict(text_config))
+
+
+class GlyphAtlas:
+    """Number glyphs at one font size, with an LRU of laid-out strings."""
+
+    def __init__(self, font_size, text_config=(), cache_size=1024):
+        self.font_size = font_size
+        self.glyphs = {
+            char: _unit_glyph(char, text_config).copy().scale(font_size / GLYPH_FONT_SIZE)
+            for char in NUMBER_CHARS
+        }
+        self.layout = lru_cache(maxsize=cache_size)(self._layout)
+
+    def _layout(self, num_string, digit_buff):
+        """Glyphs of `num_string` arranged the way DecimalNumber arranges them."""
+        glyphs = VGroup(*(self.glyphs[char].copy() for char in num_string))
+        glyphs.arrange(RIGHT, buff=digit_buff, aligned_edge=DOWN)
+        for i, char in enumerate(num_string):
+            if char == "–" and len(num_string) > i + 1:
+                glyphs[i].align_to(glyphs[i + 1], UP)
+                glyphs[i].shift(glyphs[i + 1].get_height() * DOWN / 2)
+            elif char == ",":
+                glyphs[i].shift(glyphs[i].get_height() * DOWN / 2)
+        return glyphs
+
+
+@lru_cache(maxsize=32)
+def get_glyph_atlas(font_size, text_config=()):
+    """Shared atlas for a font size; `text_config` is a tuple of (name, value) pairs."""
+    return GlyphAtlas(font_size, text_config)
+
+
+def copy_glyph(glyph, template):
+    """Give `glyph` the points of `template`, reusing its data arrays when they line up."""
+    family = glyph.family_members_with_points()
+    template_family = template.family_members_with_points()
+    if len(family) != len(template_family):
+        glyph.become(template)
+        return
+    for submob, template_submob in zip(family, template_family):
+        submob.set_data(template_submob.data)
+
+
+class LiveDecimalNumber(DecimalNumber):
+    """DecimalNumber that assembles its digits from a shared glyph atlas.
+
+    Complex numbers, units, ellipses and background rectangles fall back
+    to DecimalNumber's own layout.
+    """
+
+    def set_submobjects_from_number(self, number):
+        num_string = self.get_num_string(number)
+        if (
+            isinstance(number, complex)
+            or self.show_ellipsis
+            or self.unit is not None
+            or self.include_background_rectangle
+            or not NUMBER_CHARS.issuperset(num_string)
+        ):
+            super().set_submobjects_from_number(number)
+            return
+
+        self.number = number
+        self.num_string = num_string
+        font_size = self.get_font_size()
+        atlas = get_glyph_atlas(round(font_size, 3), tuple(sorted(self.text_config.items())))
+        layout = atlas.layout(num_string, self.digit_buff_per_font_unit * font_size)
+        if len(self.submobjects) == len(layout):
+            for glyph, template in zip(self.submobjects, layout):
+                copy_glyph(glyph, template)
+        else:
+            self.set_submobjects([template.copy() for template in layout])
+
+
+class LiveDecimalMatrix(DecimalMatrix):
+    """DecimalMatrix whose entries are LiveDecimalNumbers."""
+
+    def element_to_mobject(self, element, **decimal_config):
+        return LiveDecimalNumber(element, **decimal_config)
@@ -0,0 +1,126 @@
+"""
+Array-backed weight matrix for the transformer examples.
+
+The values live in one NumPy array. `WeightMatrix.set_values` formats and
+colors the whole array at once and only touches the glyphs of entries whose
+text changed; those are assembled from the shared glyph atlas.
+"""
+from manimlib import *
+import numpy as np
+import random
+
+from .glyphs import LiveDecimalMatrix
+from .numeric import values_to_colors
+
+
+class WeightMatrix(LiveDecimalMatrix):
+    """Matrix of numbers colored by sign and magnitude.
+
+    `values` holds the full array, including the entries hidden behind the
+    ellipses row and column.
+    """
+
+    def __init__(
+        self,
+        values=None,
+        shape=(6, 8),
+        value_range=(-9.9, 9.9),
+        ellipses_row=-2,
+        ellipses_col=-2,
+        num_decimal_places=1,
+        bracket_h_buff=0.1,
+        decimal_config=dict(include_sign=True),
+        low_positive_color=BLUE_E,
+        high_positive_color=BLUE_B,
+        low_negative_color=RED_E,
+        high_negative_color=RED_B,
+        **kwargs
+    ):
+        if values is None:
+            values = np.random.uniform(*value_range, size=shape)
+        values = np.array(values, dtype=float)
+        if values.ndim == 1:
+            values = values.reshape((-1, 1))
+        self.shape = values.shape
+        self.value_range = value_range
+        self.ellipses_row = ellipses_row
+        self.ellipses_col = ellipses_col
+        self.color_config = dict(
+            low_positive_color=low_positive_color,
+            high_positive_color=high_positive_color,
+            low_negative_color=low_negative_color,
+            high_negative_color=high_negative_color,
+            min_value=0,
+            max_value=max(abs(value_range[0]), abs(value_range[1])),
+        )
+
+        super().__init__(
+            values,
+            num_decimal_places=num_decimal_places,
+            bracket_h_buff=bracket_h_buff,
+            decimal_config=decimal_config,
+            ellipses_row=ellipses_row,
+            ellipses_col=ellipses_col,
+            **kwargs
+        )
+
+        # Array position of each entry left after swapping in the ellipses
+        visible = set(map(id, self.elements))
+        positions = [
+            (i, j)
+            for i, row in enumerate(self.mob_matrix)
+            for j, mob in enumerate(row)
+            if id(mob) in visible
+        ]
+        self.entry_rows, self.entry_cols = np.array(positions, dtype=int).reshape(-1, 2).T
+        self.values = values
+        self.num_strings = np.array([entry.num_string for entry in self.elements])
+        self.entry_colors = np.full(len(self.elements), "", dtype=object)
+        self.reset_entry_colors()
+
+    def get_values(self):
+        return self.values
+
+    def reset_entry_colors(self):
+        return self.set_values(self.values, force=True)
+
+    def set_values(self, values, force=False):
+        """Show a new array of values, recoloring the entries to match.
+
+        Only entries whose formatted text or color changed are updated,
+        unless `force` is set.
+        """
+        self.values = np.array(values, dtype=float).reshape(self.shape)
+        if not self.elements:
+            return self
+        entry_values = self.values[self.entry_rows, self.entry_cols]
+        formatter = self.elements[0]
+        num_strings = np.array([formatter.get_num_string(value) for value in entry_values])
+        colors = values_to_colors(entry_values, **self.color_config).astype(object)
+
+        text_changed = num_strings != self.num_strings
+        changed = force | text_changed | (colors != self.entry_colors)
+        for index in np.flatnonzero(changed):
+            entry = self.elements[index]
+            if text_changed[index]:
+                entry.set_value(entry_values[index])
+            entry.set_fill(colors[index])
+        for entry, value in zip(self.elements, entry_values):
+            entry.number = value
+
+        self.num_strings = num_strings
+        self.entry_colors = colors
+        return self
+
+
+class RandomizeMatrixEntries(Animation):
+    """Animation that keeps swapping a matrix's values for random ones."""
+
+    def __init__(self, matrix, frequency=0.1, **kwargs):
+        self.matrix = matrix
+        self.frequency = frequency
+        super().__init__(matrix, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        if random.random() < self.frequency:
+            self.matrix.set_values(np.random.uniform(*self.matrix.value_range, self.matrix.shape))
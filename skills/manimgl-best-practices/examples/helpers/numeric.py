@@ -0,0 +1,105 @@
+"""
+Batched numeric helpers shared by the example scenes.
+
+Everything here works on whole NumPy arrays, so an attention pattern or a
+weight matrix is normalized and colored in one call instead of one Python
+call per entry.
+"""
+from functools import lru_cache
+
+from manimlib import *
+import numpy as np
+
+# Number of precomputed steps in each color ramp
+COLOR_RESOLUTION = 256
+
+
+def softmax(logits, temperature=1.0, axis=-1, mask=None):
+    """Numerically stable softmax of an N-D array along `axis`.
+
+    Entries where `mask` (broadcastable to `logits`) is False, as well as
+    -inf logits, get probability 0; a row with no valid entry is all zeros.
+    A temperature of 0 puts all the weight on the largest logit.
+    """
+    logits = np.asarray(logits, dtype=float)
+    if mask is not None:
+        logits = np.where(mask, logits, -np.inf)
+
+    if temperature == 0:
+        result = np.zeros_like(logits)
+        index = np.expand_dims(np.argmax(logits, axis=axis), axis)
+        np.put_along_axis(result, index, 1.0, axis=axis)
+        return np.where(np.isfinite(logits), result, 0.0)
+
+    peak = np.max(logits, axis=axis, keepdims=True)
+    peak = np.where(np.isfinite(peak), peak, 0.0)
+    exps = np.exp((logits - peak) / temperature)
+    totals = exps.sum(axis=axis, keepdims=True)
+    return np.divide(exps, totals, out=np.zeros_like(exps), where=totals > 0)
+
+
+def _color_ramp(low_color, high_color):
+    """(rgbs, hex_colors) sampled along the HSL path between two colors."""
+    return _hex_color_ramp(rgb_to_hex(color_to_rgb(low_color)), rgb_to_hex(color_to_rgb(high_color)))
+
+
+@lru_cache(maxsize=32)
+def _hex_color_ramp(low_color, high_color):
+    alphas = np.linspace(0, 1, COLOR_RESOLUTION)
+    colors = [interpolate_color_by_hsl(low_color, high_color, alpha) for alpha in alphas]
+    rgbs = np.array([color_to_rgb(color) for color in colors])
+    hex_colors = np.array([rgb_to_hex(rgb) for rgb in rgbs])
+    return rgbs, hex_colors
+
+
+def _ramp_indices(values, min_value, max_value):
+    values = np.asarray(values, dtype=float)
+    if max_value == min_value:
+        alphas = np.full(values.shape, 0.5)
+    else:
+        alphas = np.clip((np.abs(values) - min_value) / (max_value - min_value), 0, 1)
+    indices = np.round(alphas * (COLOR_RESOLUTION - 1)).astype(int)
+    return values >= 0, indices
+
+
+def values_to_colors(
+    values,
+    low_positive_color=BLUE_E,
+    high_positive_color=BLUE_B,
+    low_negative_color=RED_E,
+    high_negative_color=RED_B,
+    min_value=0.0,
+    max_value=10.0
+):
+    """Hex colors for an array of values, in the array's shape.
+
+    Sign picks the blue or red ramp, magnitude the position along it.
+    """
+    positive, indices = _ramp_indices(values, min_value, max_value)
+    _, positive_hex = _color_ramp(low_positive_color, high_positive_color)
+    _, negative_hex = _color_ramp(low_negative_color, high_negative_color)
+    return np.where(positive, positive_hex[indices], negative_hex[indices])
+
+
+def values_to_rgbas(
+    values,
+    opacity=1.0,
+    low_positive_color=BLUE_E,
+    high_positive_color=BLUE_B,
+    low_negative_color=RED_E,
+    high_negative_color=RED_B,
+    min_value=0.0,
+    max_value=10.0
+):
+    """RGBA array of shape (*values.shape, 4) for an array of values."""
+    positive, indices = _ramp_indices(values, min_value, max_value)
+    positive_rgbs, _ = _color_ramp(low_positive_color, high_positive_color)
+    negative_rgbs, _ = _color_ramp(low_negative_color, high_negative_color)
+    rgbs = np.where(positive[..., np.newaxis], positive_rgbs[indices], negative_rgbs[indices])
+    opacities = np.full((*rgbs.shape[:-1], 1), opacity, dtype=float)
+    return np.concatenate([rgbs, opacities], axis=-1)
+
+
+def value_to_color(value, *args, **kwargs):
+    """Color of a single value, see `values_to_colors`."""
+    return values_to_colors(value, *args, **kwargs).item()
@@ -0,0 +1,95 @@
+"""
+Random processes sampled up front.
+
+A run's samples are all drawn at once from a seeded NumPy Generator, each
+with the time it takes effect. Frames look the current sample up by time,
+so a render is reproducible, does not depend on the frame rate, and makes
+no random draws while it plays.
+"""
+from manimlib import *
+import numpy as np
+
+
+def uniform_sampler(rng, size):
+    return rng.random(size)
+
+
+def choice_sampler(probs):
+    """Sampler of indices into `probs`, drawn with those probabilities."""
+    probs = np.asarray(probs, dtype=float)
+    return lambda rng, size: rng.choice(len(probs), size=size, p=probs / probs.sum())
+
+
+class RandomSchedule:
+    """Samples of a random process over `run_time` seconds, `frequency` per second.
+
+    `sampler(rng, size)` draws `size` samples at once from a Generator
+    seeded with `seed`. Sample k takes effect at (k + 1) / frequency, and
+    the last one, at `run_time`, is `final_value` when that is given.
+    """
+
+    def __init__(self, sampler=uniform_sampler, run_time=1.0, frequency=8, seed=None, final_value=None):
+        self.seed = seed
+        n_steps = int(np.ceil(run_time * frequency - 1e-9))
+        self.times = np.append(np.arange(1, n_steps) / frequency, run_time)
+        self.values = np.asarray(sampler(np.random.default_rng(seed), len(self.times)))
+        if final_value is not None:
+            self.values[-1] = final_value
+        self.final_value = self.values[-1]
+
+    def get_index(self, time):
+        """Index of the sample in effect at `time`, or -1 before the first one."""
+        return int(np.searchsorted(self.times, time, side="right")) - 1
+
+    def get_value(self, time, default=None):
+        index = self.get_index(time)
+        return default if index < 0 else self.values[index]
+
+    def get_drawn_samples(self, time=np.inf):
+        return self.values[:self.get_index(time) + 1]
+
+    def get_histogram(self, time=np.inf, bins=10, value_range=(0, 1), func=None):
+        """Counts per bin of the samples drawn by `time`, after applying `func` to them."""
+        samples = self.get_drawn_samples(time)
+        if func is not None:
+            samples = func(samples)
+        return np.histogram(samples, bins=bins, range=value_range)[0]
+
+
+class Randomize(Animation):
+    """Animation that sets a ValueTracker to new random values at a given frequency.
+
+    The values come from a RandomSchedule built when the animation begins,
+    so they are fixed by `seed` and the run time.
+    """
+
+    def __init__(self, value_tracker, frequency=8, sampler=uniform_sampler, final_value=None, seed=None, **kwargs):
+        self.value_tracker = value_tracker
+        self.frequency = frequency
+        self.sampler = sampler
+        self.final_value = final_value
+        self.seed = seed
+        self.schedule = None
+        self.last_index = -1
+        super().__init__(value_tracker, **kwargs)
+
+    def begin(self):
+        self.schedule = RandomSchedule(
+            self.sampler, self.run_time, self.frequency, self.seed, self.final_value
+        )
+        self.last_index = -1
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        index = self.schedule.get_index(alpha * self.run_time)
+        if index < 0 or index == self.last_index:
+            return
+        self.last_index = index
+        self.value_tracker.set_value(self.schedule.values[index])
+
+    def get_histogram(self, bins=10, value_range=(0, 1), func=None):
+        """Counts per bin of the values shown so far; see RandomSchedule.get_histogram."""
+        if self.schedule is None or self.last_index < 0:
+            return np.zeros(bins, dtype=int)
+        time = self.schedule.times[self.last_index]
+        return self.schedule.get_histogram(time, bins, value_range, func)
@@ -0,0 +1,101 @@
+"""
+Batched integrator for spring-mass systems.
+
+`OscillatorBank` keeps the displacement and velocity of every mass in two
+arrays and advances them all at once with a fixed time step. The time each
+frame adds goes into an accumulator, so the motion does not depend on the
+frame rate. Mobjects only read positions from the bank.
+"""
+from manimlib import *
+import numpy as np
+
+
+def chain_stiffness(n_masses, k=1.0, fixed_ends=True):
+    """(n, n) stiffness matrix of equal masses joined in a line by springs of constant k."""
+    stiffness = 2 * k * np.identity(n_masses)
+    index = np.arange(n_masses - 1)
+    stiffness[index, index + 1] = -k
+    stiffness[index + 1, index] = -k
+    if not fixed_ends:
+        stiffness[0, 0] = stiffness[-1, -1] = k
+    return stiffness
+
+
+class OscillatorBank(ValueTracker):
+    """
+    Unit masses obeying x'' = -K x - mu x', integrated together.
+
+    `k` is a spring constant per mass (a scalar or one per mass) or an
+    (n, n) stiffness matrix coupling them, e.g. from `chain_stiffness`;
+    `mu` is the damping, likewise per mass. `method` is "euler"
+    (explicit), "symplectic" (semi-implicit Euler) or "rk4". The tracked
+    value is the simulated time. Add the bank to the scene before the
+    mobjects that read it.
+    """
+
+    def __init__(self, x0, v0=0.0, k=3.0, mu=0.1, dt=0.01, method="symplectic", **kwargs):
+        if method not in ("euler", "symplectic", "rk4"):
+            raise ValueError(f"Unknown integration method: {method}")
+        self.positions = np.array(x0, dtype=float).reshape(-1)
+        shape = self.positions.shape
+        self.velocities = np.broadcast_to(np.asarray(v0, dtype=float), shape).copy()
+        stiffness = np.asarray(k, dtype=float)
+        self.stiffness = stiffness if stiffness.ndim == 2 else np.broadcast_to(stiffness, shape).copy()
+        self.damping = np.broadcast_to(np.asarray(mu, dtype=float), shape).copy()
+        self.dt = dt
+        self.method = method
+        self.time_accumulator = 0.0
+        self.is_running = True
+        super().__init__(0, **kwargs)
+        self.add_updater(lambda m, dt: m.advance(dt))
+
+    def get_accelerations(self, positions=None, velocities=None):
+        x = self.positions if positions is None else positions
+        v = self.velocities if velocities is None else velocities
+        if self.stiffness.ndim == 2:
+            spring_forces = self.stiffness @ x
+        else:
+            spring_forces = self.stiffness * x
+        return -spring_forces - self.damping * v
+
+    def step(self):
+        """Advance every mass by one fixed time step."""
+        x, v, dt = self.positions, self.velocities, self.dt
+        if self.method == "euler":
+            a = self.get_accelerations(x, v)
+            x += v * dt
+            v += a * dt
+            return self
+        if self.method == "symplectic":
+            v += self.get_accelerations(x, v) * dt
+            x += v * dt
+            return self
+
+        a1 = self.get_accelerations(x, v)
+        x2, v2 = x + 0.5 * dt * v, v + 0.5 * dt * a1
+        a2 = self.get_accelerations(x2, v2)
+        x3, v3 = x + 0.5 * dt * v2, v + 0.5 * dt * a2
+        a3 = self.get_accelerations(x3, v3)
+        x4, v4 = x + dt * v3, v + dt * a3
+        a4 = self.get_accelerations(x4, v4)
+        x += dt * (v + 2 * v2 + 2 * v3 + v4) / 6
+        v += dt * (a1 + 2 * a2 + 2 * a3 + a4) / 6
+        return self
+
+    def advance(self, delta_t):
+        """Take as many fixed steps as fit in the accumulated time."""
+        if not self.is_running:
+            return self
+        self.time_accumulator += delta_t
+        n_steps = int(self.time_accumulator / self.dt + 1e-9)
+        for _ in range(n_steps):
+            self.step()
+        self.time_accumulator -= n_steps * self.dt
+        self.increment_value(n_steps * self.dt)
+        return self
+
+    def pause(self):
+        self.is_running = False
+
+    def unpause(self):
+        self.is_running = True
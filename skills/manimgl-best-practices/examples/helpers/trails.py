@@ -0,0 +1,194 @@
+"""
+Trails with a fixed memory footprint.
+
+TracedPath keeps every point it has traced and re-smooths all of them on
+every frame, so a long scene gets slower the longer it runs. The trails
+here live in buffers allocated once: adding a point and dropping the
+oldest one each touch a constant number of entries. Trails of fading dots
+likewise reuse a fixed set of slots instead of growing every frame.
+"""
+from manimlib import *
+import numpy as np
+
+
+class RingTracedPath(VMobject):
+    """TracedPath drawn from a ring buffer of at most `max_anchors` anchors.
+
+    Anchor k sits at points[2 * k], and the handle after it at
+    points[2 * k + 1], with one extra point at the end repeating anchor 0
+    to close the ring. A curve whose handle sits on its first anchor is not
+    drawn, so setting the handle of the newest anchor onto it cuts the ring
+    between the newest and the oldest anchors, and dropping an anchor is
+    the same one write. The points are therefore not in path order; use
+    `get_traced_points` for that.
+
+    A new anchor is laid down every `time_per_anchor` seconds, and in
+    between the newest one follows the traced point. Anchors older than
+    `time_traced` seconds, or further back along the path than
+    `length_traced`, are dropped, as is the oldest one once the buffer is
+    full.
+    """
+
+    def __init__(
+        self,
+        traced_point_func,
+        time_traced=None,
+        length_traced=None,
+        time_per_anchor=1.0 / 30,
+        max_anchors=None,
+        stroke_width=2.0,
+        stroke_color=WHITE,
+        **kwargs
+    ):
+        if max_anchors is None:
+            max_anchors = 2000 if time_traced is None else int(np.ceil(time_traced / time_per_anchor)) + 2
+        self.max_anchors = max(max_anchors, 2)
+        self.traced_point_func = traced_point_func
+        self.time_traced = time_traced
+        self.length_traced = length_traced
+        self.time_per_anchor = time_per_anchor
+        self.time = 0.0
+        self.time_since_anchor = 0.0
+        self.start = 0
+        self.n_anchors = 0
+        self.anchor_times = np.zeros(self.max_anchors)
+        # Path length from the first anchor ever traced, for length_traced
+        self.anchor_lengths = np.zeros(self.max_anchors)
+
+        super().__init__(**kwargs)
+        self.set_stroke(stroke_color, stroke_width)
+        self.add_updater(lambda m, dt: m.update_path(dt))
+
+    def init_points(self):
+        self.set_points(np.zeros((2 * self.max_anchors + 1, 3)))
+        self.set_joint_type('no_joint')
+
+    def get_anchor_indices(self):
+        """Ring indices of the live anchors, oldest first."""
+        return (self.start + np.arange(self.n_anchors)) % self.max_anchors
+
+    def get_traced_points(self):
+        return self.get_points()[2 * self.get_anchor_indices()]
+
+    def compute_bounding_box(self):
+        # Dropped and unused slots still hold points, so bound the live
+        # anchors only; every handle lies between two of them
+        points = self.get_traced_points()
+        if len(points) == 0:
+            return super().compute_bounding_box()
+        mins = points.min(0)
+        maxs = points.max(0)
+        return np.array([mins, (mins + maxs) / 2, maxs])
+
+    def update_path(self, dt):
+        if dt == 0:
+            return self
+        self.time += dt
+        self.time_since_anchor += dt
+        point = self.traced_point_func()
+        if self.n_anchors < 2 or self.time_since_anchor >= self.time_per_anchor:
+            self.time_since_anchor %= self.time_per_anchor
+            self.add_anchor(point)
+        else:
+            self.set_head(point)
+        self.dissipate()
+        self.refresh_bounding_box()
+        self.note_changed_data()
+        return self
+
+    def add_anchor(self, point):
+        if self.n_anchors == self.max_anchors:
+            self.drop_oldest()
+        self.n_anchors += 1
+        self.anchor_times[(self.start + self.n_anchors - 1) % self.max_anchors] = self.time
+        self.set_head(point)
+
+    def set_head(self, point):
+        """Move the newest anchor to `point`, keeping the path cut right after it."""
+        points = self.data["point"]
+        head = (self.start + self.n_anchors - 1) % self.max_anchors
+        points[2 * head] = point
+        points[2 * head + 1] = point
+        if head == 0:
+            points[-1] = point
+        if self.n_anchors > 1:
+            prev = (head - 1) % self.max_anchors
+            points[2 * prev + 1] = 0.5 * (points[2 * prev] + points[2 * head])
+            step = get_norm(points[2 * head] - points[2 * prev])
+            self.anchor_lengths[head] = self.anchor_lengths[prev] + step
+        else:
+            self.anchor_lengths[head] = 0
+
+    def drop_oldest(self):
+        points = self.data["point"]
+        points[2 * self.start + 1] = points[2 * self.start]
+        self.start = (self.start + 1) % self.max_anchors
+        self.n_anchors -= 1
+
+    def dissipate(self):
+        # Keep an anchor as long as the one after it is still in range, so
+        # the trail spans the full time_traced or length_traced
+        head = (self.start + self.n_anchors - 1) % self.max_anchors
+        while self.n_anchors > 2:
+            second = (self.start + 1) % self.max_anchors
+            too_old = (
+                self.time_traced is not None
+                and self.time - self.anchor_times[second] >= self.time_traced
+            )
+            too_far = (
+                self.length_traced is not None
+                and self.anchor_lengths[head] - self.anchor_lengths[second] >= self.length_traced
+            )
+            if not (too_old or too_far):
+                break
+            self.drop_oldest()
+
+
+class TrackingDots(Animation):
+    """Animation that leaves a trail of fading glow dots where `point_func` has been.
+
+    The dots are one GlowDot with room for `capacity` points, allocated up
+    front and written at a head index that wraps around. Each frame the
+    opacities of the slots in use are multiplied by `fade_factor` in place,
+    and those below `min_opacity` are zeroed, which frees them. By default
+    the capacity is just enough to hold a dot until it fades out that far.
+    """
+
+    def __init__(
+        self,
+        point_func,
+        fade_factor=0.95,
+        radius=0.25,
+        color=YELLOW,
+        min_opacity=1e-3,
+        capacity=None,
+        **kwargs
+    ):
+        if capacity is None:
+            capacity = int(np.ceil(np.log(min_opacity) / np.log(fade_factor))) + 1
+        self.point_func = point_func
+        self.fade_factor = fade_factor
+        self.min_opacity = min_opacity
+        self.capacity = capacity
+        point = np.array(point_func())
+        self.dots = GlowDot(point, color=color, radius=radius)
+        self.dots.set_points(np.repeat(point[np.newaxis], capacity, axis=0))
+        self.dots.data["rgba"][:, 3] = 0
+        self.dots.data["rgba"][0, 3] = 1
+        self.head = 0
+        self.n_used = 1
+        kwargs.update(remover=True)
+        super().__init__(self.dots, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        points = self.dots.data["point"]
+        point = self.point_func()
+        if not np.isclose(points[self.head], point).all():
+            self.head = (self.head + 1) % self.capacity
+            self.n_used = max(self.n_used, self.head + 1)
+            points[self.head] = point
+            self.dots.data["rgba"][self.head, 3] = 1
+        opacities = self.dots.data["rgba"][:self.n_used, 3]
+        opacities *= self.fade_factor
+        opacities[opacities < self.min_opacity] = 0
+        self.dots.note_changed_data()
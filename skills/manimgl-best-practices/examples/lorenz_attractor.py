@@ -7,7 +7,11 @@ showing sensitivity to initial conditions (chaos theory).
 Run: manimgl lorenz_attractor.py LorenzAttractor
 """
 from manimlib import *
+from pathlib import Path
 from scipy.integrate import solve_ivp
+import hashlib
+import inspect
+import os
 
 
 def lorenz_system(t, state, sigma=10, rho=28, beta=8 / 3):
@@ -15,16 +19,76 @@ def lorenz_system(t, state, sigma=10, rho=28, beta=8 / 3):
     The Lorenz system of differential equations.
 
     These equations model atmospheric convection and exhibit
-    chaotic behavior for certain parameter values.
+    chaotic behavior for certain parameter values. `state` is
+    either a single [x, y, z] or an (N, 3) array of states.
     """
-    x, y, z = state
+    state = np.asarray(state)
+    x, y, z = state[..., 0], state[..., 1], state[..., 2]
     dxdt = sigma * (y - x)
     dydt = x * (rho - z) - y
     dzdt = x * y - beta * z
-    return [dxdt, dydt, dzdt]
+    return np.stack([dxdt, dydt, dzdt], axis=-1)
+
+
+def ode_cache_path(function, params, states0, time, dt):
+    """Cache file for a bundle of solutions, keyed by everything that determines them."""
+    key = hashlib.sha256()
+    key.update(function.__qualname__.encode())
+    key.update(function.__code__.co_code)
+    key.update(repr(function.__code__.co_consts).encode())
+    # Hash the arguments `function` is actually called with, defaults included,
+    # so that changing a default does not reuse a stale solution
+    arguments = inspect.signature(function).bind(0, states0, **params)
+    arguments.apply_defaults()
+    key.update(repr(list(arguments.arguments.items())[2:]).encode())
+    key.update(repr((states0.shape, float(time), float(dt))).encode())
+    key.update(states0.tobytes())
+    return Path(get_cache_dir(), "ode_solutions", f"{function.__name__}-{key.hexdigest()[:20]}.npy")
+
+
+def ode_solution_bundle(function, states0, time, dt=0.01, cache=True, **params):
+    """
+    Solve an ODE system for many initial states at once.
+
+    All trajectories are advanced together by one RK45 solve over the
+    stacked (N, dim) state, so `function` must accept an array of
+    states. Solutions are memoized on disk.
+
+    Args:
+        function: The ODE system function
+        states0: Initial states, shape (N, dim)
+        time: Total evolution time
+        dt: Time step for output points
+        cache: Whether to read and write the on-disk cache
+        params: Keyword parameters passed on to `function`
+
+    Returns:
+        Array of shape (N, n_points, dim) with trajectory points
+    """
+    states0 = np.array(states0, dtype=float)
+    path = ode_cache_path(function, params, states0, time, dt)
+    if cache and path.exists():
+        return np.load(path)
 
+    shape = states0.shape
+    solution = solve_ivp(
+        lambda t, y: np.reshape(function(t, y.reshape(shape), **params), -1),
+        t_span=(0, time),
+        y0=states0.reshape(-1),
+        t_eval=np.arange(0, time, dt)
+    )
+    points = solution.y.T.reshape(-1, *shape).swapaxes(0, 1)
+
+    if cache:
+        # Write then rename, so parallel renders never read a partial file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(temp_path, points)
+        os.replace(temp_path, path)
+    return points
 
-def ode_solution_points(function, state0, time, dt=0.01):
+
+def ode_solution_points(function, state0, time, dt=0.01, **params):
     """
     Solve an ODE system and return the trajectory points.
 
@@ -37,13 +101,7 @@ def ode_solution_points(function, state0, time, dt=0.01):
     Returns:
         Array of shape (n_points, 3) with trajectory points
     """
-    solution = solve_ivp(
-        function,
-        t_span=(0, time),
-        y0=state0,
-        t_eval=np.arange(0, time, dt)
-    )
-    return solution.y.T
+    return ode_solution_bundle(function, [state0], time, dt, **params)[0]
 
 
 class LorenzAttractor(InteractiveScene):
@@ -103,10 +161,10 @@ class LorenzAttractor(InteractiveScene):
         ]
         colors = color_gradient([BLUE_E, BLUE_A], len(states))
 
-        # Create curves from solutions
+        # Create curves from solutions, all integrated together
         curves = VGroup()
-        for state, color in zip(states, colors):
-            points = ode_solution_points(lorenz_system, state, evolution_time)
+        solutions = ode_solution_bundle(lorenz_system, states, evolution_time)
+        for points, color in zip(solutions, colors):
             curve = VMobject().set_points_smoothly(axes.c2p(*points.T))
             curve.set_stroke(color, 1, opacity=0.25)
             curves.add(curve)
@@ -4,52 +4,11 @@ Shows how the maximum of two random uniform values behaves over time.
 """
 from manimlib import *
 import random
+import sys
+from pathlib import Path
 
-
-class Randomize(Animation):
-    """Animation that randomizes a ValueTracker's value at a given frequency."""
-    def __init__(self, value_tracker, frequency=8, rand_func=random.random, final_value=None, **kwargs):
-        self.value_tracker = value_tracker
-        self.rand_func = rand_func
-        self.frequency = frequency
-        self.final_value = final_value if final_value is not None else rand_func()
-        self.last_alpha = 0
-        self.running_tally = 0
-        super().__init__(value_tracker, **kwargs)
-
-    def interpolate_mobject(self, alpha):
-        if not self.new_step(alpha):
-            return
-        value = self.rand_func() if alpha < 1 else self.final_value
-        self.value_tracker.set_value(value)
-
-    def new_step(self, alpha):
-        d_alpha = alpha - self.last_alpha
-        self.last_alpha = alpha
-        self.running_tally += self.frequency * d_alpha * self.run_time
-        if self.running_tally > 1:
-            self.running_tally = self.running_tally % 1
-            return True
-        return False
-
-
-class TrackingDots(Animation):
-    """Animation that leaves a trail of fading dots at specified positions."""
-    def __init__(self, point_func, fade_factor=0.95, radius=0.25, color=YELLOW, **kwargs):
-        self.point_func = point_func
-        self.fade_factor = fade_factor
-        self.dots = GlowDot(point_func(), color=color, radius=radius)
-        kwargs.update(remover=True)
-        super().__init__(self.dots, **kwargs)
-
-    def interpolate_mobject(self, alpha):
-        opacities = self.dots.get_opacities()
-        point = self.point_func()
-        if not np.isclose(self.dots.get_end(), point).all():
-            self.dots.add_point(point)
-            opacities = np.hstack([opacities, [1]])
-        opacities *= self.fade_factor
-        self.dots.set_opacity(opacities)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import Randomize, TrackingDots
 
 
 def get_random_var_label_group(axis, label_name, color=GREY, initial_value=None, font_size=36, direction=None):
@@ -152,8 +111,8 @@ class MaxRandomProcess(InteractiveScene):
 
         # Animate the random process
         self.play(
-            Randomize(x1_tracker, frequency=4, run_time=15),
-            Randomize(x2_tracker, frequency=4, run_time=15),
+            Randomize(x1_tracker, frequency=4, run_time=15, seed=1),
+            Randomize(x2_tracker, frequency=4, run_time=15, seed=2),
             TrackingDots(x1_tip.get_top, color=BLUE),
             TrackingDots(x2_tip.get_top, color=YELLOW),
             TrackingDots(max_tip.get_top, color=GREEN),
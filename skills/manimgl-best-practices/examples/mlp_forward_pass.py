@@ -4,15 +4,11 @@ Shows data flowing through Linear -> ReLU -> Linear operations.
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def value_to_color(value, max_value=10.0):
-    """Maps a value to blue (positive) or red (negative)."""
-    alpha = clip(abs(value) / max_value, 0, 1)
-    if value >= 0:
-        return interpolate_color_by_hsl(BLUE_E, BLUE_B, alpha)
-    else:
-        return interpolate_color_by_hsl(RED_E, RED_B, alpha)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import LiveDecimalNumber, value_to_color
 
 
 class MLPForwardPass(InteractiveScene):
@@ -132,7 +128,7 @@ class MLPForwardPass(InteractiveScene):
         """Creates a vertical vector display with colored entries."""
         entries = VGroup()
         for val in values:
-            entry = DecimalNumber(
+            entry = LiveDecimalNumber(
                 val,
                 num_decimal_places=1,
                 include_sign=True,
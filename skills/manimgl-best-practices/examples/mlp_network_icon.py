@@ -3,7 +3,13 @@ MLP Network Icon - A simple visualization of a multilayer perceptron structure
 Shows dots arranged in layers with connecting lines between neurons.
 """
 from manimlib import *
+import numpy as np
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import values_to_colors
 
 
 class MLPNetworkIcon(InteractiveScene):
@@ -78,28 +84,11 @@ class MLPNetworkIcon(InteractiveScene):
         )
 
         # Color and style the lines randomly
-        for line in lines:
+        colors = values_to_colors(np.random.uniform(-10, 10, len(lines)))
+        for line, color in zip(lines, colors):
             line.set_stroke(
-                color=self.value_to_color(random.uniform(-10, 10)),
+                color=color,
                 width=3 * random.random()**3
             )
 
         return VGroup(layers, lines)
-
-    def value_to_color(
-        self,
-        value,
-        low_positive_color=BLUE_E,
-        high_positive_color=BLUE_B,
-        low_negative_color=RED_E,
-        high_negative_color=RED_B,
-        min_value=0.0,
-        max_value=10.0
-    ):
-        """Maps a numeric value to a color based on its sign and magnitude."""
-        alpha = clip(float(inverse_interpolate(min_value, max_value, abs(value))), 0, 1)
-        if value >= 0:
-            colors = (low_positive_color, high_positive_color)
-        else:
-            colors = (low_negative_color, high_negative_color)
-        return interpolate_color_by_hsl(*colors, alpha)
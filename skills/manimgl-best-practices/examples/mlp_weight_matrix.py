@@ -4,24 +4,11 @@ Shows a color-coded weight matrix with values mapped to colors.
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def value_to_color(
-    value,
-    low_positive_color=BLUE_E,
-    high_positive_color=BLUE_B,
-    low_negative_color=RED_E,
-    high_negative_color=RED_B,
-    min_value=0.0,
-    max_value=10.0
-):
-    """Maps a numeric value to a color based on sign and magnitude."""
-    alpha = clip(float(inverse_interpolate(min_value, max_value, abs(value))), 0, 1)
-    if value >= 0:
-        colors = (low_positive_color, high_positive_color)
-    else:
-        colors = (low_negative_color, high_negative_color)
-    return interpolate_color_by_hsl(*colors, alpha)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import value_to_color, values_to_colors
 
 
 class WeightMatrixVisualization(InteractiveScene):
@@ -78,6 +65,7 @@ class WeightMatrixVisualization(InteractiveScene):
     def create_weight_matrix(self, values):
         """Creates a VGroup of DecimalNumbers arranged as a matrix."""
         n_rows, n_cols = values.shape
+        colors = values_to_colors(values, max_value=9.9)
         entries = VGroup()
         rows = VGroup()
 
@@ -91,7 +79,7 @@ class WeightMatrixVisualization(InteractiveScene):
                     include_sign=True,
                     font_size=24
                 )
-                entry.set_color(value_to_color(val, max_value=9.9))
+                entry.set_color(colors[i, j])
                 row.add(entry)
                 entries.add(entry)
             row.arrange(RIGHT, buff=0.3)
@@ -151,13 +139,14 @@ class MatrixVectorProduct(InteractiveScene):
         vector_values = np.random.uniform(-5, 5, size=(3,))
 
         # Build matrix display
+        matrix_colors = values_to_colors(matrix_values, max_value=5)
         matrix_entries = VGroup()
         for i in range(4):
             row = VGroup()
             for j in range(3):
                 val = matrix_values[i, j]
                 entry = DecimalNumber(val, num_decimal_places=1, include_sign=True, font_size=28)
-                entry.set_color(value_to_color(val, max_value=5))
+                entry.set_color(matrix_colors[i, j])
                 row.add(entry)
             row.arrange(RIGHT, buff=0.4)
             matrix_entries.add(row)
@@ -9,14 +9,11 @@ Interactive: manimgl multi_head_attention.py MultiHeadedAttention -se 30
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def softmax(logits, temperature=1.0):
-    """Numerically stable softmax."""
-    logits = np.array(logits)
-    logits = logits - np.max(logits)
-    exps = np.exp(logits / max(temperature, 1e-10))
-    return exps / np.sum(exps)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import softmax
 
 
 class AttentionPatternGrid(VGroup):
@@ -43,13 +40,8 @@ class AttentionPatternGrid(VGroup):
 
         # Generate causal attention pattern
         pattern = np.random.normal(0, 1, (n_rows, n_rows))
-        for n in range(n_rows):
-            pattern[:, n][n + 1:] = -np.inf
-            valid = pattern[:, n][pattern[:, n] > -np.inf]
-            if len(valid) > 0:
-                pattern[:, n][:n + 1] = softmax(valid)
-            pattern[:, n][n + 1:] = 0
-        pattern = np.nan_to_num(pattern, nan=0.0)
+        causal_mask = np.triu(np.ones((n_rows, n_rows), dtype=bool))
+        pattern = softmax(pattern, axis=0, mask=causal_mask)
 
         # Add dots based on weights
         self.dots = VGroup()
@@ -9,23 +9,11 @@ Run: manimgl network_block_flow.py NetworkBlockFlow3D -o
 from manimlib import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
 
-
-def value_to_color(
-    value,
-    low_positive_color=BLUE_E,
-    high_positive_color=BLUE_B,
-    low_negative_color=RED_E,
-    high_negative_color=RED_B,
-    min_value=0.0,
-    max_value=10.0
-):
-    """Map a value to a color based on its sign and magnitude."""
-    alpha = np.clip(float((abs(value) - min_value) / (max_value - min_value)), 0, 1)
-    if value >= 0:
-        return interpolate_color(low_positive_color, high_positive_color, alpha)
-    else:
-        return interpolate_color(low_negative_color, high_negative_color, alpha)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import value_to_color, values_to_colors
 
 
 def random_bright_color(hue_range=(0.0, 1.0)):
@@ -55,9 +43,9 @@ class SimpleEmbeddingColumn(VGroup):
         self.entries = entries
 
     def randomize_values(self):
-        for entry in self.entries:
-            value = random.uniform(-10, 10)
-            entry.set_fill(value_to_color(value), opacity=0.9)
+        colors = values_to_colors(np.random.uniform(-10, 10, len(self.entries)))
+        for entry, color in zip(self.entries, colors):
+            entry.set_fill(color, opacity=0.9)
         return self
 
 
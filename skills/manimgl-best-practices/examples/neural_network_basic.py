@@ -6,24 +6,11 @@ from manimlib import *
 import numpy as np
 import random
 import itertools as it
+import sys
+from pathlib import Path
 
-
-def value_to_color(
-    value,
-    low_positive_color=BLUE_E,
-    high_positive_color=BLUE_B,
-    low_negative_color=RED_E,
-    high_negative_color=RED_B,
-    min_value=0.0,
-    max_value=10.0
-):
-    """Map a numeric value to a color gradient."""
-    alpha = clip(float(inverse_interpolate(min_value, max_value, abs(value))), 0, 1)
-    if value >= 0:
-        colors = (low_positive_color, high_positive_color)
-    else:
-        colors = (low_negative_color, high_negative_color)
-    return interpolate_color_by_hsl(*colors, alpha)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import value_to_color
 
 
 class NeuralNetwork(VGroup):
@@ -5,12 +5,18 @@ Visualizes how a quantum state vector maps to a probability distribution
 through the Born rule (amplitude squared = probability).
 
 Key concepts demonstrated:
-- DecimalMatrix for state vector display
+- LiveDecimalMatrix (glyph atlas backed DecimalMatrix) for a state vector
+  updated every frame
 - Rectangle bars for probability visualization
 - always_redraw for reactive updates
 - LaggedStartMap for sequential animations
 """
 from manimlib import *
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import LiveDecimalMatrix
 
 
 class ProbabilityDistribution(InteractiveScene):
@@ -143,7 +149,7 @@ class DynamicStateVector(InteractiveScene):
         qc_symbol.shift(4 * LEFT)
 
         # Middle: State vector
-        state_vector = DecimalMatrix(
+        state_vector = LiveDecimalMatrix(
             np.zeros((n_states, 1)),
             decimal_config=dict(include_sign=True, num_decimal_places=2)
         )
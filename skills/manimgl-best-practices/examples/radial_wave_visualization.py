@@ -9,6 +9,11 @@ Run: manimgl radial_wave_visualization.py RadialWaveDemo -w
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import RadialWaveField
 
 
 class RadialWaveDemo(Scene):
@@ -106,46 +111,15 @@ class WaveInterferencePattern(Scene):
         # Wave parameters
         wave_number = 1.5
         frequency = 0.5
-        max_radius = 10.0
-
-        # Create wave function that shows interference
-        def get_interference_field(time):
-            # Create a grid of points
-            x_range = np.linspace(-7, 7, 70)
-            y_range = np.linspace(-4, 4, 40)
-            dots = VGroup()
-
-            for x in x_range:
-                for y in y_range:
-                    point = np.array([x, y, 0])
-                    r1 = np.linalg.norm(point - source1_pos)
-                    r2 = np.linalg.norm(point - source2_pos)
-
-                    # Wave from source 1
-                    phase1 = TAU * (wave_number * r1 - frequency * time)
-                    amp1 = np.cos(phase1) / (1 + 0.3 * r1)
-
-                    # Wave from source 2
-                    phase2 = TAU * (wave_number * r2 - frequency * time)
-                    amp2 = np.cos(phase2) / (1 + 0.3 * r2)
-
-                    # Combined amplitude
-                    total_amp = (amp1 + amp2) / 2
-
-                    # Color based on amplitude
-                    if total_amp > 0:
-                        color = interpolate_color(BLACK, BLUE, min(total_amp, 1))
-                    else:
-                        color = interpolate_color(BLACK, RED, min(-total_amp, 1))
-
-                    dot = Dot(point, radius=0.05, color=color)
-                    dot.set_fill(opacity=0.3 + 0.7 * abs(total_amp))
-                    dots.add(dot)
-
-            return dots
 
+        # Interference field: one persistent dot cloud recolored every frame
         time_tracker = ValueTracker(0)
-        field = always_redraw(lambda: get_interference_field(time_tracker.get_value()))
+        field = RadialWaveField(
+            [source1_pos, source2_pos],
+            wave_number=wave_number,
+            frequency=frequency,
+        )
+        field.add_updater(lambda m: m.set_time(time_tracker.get_value()))
 
         # Title
         title = Text("Two-Source Interference", font_size=48)
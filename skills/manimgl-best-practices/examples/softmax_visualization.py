@@ -4,18 +4,11 @@ Demonstrates: BarChart, DecimalNumber, animations for probability concepts
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def softmax(logits, temperature=1.0):
-    """Compute softmax with optional temperature parameter."""
-    logits = np.array(logits)
-    logits = logits - np.max(logits)  # For numerical stability
-    if temperature == 0:
-        result = np.zeros_like(logits, dtype=float)
-        result[np.argmax(logits)] = 1
-        return result
-    exps = np.exp(logits / temperature)
-    return exps / np.sum(exps)
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import softmax
 
 
 class SoftmaxVisualization(Scene):
@@ -11,6 +11,11 @@ Source: Adapted from 3b1b's Laplace transform video (2025)
 """
 from manimlib import *
 import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import OscillatorBank, chain_stiffness
 
 
 class SpringMassSystem(VGroup):
@@ -19,6 +24,10 @@ class SpringMassSystem(VGroup):
 
     This is a great example of 3b1b's approach: create a self-contained
     VGroup subclass that handles its own physics and rendering.
+
+    Pass an OscillatorBank as `physics` to let several springs share one
+    integrator; the spring then shows mass `index` of that bank, and x0,
+    v0, k and mu are taken from the bank instead.
     """
 
     def __init__(
@@ -37,6 +46,8 @@ class SpringMassSystem(VGroup):
         mass_width=1.0,
         mass_color=BLUE_E,
         mass_label="m",
+        physics=None,
+        index=0,
     ):
         super().__init__()
         self.equilibrium_position = equilibrium_position
@@ -49,18 +60,23 @@ class SpringMassSystem(VGroup):
         self.spring = self._create_spring(spring_stroke_color, spring_stroke_width, n_spring_curls, spring_radius)
         self.add(self.spring, self.mass)
 
-        # Physics state
-        self.k = k
-        self.mu = mu
-        self.velocity = v0
-        self._is_running = True
+        # Physics state, integrated by a shared bank or one of our own
+        self.owns_physics = physics is None
+        if physics is None:
+            physics = OscillatorBank([x0], v0, k=k, mu=mu, method="euler")
+        self.physics = physics
+        self.index = index
 
         # Set initial position
-        self.set_x(x0)
+        self.set_x(self.get_x())
 
         # Add physics updater
         self.add_updater(lambda m, dt: m.time_step(dt))
 
+    @property
+    def velocity(self):
+        return self.physics.velocities[self.index]
+
     def _create_spring(self, stroke_color, stroke_width, n_curls, radius):
         """Create a 3D helix spring using parametric curve."""
         spring = ParametricCurve(
@@ -88,6 +104,8 @@ class SpringMassSystem(VGroup):
 
     def set_x(self, x):
         """Set displacement from equilibrium position."""
+        self.physics.positions[self.index] = x
+        self.displayed_x = x
         self.mass.move_to(self.equilibrium_position + x * self.direction)
 
         # Stretch spring to connect fixed point to mass
@@ -99,32 +117,21 @@ class SpringMassSystem(VGroup):
 
     def get_x(self):
         """Get current displacement."""
-        return (self.mass.get_center() - self.equilibrium_position)[0]
-
-    def time_step(self, delta_t, dt_size=0.01):
-        """Integrate physics using simple Euler method."""
-        if not self._is_running or delta_t == 0:
-            return
-
-        state = [self.get_x(), self.velocity]
-        sub_steps = max(int(delta_t / dt_size), 1)
-        true_dt = delta_t / sub_steps
-
-        for _ in range(sub_steps):
-            x, v = state
-            # Damped harmonic oscillator: x'' = -kx - μv
-            acceleration = -self.k * x - self.mu * v
-            state[0] += v * true_dt
-            state[1] += acceleration * true_dt
+        return self.physics.positions[self.index]
 
-        self.set_x(state[0])
-        self.velocity = state[1]
+    def time_step(self, delta_t):
+        """Advance our own physics (a shared bank advances itself) and follow the mass."""
+        if self.owns_physics:
+            self.physics.advance(delta_t)
+        x = self.get_x()
+        if x != self.displayed_x:
+            self.set_x(x)
 
     def pause(self):
-        self._is_running = False
+        self.physics.pause()
 
     def unpause(self):
-        self._is_running = True
+        self.physics.unpause()
 
     def get_velocity_vector(self, scale_factor=0.5, v_offset=-0.25, color=GREEN):
         """Get a dynamic vector showing velocity."""
@@ -141,7 +148,7 @@ class SpringMassSystem(VGroup):
         vector = Vector(RIGHT, fill_color=color, stroke_color=color)
         v_shift = v_offset * UP
         def get_force():
-            return -self.k * self.get_x() - self.mu * self.velocity
+            return self.physics.get_accelerations()[self.index]
         vector.add_updater(lambda m: m.put_start_and_end_on(
             self.mass.get_center() + v_shift,
             self.mass.get_center() + v_shift + scale_factor * get_force() * RIGHT
@@ -274,17 +281,19 @@ class MultipleSprings(InteractiveScene):
     """
 
     def construct(self):
-        # Create three springs with different damping
-        springs = VGroup()
+        # Create three springs with different damping, integrated together
         damping_values = [0.0, 0.2, 0.5]
         labels_text = ["No damping", "Light damping", "Heavy damping"]
         colors = [BLUE, GREEN, RED]
 
-        for i, (mu, label_text, color) in enumerate(zip(damping_values, labels_text, colors)):
+        physics = OscillatorBank(x0=[1.5] * 3, k=4, mu=damping_values)
+        self.add(physics)
+
+        springs = VGroup()
+        for i, (label_text, color) in enumerate(zip(labels_text, colors)):
             spring = SpringMassSystem(
-                x0=1.5,
-                mu=mu,
-                k=4,
+                physics=physics,
+                index=i,
                 equilibrium_position=4 * LEFT + (2 - i * 2) * UP,
                 equilibrium_length=4,
                 mass_color=color,
@@ -292,12 +301,51 @@ class MultipleSprings(InteractiveScene):
 
             label = Text(label_text, font_size=24, color=color)
             label.next_to(spring.mass, RIGHT, buff=2)
-            label.add_updater(lambda m, s=spring, t=label_text, c=color: m.become(
-                Text(t, font_size=24, color=c).next_to(s.mass, RIGHT, buff=2)
-            ))
+            label.add_updater(lambda m, s=spring: m.next_to(s.mass, RIGHT, buff=2))
 
             springs.add(spring)
             self.add(label)
 
         self.add(springs)
         self.wait(12)
+
+
+class SpringChain(InteractiveScene):
+    """
+    A chain of coupled springs, shown as the displacement of each mass.
+    A pulse splits in two, travels and reflects off the fixed ends; one
+    OscillatorBank integrates all the masses each frame.
+    """
+
+    def construct(self):
+        n_masses = 200
+        axes = Axes(
+            x_range=(0, n_masses, 20),
+            y_range=(-1.5, 1.5, 0.5),
+            width=12,
+            height=4,
+        )
+        self.add(axes)
+
+        # Gaussian pulse in the middle of the chain
+        indices = np.arange(n_masses)
+        x0 = np.exp(-((indices - n_masses / 2) / 6)**2)
+        physics = OscillatorBank(
+            x0=x0,
+            k=chain_stiffness(n_masses, k=400),
+            mu=0.02,
+            dt=0.005,
+            method="rk4",
+        )
+        self.add(physics)
+
+        masses = DotCloud(axes.c2p(indices, x0), radius=0.04)
+        masses.set_color(BLUE)
+        masses.add_updater(lambda m: m.set_points(axes.c2p(indices, physics.positions)))
+        self.add(masses)
+
+        title = Text(f"{n_masses} coupled oscillators", font_size=36)
+        title.to_edge(UP)
+        self.add(title)
+
+        self.wait(15)
@@ -5,26 +5,14 @@ Shows tokens being converted to embeddings and then updated through attention.
 
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import LiveDecimalMatrix, values_to_colors
 
-def value_to_color(
-    value,
-    low_positive_color=BLUE_E,
-    high_positive_color=BLUE_B,
-    low_negative_color=RED_E,
-    high_negative_color=RED_B,
-    min_value=0.0,
-    max_value=10.0
-):
-    """Map a value to a color based on sign and magnitude."""
-    alpha = clip(float(inverse_interpolate(min_value, max_value, abs(value))), 0, 1)
-    if value >= 0:
-        return interpolate_color(low_positive_color, high_positive_color, alpha)
-    else:
-        return interpolate_color(low_negative_color, high_negative_color, alpha)
-
-
-class NumericEmbedding(DecimalMatrix):
+
+class NumericEmbedding(LiveDecimalMatrix):
     """A column vector (embedding) with color-coded entries."""
     def __init__(
         self,
@@ -54,16 +42,18 @@ class NumericEmbedding(DecimalMatrix):
         self.reset_entry_colors()
 
     def reset_entry_colors(self):
-        for entry in self.get_entries():
-            entry.set_fill(color=value_to_color(
-                entry.get_value(),
-                low_positive_color=GREY_C,
-                high_positive_color=WHITE,
-                low_negative_color=GREY_C,
-                high_negative_color=WHITE,
-                min_value=0,
-                max_value=max(self.value_range),
-            ))
+        entries = self.get_entries()
+        colors = values_to_colors(
+            [entry.get_value() for entry in entries],
+            low_positive_color=GREY_C,
+            high_positive_color=WHITE,
+            low_negative_color=GREY_C,
+            high_negative_color=WHITE,
+            min_value=0,
+            max_value=max(self.value_range),
+        )
+        for entry, color in zip(entries, colors):
+            entry.set_fill(color=color)
         return self
 
 
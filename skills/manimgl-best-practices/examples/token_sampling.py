@@ -8,7 +8,11 @@ Run with: manimgl token_sampling.py TokenSamplingAnimation
 """
 from manimlib import *
 import numpy as np
-import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import RandomSchedule, choice_sampler, softmax
 
 
 class TokenSamplingAnimation(InteractiveScene):
@@ -40,12 +44,13 @@ class TokenSamplingAnimation(InteractiveScene):
         highlight.set_stroke(YELLOW, 3)
         highlight.set_fill(YELLOW, 0.25)
 
-        # Animate random sampling
-        seed = random.randint(0, 1000)
+        # Animate random sampling, with every choice drawn up front from a seed;
+        # the last one is the final selection
+        run_time = 2.5
+        schedule = RandomSchedule(choice_sampler(probs), run_time, frequency=6, seed=42)
 
         def highlight_randomly(rect, alpha):
-            np.random.seed(seed + int(15 * alpha))
-            index = np.random.choice(len(words), p=probs)
+            index = schedule.get_value(alpha * run_time, default=schedule.values[0])
             rect.surround(bar_groups[index], buff=0.05)
             rect.stretch(1.05, 0)
 
@@ -55,12 +60,12 @@ class TokenSamplingAnimation(InteractiveScene):
                 highlight,
                 lambda r, a: highlight_randomly(r, a)
             ),
-            run_time=2.5,
+            run_time=run_time,
             rate_func=linear
         )
 
         # Final selection
-        final_index = np.random.choice(len(words), p=probs)
+        final_index = schedule.final_value
         final_highlight = SurroundingRectangle(bar_groups[final_index], buff=0.05)
         final_highlight.set_stroke(GREEN, 4)
         final_highlight.set_fill(GREEN, 0.3)
@@ -105,17 +110,6 @@ class TemperatureSampling(InteractiveScene):
     """
 
     def construct(self):
-        def softmax(logits, temperature=1.0):
-            """Compute softmax with temperature scaling."""
-            logits = np.array(logits, dtype=float)
-            logits = logits - np.max(logits)
-            if temperature == 0:
-                result = np.zeros_like(logits)
-                result[np.argmax(logits)] = 1.0
-                return result
-            exps = np.exp(logits / temperature)
-            return exps / np.sum(exps)
-
         # Base logits (before softmax)
         logits = np.array([2.5, 2.0, 1.5, 1.0, 0.5])
         words = ["word1", "word2", "word3", "word4", "word5"]
@@ -125,9 +119,10 @@ class TemperatureSampling(InteractiveScene):
         temp_labels = ["T = 0.5 (focused)", "T = 1.0 (normal)", "T = 2.0 (creative)"]
 
         # Create three distributions side by side
+        # One softmax over a (temperature, token) array
+        all_probs = softmax(logits / np.array(temperatures)[:, np.newaxis])
         dist_groups = VGroup()
-        for temp, label in zip(temperatures, temp_labels):
-            probs = softmax(logits, temp)
+        for probs, label in zip(all_probs, temp_labels):
             bars = self.build_mini_distribution(probs)
             title = Text(label, font_size=22)
             title.next_to(bars, UP, buff=0.3)
@@ -11,6 +11,11 @@ Source: Inspired by 3b1b's vector field visualizations
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import FieldArrows, ParticleSystem, RingTracedPath
 
 
 class SimpleVectorField(InteractiveScene):
@@ -28,28 +33,19 @@ class SimpleVectorField(InteractiveScene):
         )
         self.add(plane)
 
-        # Create arrows manually for vector field
-        arrows = VGroup()
-        for x in np.arange(-3.5, 4, 0.7):
-            for y in np.arange(-2.5, 3, 0.7):
-                # Rotation field: F = (-y, x)
-                vx, vy = -y * 0.15, x * 0.15
-                if abs(vx) < 0.01 and abs(vy) < 0.01:
-                    continue
-
-                arrow = Arrow(
-                    start=[x, y, 0],
-                    end=[x + vx, y + vy, 0],
-                    buff=0,
-                    stroke_width=2,
-                    max_tip_length_to_length_ratio=0.3,
-                )
-                # Color by magnitude
-                mag = np.sqrt(vx**2 + vy**2)
-                arrow.set_color(interpolate_color(BLUE, YELLOW, mag / 0.5))
-                arrows.add(arrow)
-
-        self.play(LaggedStartMap(GrowArrow, arrows, lag_ratio=0.02, run_time=2))
+        # Rotation field F = (-y, x), all arrows in one mobject, colored by magnitude;
+        # vanishing vectors are drawn with zero length
+        arrows = FieldArrows(
+            lambda x, y: (-y * 0.15, x * 0.15),
+            plane,
+            x_samples=np.arange(-3.5, 4, 0.7),
+            y_samples=np.arange(-2.5, 3, 0.7),
+            low_color=BLUE,
+            high_color=YELLOW,
+            magnitude_range=(0, 0.5),
+        )
+
+        self.play(ShowCreation(arrows, run_time=2))
         self.wait()
 
         # Add a particle that follows the field
@@ -62,7 +58,8 @@ class SimpleVectorField(InteractiveScene):
             mob.shift(np.array([vx, vy, 0]) * dt)
 
         dot.add_updater(follow_field)
-        trail = TracedPath(dot.get_center, stroke_color=RED, stroke_width=2)
+        # Bounded ring buffer, so each frame costs the same however long the wait
+        trail = RingTracedPath(dot.get_center, stroke_color=RED, stroke_width=2)
 
         self.add(trail, dot)
         self.wait(8)
@@ -86,41 +83,29 @@ class GradientFieldDemo(InteractiveScene):
         # Scalar field: f(x,y) = -(x^2 + y^2) (peak at origin)
         # Gradient: (-2x, -2y) pointing toward origin
 
-        # Create dots colored by height
-        dots = VGroup()
-        for x in np.arange(-3.5, 4, 0.3):
-            for y in np.arange(-2.5, 3, 0.3):
-                val = -(x**2 + y**2)
-                t = (val + 25) / 25  # Normalize
-                color = interpolate_color(BLUE_E, RED, t)
-                dot = Dot([x, y, 0], radius=0.08, color=color)
-                dots.add(dot)
+        # Create dots colored by height, as one dot cloud
+        X, Y = np.meshgrid(np.arange(-3.5, 4, 0.3), np.arange(-2.5, 3, 0.3), indexing="ij")
+        dot_points = np.stack([X.ravel(), Y.ravel(), np.zeros(X.size)], axis=1)
+        t = (25 - (X**2 + Y**2).ravel()) / 25  # Normalize
+        rgbs = interpolate(color_to_rgb(BLUE_E), color_to_rgb(RED), t[:, np.newaxis])
+        dots = DotCloud(dot_points, radius=0.08)
+        dots.set_rgba_array(np.hstack([rgbs, np.ones((len(rgbs), 1))]))
 
         self.play(FadeIn(dots))
 
-        # Gradient vectors (pointing toward origin = uphill)
-        arrows = VGroup()
-        for x in np.arange(-3, 3.5, 0.8):
-            for y in np.arange(-2, 2.5, 0.8):
-                if abs(x) < 0.3 and abs(y) < 0.3:
-                    continue
-                # Gradient direction (toward origin for this function)
-                gx, gy = -2*x, -2*y
-                length = np.sqrt(gx**2 + gy**2)
-                # Normalize and scale
-                scale = 0.3
-                gx, gy = gx/length * scale, gy/length * scale
-
-                arrow = Arrow(
-                    start=[x, y, 0],
-                    end=[x + gx, y + gy, 0],
-                    buff=0,
-                    stroke_width=2,
-                    stroke_color=WHITE,
-                )
-                arrows.add(arrow)
-
-        self.play(LaggedStartMap(GrowArrow, arrows, lag_ratio=0.02, run_time=2))
+        # Gradient vectors (pointing toward origin = uphill), normalized to length 0.3
+        arrows = FieldArrows(
+            lambda x, y: (-2 * x, -2 * y),
+            plane,
+            x_samples=np.arange(-3, 3.5, 0.8),
+            y_samples=np.arange(-2, 2.5, 0.8),
+            length_func=lambda norms: np.full_like(norms, 0.3),
+            mask_func=lambda x, y: (np.abs(x) >= 0.3) | (np.abs(y) >= 0.3),
+            low_color=WHITE,
+            high_color=WHITE,
+        )
+
+        self.play(ShowCreation(arrows, run_time=2))
 
         # Label
         label = Tex(r"\nabla f = (-2x, -2y)", font_size=36)
@@ -130,6 +115,12 @@ class GradientFieldDemo(InteractiveScene):
         self.wait()
 
 
+def vortex_field(x, y):
+    """Unit-speed rotation about the origin, softened at the center"""
+    r = np.sqrt(x**2 + y**2) + 0.1
+    return -y / r, x / r
+
+
 class ParticleFlow(InteractiveScene):
     """
     Multiple particles flowing through a vector field.
@@ -145,39 +136,60 @@ class ParticleFlow(InteractiveScene):
         )
         self.add(plane)
 
-        # Create particles
+        # Particles start on a circle; the whole swarm moves as one array
         n_particles = 15
-        particles = VGroup()
-        trails = VGroup()
-
-        for i in range(n_particles):
-            # Start in a circle
-            angle = i * TAU / n_particles
-            start_pos = 2 * np.array([np.cos(angle), np.sin(angle), 0])
+        angles = np.arange(n_particles) * TAU / n_particles
+        start_points = 2 * np.array([np.cos(angles), np.sin(angles), np.zeros(n_particles)]).T
+
+        particles = ParticleSystem(
+            vortex_field,
+            start_points=start_points,
+            x_range=(-5, 5),
+            y_range=(-4, 4),
+            speed=0.8,
+            color=YELLOW,
+            radius=0.1,
+            trail_time=10,
+            n_trail_points=300,
+            trail_color=BLUE,
+            trail_width=1.5,
+            trail_opacity=0.7,
+        )
 
-            dot = Dot(start_pos, radius=0.1, color=YELLOW)
+        self.add(particles)
+        self.wait(10)
 
-            def make_updater():
-                def update(mob, dt):
-                    x, y = mob.get_center()[:2]
-                    r = np.sqrt(x**2 + y**2) + 0.1
-                    vx, vy = -y/r, x/r
-                    mob.shift(np.array([vx, vy, 0]) * dt * 0.8)
-                return update
 
-            dot.add_updater(make_updater())
+class DenseParticleFlow(InteractiveScene):
+    """
+    The same vortex with twenty thousand particles. Each one lives for
+    a few seconds before respawning somewhere random, leaving a short trail.
+    """
 
-            trail = TracedPath(
-                dot.get_center,
-                stroke_color=BLUE,
-                stroke_width=1.5,
-                stroke_opacity=0.7,
-            )
+    def construct(self):
+        plane = NumberPlane(
+            x_range=(-8, 8, 1),
+            y_range=(-4, 4, 1),
+            background_line_style={"stroke_opacity": 0.2}
+        )
+        self.add(plane)
 
-            particles.add(dot)
-            trails.add(trail)
+        particles = ParticleSystem(
+            vortex_field,
+            n_particles=20000,
+            speed=0.8,
+            lifetime=3,
+            color=YELLOW,
+            radius=0.015,
+            trail_time=0.5,
+            n_trail_points=8,
+            trail_color=BLUE,
+            trail_width=1,
+            trail_opacity=0.5,
+            seed=0,
+        )
 
-        self.add(trails, particles)
+        self.add(particles)
         self.wait(10)
 
 
@@ -202,47 +214,32 @@ class ElectricDipole(InteractiveScene):
 
         self.add(q_plus, q_plus_label, q_minus, q_minus_label)
 
-        # Create field arrows
-        arrows = VGroup()
-        for x in np.arange(-4, 4.5, 0.6):
-            for y in np.arange(-3, 3.5, 0.6):
-                pos = np.array([x, y, 0])
-
-                # Skip near charges
-                if np.linalg.norm(pos - q1_pos) < 0.5:
-                    continue
-                if np.linalg.norm(pos - q2_pos) < 0.5:
-                    continue
-
-                # Electric field from both charges
-                r1 = pos - q1_pos
-                r2 = pos - q2_pos
-                d1 = np.linalg.norm(r1) + 0.1
-                d2 = np.linalg.norm(r2) + 0.1
-
-                # E = kq/r^2 in direction of r (positive) or -r (negative)
-                E1 = r1 / d1**3  # From positive charge
-                E2 = -r2 / d2**3  # From negative charge
-                E = E1 + E2
-
-                mag = np.linalg.norm(E)
-                if mag < 0.001:
-                    continue
-
-                # Normalize and scale
-                E_norm = E / mag
-                length = min(0.4, mag * 2)
-
-                arrow = Arrow(
-                    start=pos,
-                    end=pos + E_norm * length,
-                    buff=0,
-                    stroke_width=2,
-                )
-                # Color by magnitude
-                color = interpolate_color(BLUE_E, YELLOW, min(mag * 5, 1))
-                arrow.set_color(color)
-                arrows.add(arrow)
-
-        self.play(LaggedStartMap(GrowArrow, arrows, lag_ratio=0.01, run_time=3))
+        # Electric field from both charges: E = kq/r^2 in direction of r
+        # (positive) or -r (negative), with a little softening
+        def electric_field(x, y):
+            d1 = np.sqrt((x - q1_pos[0])**2 + (y - q1_pos[1])**2) + 0.1
+            d2 = np.sqrt((x - q2_pos[0])**2 + (y - q2_pos[1])**2) + 0.1
+            ex = (x - q1_pos[0]) / d1**3 - (x - q2_pos[0]) / d2**3
+            ey = (y - q1_pos[1]) / d1**3 - (y - q2_pos[1]) / d2**3
+            return ex, ey
+
+        # Skip near charges
+        def away_from_charges(x, y):
+            return np.all([
+                (x - pos[0])**2 + (y - pos[1])**2 >= 0.5**2
+                for pos in (q1_pos, q2_pos)
+            ], axis=0)
+
+        arrows = FieldArrows(
+            electric_field,
+            x_samples=np.arange(-4, 4.5, 0.6),
+            y_samples=np.arange(-3, 3.5, 0.6),
+            length_func=lambda norms: np.minimum(0.4, norms * 2),
+            mask_func=away_from_charges,
+            low_color=BLUE_E,
+            high_color=YELLOW,
+            magnitude_range=(0, 0.2),
+        )
+
+        self.play(ShowCreation(arrows, run_time=3))
         self.wait()
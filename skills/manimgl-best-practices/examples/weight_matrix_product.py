@@ -6,62 +6,11 @@ demonstrating the row-by-vector dot product pattern.
 
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
 
-
-def value_to_color(
-    value,
-    low_positive_color=BLUE_E,
-    high_positive_color=BLUE_B,
-    low_negative_color=RED_E,
-    high_negative_color=RED_B,
-    min_value=0.0,
-    max_value=10.0
-):
-    """Map a value to a color based on sign and magnitude."""
-    alpha = clip(float(inverse_interpolate(min_value, max_value, abs(value))), 0, 1)
-    if value >= 0:
-        return interpolate_color(low_positive_color, high_positive_color, alpha)
-    else:
-        return interpolate_color(low_negative_color, high_negative_color, alpha)
-
-
-class WeightMatrix(DecimalMatrix):
-    """A matrix with color-coded entries based on value."""
-    def __init__(
-        self,
-        values=None,
-        shape=(5, 7),
-        value_range=(-9.9, 9.9),
-        ellipses_row=-2,
-        ellipses_col=-2,
-        num_decimal_places=1,
-        bracket_h_buff=0.1,
-        **kwargs
-    ):
-        if values is None:
-            values = np.random.uniform(*value_range, size=shape)
-        self.shape = shape
-        self.value_range = value_range
-        self.ellipses_row = ellipses_row
-
-        super().__init__(
-            values,
-            num_decimal_places=num_decimal_places,
-            bracket_h_buff=bracket_h_buff,
-            decimal_config=dict(include_sign=True),
-            ellipses_row=ellipses_row,
-            ellipses_col=ellipses_col,
-        )
-        self.reset_entry_colors()
-
-    def reset_entry_colors(self):
-        for entry in self.get_entries():
-            entry.set_fill(color=value_to_color(
-                entry.get_value(),
-                min_value=0,
-                max_value=max(self.value_range),
-            ))
-        return self
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import WeightMatrix
 
 
 class NumericEmbedding(WeightMatrix):
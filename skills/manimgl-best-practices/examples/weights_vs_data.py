@@ -5,56 +5,11 @@ Demonstrates: DecimalMatrix, VGroup organization, Transform animations
 from manimlib import *
 import numpy as np
 import random
+import sys
+from pathlib import Path
 
-
-def value_to_color(
-    value,
-    low_positive_color=BLUE_E,
-    high_positive_color=BLUE_B,
-    low_negative_color=RED_E,
-    high_negative_color=RED_B,
-    min_value=0.0,
-    max_value=10.0
-):
-    """Map a numeric value to a color gradient."""
-    alpha = clip(float(inverse_interpolate(min_value, max_value, abs(value))), 0, 1)
-    if value >= 0:
-        colors = (low_positive_color, high_positive_color)
-    else:
-        colors = (low_negative_color, high_negative_color)
-    return interpolate_color_by_hsl(*colors, alpha)
-
-
-class WeightMatrix(DecimalMatrix):
-    """A matrix displaying weight values with color coding."""
-
-    def __init__(
-        self,
-        values=None,
-        shape=(4, 6),
-        value_range=(-9.9, 9.9),
-        num_decimal_places=1,
-        **kwargs
-    ):
-        if values is None:
-            values = np.random.uniform(*value_range, size=shape)
-        self.value_range = value_range
-
-        super().__init__(
-            values,
-            num_decimal_places=num_decimal_places,
-            **kwargs
-        )
-        self.color_entries()
-
-    def color_entries(self):
-        for entry in self.get_entries():
-            entry.set_fill(color=value_to_color(
-                entry.get_value(),
-                min_value=0,
-                max_value=max(abs(self.value_range[0]), abs(self.value_range[1])),
-            ))
-        return self
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import WeightMatrix
 
 
 class NumericVector(DecimalMatrix):
@@ -109,7 +64,13 @@ class WeightsVsData(Scene):
 
         # Create weight matrices (model parameters)
         matrices = VGroup(*(
-            WeightMatrix(shape=(4, 5))
+            WeightMatrix(
+                shape=(4, 5),
+                ellipses_row=None,
+                ellipses_col=None,
+                bracket_h_buff=0.2,
+                decimal_config=dict(),
+            )
             for _ in range(2)
         ))
         matrices.arrange(DOWN, buff=0.5)
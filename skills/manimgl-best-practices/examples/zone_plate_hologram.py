@@ -11,6 +11,11 @@ Run: manimgl zone_plate_hologram.py ZonePlateCreation -w
 """
 from manimlib import *
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from helpers import ScalarFieldImage
 
 
 class ZonePlateCreation(Scene):
@@ -36,46 +41,29 @@ class ZonePlateCreation(Scene):
         # Point source position (behind the plate plane)
         source_pos = np.array([0, 0, source_distance])
 
-        # Create zone plate pattern
-        def get_zone_plate(resolution=200):
-            plate = VGroup()
-
-            # Sample grid on the plate
-            for i in range(resolution):
-                for j in range(resolution):
-                    x = (i / resolution - 0.5) * plate_size
-                    y = (j / resolution - 0.5) * plate_size
-                    point = np.array([x, y, 0])
-
-                    # Distance from point source
-                    r = np.linalg.norm(point - source_pos)
-
-                    # Phase from point source
-                    phase_obj = (r / wavelength) % 1
-
-                    # Phase from reference (plane wave from behind)
-                    phase_ref = (source_distance / wavelength) % 1
-
-                    # Interference pattern intensity
-                    phase_diff = (phase_obj - phase_ref) * TAU
-                    intensity = (1 + np.cos(phase_diff)) / 2
-
-                    # Create small square
-                    size = plate_size / resolution * 1.1
-                    square = Square(side_length=size)
-                    square.move_to([x, y, 0])
-                    square.set_stroke(width=0)
-                    square.set_fill(
-                        interpolate_color(BLACK, WHITE, intensity),
-                        opacity=1
-                    )
-                    plate.add(square)
-
-            return plate
-
-        # Create the pattern with increasing resolution
-        low_res = get_zone_plate(30)
-        self.play(FadeIn(low_res, lag_ratio=0.001))
+        # Zone plate pattern, sampled on the plate plane
+        def zone_plate_intensity(x, y):
+            # Distance from point source
+            r = np.sqrt((x - source_pos[0])**2 + (y - source_pos[1])**2 + source_pos[2]**2)
+
+            # Phase from point source
+            phase_obj = (r / wavelength) % 1
+
+            # Phase from reference (plane wave from behind)
+            phase_ref = (source_distance / wavelength) % 1
+
+            # Interference pattern intensity
+            phase_diff = (phase_obj - phase_ref) * TAU
+            return (1 + np.cos(phase_diff)) / 2
+
+        # One textured quad; raising the resolution rewrites its pixels
+        plate = ScalarFieldImage(
+            zone_plate_intensity,
+            width=plate_size,
+            height=plate_size,
+            resolution=30,
+        )
+        self.play(FadeIn(plate))
         self.wait()
 
         # Show it's made of concentric rings
@@ -87,18 +75,12 @@ class ZonePlateCreation(Scene):
         self.wait()
 
         # Increase resolution
-        mid_res = get_zone_plate(60)
-        self.play(
-            ReplacementTransform(low_res, mid_res),
-            run_time=2
-        )
+        resolution = ValueTracker(30)
+        plate.add_updater(lambda m: m.set_resolution(int(resolution.get_value())))
+        self.play(resolution.animate.set_value(60), run_time=2)
         self.wait()
 
-        high_res = get_zone_plate(100)
-        self.play(
-            ReplacementTransform(mid_res, high_res),
-            run_time=2
-        )
+        self.play(resolution.animate.set_value(100), run_time=2)
         self.wait(2)
 
 
@@ -291,31 +273,19 @@ class InterferenceBands(Scene):
         angle = 15 * DEGREES  # Angle between reference and object beams
 
         # Create interference pattern
-        def get_interference_bands(width=12, height=6, resolution=200):
-            bands = VGroup()
-
+        def get_band_intensity(angle):
             # The spacing of fringes depends on the angle between beams
             fringe_spacing = wavelength / (2 * np.sin(angle / 2))
 
-            for i in range(resolution):
-                x = (i / resolution - 0.5) * width
-
-                # Intensity from interference
-                intensity = (1 + np.cos(TAU * x / fringe_spacing)) / 2
-
-                # Create vertical strip
-                strip = Rectangle(width=width / resolution * 1.05, height=height)
-                strip.move_to([x, 0, 0])
-                strip.set_stroke(width=0)
-                strip.set_fill(
-                    interpolate_color(BLACK, WHITE, intensity),
-                    opacity=1
-                )
-                bands.add(strip)
-
-            return bands
+            # Intensity from interference, constant along each vertical strip
+            return lambda x, y: (1 + np.cos(TAU * x / fringe_spacing)) / 2
 
-        bands = get_interference_bands()
+        bands = ScalarFieldImage(
+            get_band_intensity(angle),
+            width=12,
+            height=6,
+            resolution=200,
+        )
         border = Rectangle(width=12, height=6)
         border.set_stroke(WHITE, 2)
 
@@ -340,28 +310,25 @@ class InterferenceBands(Scene):
         angle_label = Text("Decreasing angle = wider fringes", font_size=24)
         angle_label.to_corner(DR)
 
-        for new_angle in [10 * DEGREES, 5 * DEGREES]:
-            wavelength_local = wavelength
-            fringe_spacing = wavelength_local / (2 * np.sin(new_angle / 2))
-
-            new_bands = VGroup()
-            for i in range(200):
-                x = (i / 200 - 0.5) * 12
-                intensity = (1 + np.cos(TAU * x / fringe_spacing)) / 2
-                strip = Rectangle(width=12 / 200 * 1.05, height=6)
-                strip.move_to([x, 0, 0])
-                strip.set_stroke(width=0)
-                strip.set_fill(
-                    interpolate_color(BLACK, WHITE, intensity),
-                    opacity=1
-                )
-                new_bands.add(strip)
+        angle_tracker = ValueTracker(angle)
+        bands.angle = angle
+
+        def update_bands(bands):
+            # Only resample the field when the angle actually changed
+            new_angle = angle_tracker.get_value()
+            if new_angle != bands.angle:
+                bands.angle = new_angle
+                bands.set_func(get_band_intensity(new_angle))
 
+        bands.add_updater(update_bands)
+
+        for new_angle in [10 * DEGREES, 5 * DEGREES]:
             self.play(
-                Transform(bands, new_bands),
+                angle_tracker.animate.set_value(new_angle),
                 FadeIn(angle_label) if new_angle == 10 * DEGREES else Animation(angle_label),
                 run_time=2
             )
             self.wait()
 
+        bands.clear_updaters()
         self.wait()
@@ -0,0 +1 @@
+"""Shared test harness for the Manim CE and ManimGL skill files."""
@@ -0,0 +1,491 @@
+"""Render backends for the skill test harness.
+
+A backend describes everything that differs between Manim Community Edition
+and ManimGL: the import line, the snippet-filtering vocabulary, the default
+scene class and how a scene is rendered, both as a one-shot CLI command and
+inside a warm worker process. Everything else in the harness is shared.
+"""
+import functools
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import types
+from contextlib import contextmanager
+from importlib import metadata
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+SKILLS_ROOT = TESTS_DIR.parent / "skills"
+CACHE_ROOT = TESTS_DIR / ".cache"
+
+# Frame rate used by dry runs: `play` and `wait` only advance time and run
+# updaters, so a coarse step is enough to exercise them
+DRY_RUN_FRAME_RATE = 5
+
+# Prints the names `from <module> import *` provides, as a JSON list
+STAR_NAMES_SCRIPT = """
+import importlib, json, sys
+module = importlib.import_module(sys.argv[1])
+names = getattr(module, "__all__", None)
+if names is None:
+    names = [name for name in dir(module) if not name.startswith("_")]
+print(json.dumps(sorted(names)))
+"""
+
+
+def worker_env():
+    """Environment in which `python -m harness...` resolves from any cwd."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(TESTS_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def installed_version(package):
+    """Return the installed version of `package`, or 'unknown'."""
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def replace_function(package, original, replacement):
+    """Rebind `original` to `replacement` in every loaded module of `package`.
+
+    Modules import helpers by name (`from ... import tex_to_svg_file`), so
+    patching the defining module alone is not enough.
+    """
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name == package or module_name.startswith(package + ".")):
+            continue
+        for attr, value in list(vars(module).items()):
+            if value is original:
+                setattr(module, attr, replacement)
+
+
+class Backend:
+    """Base class for a manim flavour the harness can test."""
+
+    #: Short name, used for cache directories and worker start-up
+    name = None
+    #: Human readable name used in CLI help and output
+    display_name = None
+    #: Importable package and installed distribution name
+    module = None
+    distribution = None
+    #: Base class used when wrapping a snippet in a test scene
+    default_scene_class = "Scene"
+    #: Substrings marking shell commands, CLI examples and config files
+    cli_markers = ()
+    #: Flags passed to the CLI for every rendered block
+    render_flags = ()
+    #: Mobject classes compiled with LaTeX, prewarmed into the Tex cache
+    tex_classes = ()
+    #: (module, class, method) called for every animation and frame step,
+    #: hooked to report render progress to the watchdog
+    progress_methods = ()
+
+    @property
+    def import_line(self):
+        return f"from {self.module} import *"
+
+    @property
+    def import_markers(self):
+        return (f"from {self.module} import", f"import {self.module}")
+
+    @property
+    def skills_dir(self):
+        return SKILLS_ROOT / f"{self.name}-best-practices"
+
+    @property
+    def cache_dir(self):
+        """Per-backend directory for durations and cached results."""
+        return CACHE_ROOT / self.name
+
+    def provided_names(self):
+        """Names provided by `from <module> import *`.
+
+        They are computed in a subprocess, so importing the package cannot
+        touch the harness' own state, and cached on disk per installed version.
+        Raises RuntimeError when they cannot be determined, since without them
+        blocks using undefined names would be sent to render.
+        """
+        if hasattr(self, "_provided_names"):
+            return self._provided_names
+
+        version = installed_version(self.distribution)
+        if version == "unknown":
+            raise RuntimeError(
+                f"{self.distribution} is not installed for {sys.executable}; "
+                f"run the tests with the interpreter that has {self.display_name}"
+            )
+        cache_file = self.cache_dir / f"star-names-{version}.json"
+        try:
+            names = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            names = None
+
+        if names is None:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                try:
+                    result = subprocess.run(
+                        [sys.executable, "-c", STAR_NAMES_SCRIPT, self.module],
+                        capture_output=True, text=True, timeout=120, cwd=tmpdir,
+                    )
+                    names = json.loads(result.stdout.strip().splitlines()[-1])
+                except subprocess.TimeoutExpired:
+                    raise RuntimeError(f"Importing {self.module} timed out") from None
+                except (ValueError, IndexError):
+                    error = result.stderr.strip().splitlines()[-1:] or ["no output"]
+                    raise RuntimeError(f"Could not import {self.module}: {error[0]}") from None
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(names))
+            os.replace(tmp_path, cache_file)
+
+        self._provided_names = set(names)
+        return self._provided_names
+
+    def is_unsupported_snippet(self, code_block, has_scene_class):
+        """Flavour-specific reasons to skip a block; False by default."""
+        return False
+
+    def render_command(self, scene_file, scene_name, dry_run=False, stats_file=None):
+        """Command line rendering `scene_name` from `scene_file`.
+
+        Dry runs have no CLI equivalent and go through a one-shot worker,
+        which writes its render statistics to `stats_file` when given.
+        """
+        if dry_run:
+            command = [sys.executable, "-m", "harness.render_worker", self.name,
+                       "--scene-file", str(scene_file), "--scene", scene_name, "--dry-run"]
+            if stats_file:
+                command += ["--stats", str(stats_file)]
+            return command
+        return self.cli_command(scene_file, scene_name)
+
+    def batch_command(self, scene_file, scene_names, results_file):
+        """One-shot worker command dry-running several scenes of one file.
+
+        Per-scene results are appended to `results_file` as JSON lines.
+        """
+        command = [sys.executable, "-m", "harness.render_worker", self.name,
+                   "--scene-file", str(scene_file), "--dry-run", "--results", str(results_file)]
+        for scene_name in scene_names:
+            command += ["--scene", scene_name]
+        return command
+
+    def cli_command(self, scene_file, scene_name):
+        """The framework's own CLI invocation for a real render."""
+        raise NotImplementedError
+
+    def install_progress_hook(self, callback):
+        """Call `callback()` whenever a scene plays an animation or steps a frame."""
+        for module_name, class_name, method_name in self.progress_methods:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            method = getattr(cls, method_name)
+
+            @functools.wraps(method)
+            def hooked(*args, _method=method, **kwargs):
+                callback()
+                return _method(*args, **kwargs)
+
+            setattr(cls, method_name, hooked)
+
+    def install_tex_cache(self, tex_cache):
+        """Route LaTeX compilation through the shared `harness.texcache.TexCache`.
+
+        Called once per worker process, after the package is imported.
+        """
+        raise NotImplementedError
+
+    def render_in_process(self, scene_code, scene_name, workdir, dry_run=False,
+                          source_path=None):
+        """Render a scene inside a worker process; raises on failure.
+
+        The code is written to a file in `workdir` unless `source_path`
+        names the file it came from (example and template scenes). With
+        `dry_run`, `construct` runs against a null renderer: nothing is
+        rasterized or written, and animations only advance time and
+        updaters at `DRY_RUN_FRAME_RATE`.
+
+        Returns render statistics: the number of `play` calls and of frames
+        stepped through.
+        """
+        with self.loaded_scenes(scene_code, [scene_name], workdir, dry_run=dry_run,
+                                source_path=source_path) as render_scene:
+            return render_scene(scene_name)
+
+    def loaded_scenes(self, scene_code, scene_names, workdir, dry_run=False, source_path=None):
+        """Context manager loading a scene module once for several of its scenes.
+
+        Yields a function that renders one of `scene_names` by name and
+        returns its statistics (see `render_in_process`). Loading the module
+        and the framework configuration happens once, each scene is still
+        rendered with its own copy of the configuration.
+        """
+        raise NotImplementedError
+
+
+class ManimCEBackend(Backend):
+    name = "manimce"
+    display_name = "Manim CE"
+    module = "manim"
+    distribution = "manim"
+    default_scene_class = "Scene"
+    cli_markers = ('manim -', 'pip install', 'manim checkhealth', '```bash',
+                   '[CLI]', '[output]', '[renderer]')
+    render_flags = ("-ql", "--disable_caching", "--format", "png", "-s")
+    tex_classes = ("Tex", "MathTex")
+    progress_methods = (
+        ("manim.scene.scene", "Scene", "play"),
+        ("manim.scene.scene", "Scene", "update_to_time"),
+    )
+
+    def cli_command(self, scene_file, scene_name):
+        return ["uv", "run", "manim", *self.render_flags, str(scene_file), scene_name]
+
+    def install_tex_cache(self, tex_cache):
+        from manim import config
+        import manim.utils.tex_file_writing as tex_file_writing
+
+        compile_tex = tex_file_writing.tex_to_svg_file
+
+        def tex_to_svg_file(expression, environment=None, tex_template=None):
+            template = tex_template or config.tex_template
+            key = tex_cache.key(expression, environment, template.body)
+            # manim compiles into the per-render media directory; only the
+            # finished SVG is published to the shared cache
+            return tex_cache.get(
+                key, lambda: Path(compile_tex(expression, environment, tex_template)).read_text())
+
+        replace_function(self.module, compile_tex, tex_to_svg_file)
+
+    @contextmanager
+    def loaded_scenes(self, scene_code, scene_names, workdir, dry_run=False, source_path=None):
+        from manim import tempconfig
+
+        workdir = Path(workdir)
+        if source_path:
+            scene_file = Path(source_path)
+        else:
+            scene_file = workdir / "test_scene.py"
+            scene_file.write_text(scene_code)
+
+        module_name = "test_scene"
+        module = types.ModuleType(module_name)
+        module.__file__ = str(scene_file)
+        sys.modules[module_name] = module
+
+        # Equivalent of `manim -ql --disable_caching --format png -s`
+        render_config = {
+            "pixel_height": 480,
+            "pixel_width": 854,
+            "frame_rate": 15,
+            "disable_caching": True,
+            "format": "png",
+            "save_last_frame": True,
+            "write_to_movie": False,
+            "input_file": str(scene_file),
+            "media_dir": str(workdir / "media"),
+        }
+        if dry_run:
+            del render_config["format"]
+            render_config.update({
+                "dry_run": True,
+                "save_last_frame": False,
+                "frame_rate": DRY_RUN_FRAME_RATE,
+                "progress_bar": "none",
+            })
+
+        def render_scene(scene_name):
+            scene_class = module.__dict__.get(scene_name)
+            if scene_class is None:
+                raise NameError(f"Scene '{scene_name}' not found in generated code")
+            with tempconfig(render_config):
+                scene = scene_class()
+                if dry_run:
+                    # Keep the camera the scene chose (e.g. ThreeDCamera),
+                    # only drop rasterization and output
+                    scene.renderer.__class__ = null_cairo_renderer()
+                scene.render()
+            return {
+                "plays": scene.renderer.num_plays,
+                "frames": round(scene.renderer.time * render_config["frame_rate"]),
+            }
+
+        previous_cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            # Top-level `config.*` assignments in the block stay inside this
+            # context, so they cannot leak into later blocks on a warm worker
+            with tempconfig(render_config):
+                exec(compile(scene_code, str(scene_file), "exec"), module.__dict__)
+                yield render_scene
+        finally:
+            os.chdir(previous_cwd)
+            sys.modules.pop(module_name, None)
+
+
+class ManimGLBackend(Backend):
+    name = "manimgl"
+    display_name = "ManimGL"
+    module = "manimlib"
+    distribution = "manimgl"
+    # InteractiveScene is the default scene type for ManimGL
+    default_scene_class = "InteractiveScene"
+    cli_markers = ('manimgl ', 'pip install', '```bash', '[CLI]', '[output]', '[renderer]')
+    render_flags = ("--write_file",)
+    tex_classes = ("Tex", "TexText")
+    progress_methods = (
+        ("manimlib.scene.scene", "Scene", "play"),
+        ("manimlib.scene.scene", "Scene", "update_frame"),
+    )
+
+    def is_unsupported_snippet(self, code_block, has_scene_class):
+        code_lower = code_block.lower()
+        # Skip checkpoint functions and interactive features
+        if 'checkpoint_paste' in code_lower or 'save_state' in code_lower or 'undo' in code_lower or '.embed()' in code_lower:
+            if not has_scene_class:
+                return True
+
+        # Skip any code with .embed() as it opens interactive shell
+        return '.embed()' in code_block
+
+    def cli_command(self, scene_file, scene_name):
+        return ["manimgl", str(scene_file), scene_name, *self.render_flags]
+
+    def install_tex_cache(self, tex_cache):
+        import manimlib.utils.tex_file_writing as tex_file_writing
+
+        if hasattr(tex_file_writing, "latex_to_svg"):
+            # manimgl >= 1.7 returns the SVG content
+            compile_tex = tex_file_writing.latex_to_svg
+
+            def latex_to_svg(latex, template="", additional_preamble="", *args, **kwargs):
+                key = tex_cache.key(latex, template, additional_preamble)
+                path = tex_cache.get(
+                    key, lambda: compile_tex(latex, template, additional_preamble, *args, **kwargs))
+                return path.read_text()
+
+            replace_function(self.module, compile_tex, latex_to_svg)
+        else:
+            # manimgl 1.6 returns the path of the SVG file
+            compile_tex = tex_file_writing.tex_content_to_svg_file
+
+            def tex_content_to_svg_file(content, template, additional_preamble, short_tex):
+                key = tex_cache.key(content, template, additional_preamble)
+                return str(tex_cache.get(
+                    key, lambda: Path(compile_tex(content, template, additional_preamble,
+                                                  short_tex)).read_text()))
+
+            replace_function(self.module, compile_tex, tex_content_to_svg_file)
+
+    @contextmanager
+    def loaded_scenes(self, scene_code, scene_names, workdir, dry_run=False, source_path=None):
+        import manimlib.config
+        import manimlib.extract_scene
+        import manimlib.scene.scene
+
+        workdir = Path(workdir)
+        if source_path:
+            scene_file = Path(source_path)
+        else:
+            scene_file = workdir / "test_scene.py"
+            scene_file.write_text(scene_code)
+
+        # Equivalent of `manimgl test_scene.py <scenes> --write_file`; the
+        # configuration (and the scene module) is rebuilt for every request.
+        previous_argv = sys.argv
+        previous_cwd = os.getcwd()
+        sys.argv = ["manimgl", str(scene_file), *scene_names, *self.render_flags]
+        previous_camera = manimlib.scene.scene.Camera
+        os.chdir(workdir)
+
+        def render_scene(scene_name):
+            scenes = manimlib.extract_scene.main(dict(config, scene_names=[scene_name]))
+            if not scenes:
+                raise NameError(f"Scene '{scene_name}' not found in generated code")
+            for scene in scenes:
+                scene.run()
+            fps = config["camera_config"].get("fps", 30)
+            return {
+                "plays": sum(scene.num_plays for scene in scenes),
+                "frames": sum(round(scene.time * fps) for scene in scenes),
+            }
+
+        try:
+            args = manimlib.config.parse_cli()
+            config = manimlib.config.get_configuration(args)
+            if dry_run:
+                config["file_writer_config"].update(write_to_movie=False, save_last_frame=False)
+                config["camera_config"]["fps"] = DRY_RUN_FRAME_RATE
+                config["skip_animations"] = False
+                manimlib.scene.scene.Camera = null_gl_camera()
+            yield render_scene
+        finally:
+            manimlib.scene.scene.Camera = previous_camera
+            sys.argv = previous_argv
+            os.chdir(previous_cwd)
+
+
+@functools.lru_cache(maxsize=None)
+def null_cairo_renderer():
+    """A Manim CE CairoRenderer that never rasterizes or writes frames."""
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    class NullCairoRenderer(CairoRenderer):
+        def update_frame(self, *args, **kwargs):
+            pass
+
+        def render(self, scene, time, moving_mobjects):
+            self.add_frame(None)
+
+        def get_frame(self):
+            return None
+
+        def add_frame(self, frame, num_frames=1):
+            self.time += num_frames / self.camera.frame_rate
+
+        def scene_finished(self, scene):
+            pass
+
+    return NullCairoRenderer
+
+
+@functools.lru_cache(maxsize=None)
+def null_gl_camera():
+    """A ManimGL camera with a real frame but no OpenGL context."""
+    from manimlib.camera.camera_frame import CameraFrame
+
+    class NullCamera:
+        def __init__(self, frame_config=None, fps=DRY_RUN_FRAME_RATE, **kwargs):
+            self.frame = CameraFrame(**(frame_config or {}))
+            self.fps = fps
+            self.window = None
+
+        def capture(self, *mobjects, **kwargs):
+            pass
+
+        def clear(self):
+            pass
+
+        def get_image(self):
+            return None
+
+        def __getattr__(self, name):
+            # Any other camera call (textures, uniforms, fbo management)
+            # has nothing to act on without a context
+            return lambda *args, **kwargs: None
+
+    return NullCamera
+
+
+BACKENDS = {backend.name: backend for backend in (ManimCEBackend, ManimGLBackend)}
+
+
+def get_backend(name):
+    """Instantiate the backend registered under `name`."""
+    return BACKENDS[name]()
@@ -0,0 +1,237 @@
+"""Extracting, filtering and rendering the code blocks of skill markdown files.
+
+Every function that depends on the manim flavour takes a `Backend` from
+`harness.backends`.
+"""
+import ast
+import json
+import re
+import tempfile
+import subprocess
+import time
+from pathlib import Path
+
+from harness.backends import worker_env
+from harness.classify import classify_block, find_scene_classes, parse_block
+
+
+def extract_python_code_blocks(markdown_content):
+    """Extract Python code blocks from markdown content."""
+    pattern = r'```python\n(.*?)```'
+    matches = re.findall(pattern, markdown_content, re.DOTALL)
+    return matches
+
+
+def extract_scene_classes(code):
+    """Extract Scene class names from Python code."""
+    try:
+        return find_scene_classes(parse_block(code))
+    except SyntaxError:
+        pattern = r'class\s+(\w+)\s*\((.*?Scene.*?)\):'
+        matches = re.findall(pattern, code)
+        return [match[0] for match in matches]
+
+
+def is_executable_code(code_block, backend):
+    """Check if a code block is executable Python code."""
+    return classify_block(code_block, backend, backend.provided_names()).reason is None
+
+
+def create_test_scene_from_code(code_block, test_name, backend, scene_classes=None):
+    """Create a complete test scene from a code block."""
+    has_imports = any(marker in code_block for marker in backend.import_markers)
+    if scene_classes is None:
+        scene_classes = extract_scene_classes(code_block)
+
+    if scene_classes:
+        if not has_imports:
+            return f"{backend.import_line}\n\n{code_block}"
+        return code_block
+
+    # Wrap snippet in a test scene
+    lines = [line for line in code_block.split('\n') if line.strip()]
+    indented_code = '\n'.join('        ' + line for line in lines)
+
+    test_code = f"""{backend.import_line}
+
+class {test_name}({backend.default_scene_class}):
+    def construct(self):
+{indented_code}
+"""
+    return test_code
+
+
+def top_level_names(code):
+    """Names a module binds at top level, other than through imports.
+
+    Blocks that bind the same name cannot share a batch module.
+    """
+    try:
+        tree = parse_block(code)
+    except SyntaxError:
+        return None
+    names = set()
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign, ast.For, ast.With)):
+            names.update(target.id for target in ast.walk(node)
+                         if isinstance(target, ast.Name) and isinstance(target.ctx, ast.Store))
+    return names
+
+
+def create_batch_module(blocks):
+    """Pack the generated scene code of several blocks into one module.
+
+    Each block keeps its own scene class; a comment names the file and block
+    each part comes from.
+    """
+    parts = [f"# ---- {block['file']} {block['item']} ----\n{block['scene_code']}"
+             for block in blocks]
+    return "\n\n".join(parts)
+
+
+def timeout_error(seconds):
+    return f"Scene rendering timed out after {seconds:g} seconds"
+
+
+def stall_error(seconds):
+    return f"Scene rendering stalled: no progress for {seconds:g} seconds"
+
+
+def is_timeout(error):
+    """Whether a render error is a timeout or a stall rather than a failure."""
+    return error.startswith(("Scene rendering timed out", "Scene rendering stalled"))
+
+
+def run_scene(scene_code, scene_name, backend, timeout=30, dry_run=False, source_path=None):
+    """Render a scene with a one-shot process and check for errors.
+
+    When `source_path` is given the scene is rendered from that file
+    instead of a temporary copy of `scene_code`.
+
+    Returns a (success, error_message, duration, stats) tuple. `stats` holds
+    the render statistics of dry runs and is empty for CLI renders.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if source_path:
+            scene_file = Path(source_path)
+        else:
+            scene_file = Path(tmpdir) / "test_scene.py"
+            scene_file.write_text(scene_code)
+
+        stats_file = Path(tmpdir) / "stats.json"
+        cmd = backend.render_command(scene_file, scene_name, dry_run=dry_run,
+                                     stats_file=stats_file)
+
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=tmpdir,
+                env=worker_env()
+            )
+
+            duration = time.perf_counter() - start
+            try:
+                stats = json.loads(stats_file.read_text())
+            except (OSError, ValueError):
+                stats = {}
+
+            if result.returncode == 0:
+                return True, "", duration, stats
+            else:
+                error_msg = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
+                return False, error_msg, duration, stats
+
+        except subprocess.TimeoutExpired:
+            return False, timeout_error(timeout), timeout, {}
+        except Exception as e:
+            return False, f"Error running scene: {str(e)}", time.perf_counter() - start, {}
+
+
+def run_batch(scene_code, scene_names, backend, timeouts, dry_run=True):
+    """Dry-run several scenes of one module in a single one-shot process.
+
+    `timeouts` holds the timeout of each scene; the process gets their sum.
+    Returns a dict mapping scene names to (success, error_message, duration,
+    stats) tuples. Scenes missing from it were not rendered, because the
+    module failed to load or an earlier scene used up the time.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scene_file = Path(tmpdir) / "test_batch.py"
+        scene_file.write_text(scene_code)
+        results_file = Path(tmpdir) / "results.jsonl"
+        cmd = backend.batch_command(scene_file, scene_names, results_file)
+
+        timed_out = False
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, timeout=sum(timeouts),
+                           cwd=tmpdir, env=worker_env())
+        except subprocess.TimeoutExpired:
+            timed_out = True
+
+        try:
+            lines = results_file.read_text().splitlines()
+        except OSError:
+            lines = []
+        for line in lines:
+            message = json.loads(line)
+            if message['scene'] is not None:
+                results[message['scene']] = (message['success'], message['error'],
+                                             message['duration'], message['stats'])
+        if timed_out and lines and len(results) < len(scene_names):
+            # Scenes run in order, so the first one without a result hung
+            scene_name = scene_names[len(results)]
+            timeout = timeouts[len(results)]
+            results[scene_name] = (False, timeout_error(timeout), timeout, {})
+    return results
+
+
+def prepare_markdown_blocks(markdown_path, backend):
+    """Extract the executable blocks of a markdown file as render jobs.
+
+    Returns (blocks, skipped) where each block is a dict with the block
+    index, the original code and the generated scene code and scene name,
+    and each skipped entry holds the block index and the reason it was
+    skipped (see `harness.classify`).
+    """
+    content = markdown_path.read_text()
+    code_blocks = extract_python_code_blocks(content)
+    provided_names = backend.provided_names()
+
+    blocks = []
+    skipped = []
+    for idx, code_block in enumerate(code_blocks):
+        info = classify_block(code_block, backend, provided_names)
+        if info.reason is not None:
+            skipped.append({'idx': idx, 'reason': info.reason, 'detail': info.detail})
+            continue
+
+        test_name = f"Test{markdown_path.stem.title().replace('-', '')}_{idx}"
+        scene_code = create_test_scene_from_code(code_block, test_name, backend, info.scene_classes)
+        scene_name = info.scene_classes[0] if info.scene_classes else test_name
+
+        blocks.append({
+            'idx': idx,
+            'code': code_block,
+            'scene_code': scene_code,
+            'scene_name': scene_name,
+        })
+    return blocks, skipped
+
+
+def format_stats(stats):
+    """Render statistics as a suffix for progress lines, e.g. ', 412 MB, 90 frames, 6 plays'."""
+    parts = []
+    if stats.get('peak_rss_mb') is not None:
+        parts.append(f"{stats['peak_rss_mb']:.0f} MB")
+    if stats.get('frames') is not None:
+        parts.append(f"{stats['frames']} frames")
+    if stats.get('plays') is not None:
+        parts.append(f"{stats['plays']} plays")
+    return "".join(f", {part}" for part in parts)
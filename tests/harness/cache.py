@@ -0,0 +1,80 @@
+"""On-disk cache of passing code-block renders.
+
+A block is identified by a hash of its generated scene code and scene name,
+the installed manim/manimgl version and the render flags, so editing one
+block in a markdown file only re-renders that block. Only passes are
+recorded; failures always re-run.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from harness.backends import installed_version
+
+
+class ResultCache:
+    """Content-addressed store of block keys that rendered successfully.
+
+    Entries are evicted when older than `max_age_days` or, least recently
+    used first, when there are more than `max_entries` of them.
+    """
+
+    def __init__(self, backend, dry_run=False, directory=None, max_entries=5000,
+                 max_age_days=30):
+        self.flags = list(backend.render_flags) + (["--dry-run"] if dry_run else [])
+        self.version = installed_version(backend.distribution)
+        self.directory = Path(directory or backend.cache_dir / "results")
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 24 * 60 * 60
+
+    def key(self, scene_code, scene_name):
+        payload = json.dumps([scene_code, scene_name, self.version, self.flags])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.json"
+
+    def has_pass(self, key):
+        """Whether `key` has a recorded pass; refreshes its LRU timestamp."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                return False
+            os.utime(path)
+        except OSError:
+            return False
+        return True
+
+    def record_pass(self, key, **info):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(dict(info, version=self.version, flags=self.flags)))
+        os.replace(tmp_path, path)
+
+    def evict(self):
+        """Drop expired entries, then the least recently used over the limit.
+
+        Returns the number of removed entries.
+        """
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+
+        now = time.time()
+        expired = [path for mtime, path in entries if now - mtime > self.max_age]
+        fresh = sorted((entry for entry in entries if now - entry[0] <= self.max_age),
+                       reverse=True)
+        stale = expired + [path for _, path in fresh[self.max_entries:]]
+        for path in stale:
+            path.unlink(missing_ok=True)
+        return len(stale)
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,275 @@
+"""AST-based classification of markdown code blocks.
+
+Each block is parsed once. Blocks that cannot run are rejected with a reason
+code before any render process is started:
+
+- ``empty``: nothing but comments and imports
+- ``shell-command``: CLI invocations, shell commands and config files
+- ``syntax-error``: not valid Python
+- ``unsupported``: needs an interactive session (backend specific)
+- ``undefined-names``: uses names that are neither defined in the block nor
+  provided by the backend's ``from manim import *`` / ``from manimlib import *``
+- ``no-effect``: only lists names or constants, e.g. color or rate function
+  listings
+
+Scene classes are detected structurally: a class whose base is named
+``*Scene`` or is another scene class from the same block.
+"""
+import ast
+import builtins
+import textwrap
+from collections import namedtuple
+
+EMPTY = "empty"
+SHELL_COMMAND = "shell-command"
+SYNTAX_ERROR = "syntax-error"
+UNSUPPORTED = "unsupported"
+UNDEFINED_NAMES = "undefined-names"
+NO_EFFECT = "no-effect"
+
+MODULE_NAMES = {"__file__", "__name__", "__doc__", "__builtins__", "__spec__"}
+
+BlockInfo = namedtuple("BlockInfo", ["reason", "detail", "scene_classes"])
+
+
+def parse_block(code_block):
+    """Parse a code block, tolerating a common leading indentation."""
+    return ast.parse(textwrap.dedent(code_block))
+
+
+def find_scene_classes(tree):
+    """Names of the classes in `tree` that derive from a Scene, in order."""
+    scene_classes = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for base in node.bases:
+            base_name = _dotted_tail(base)
+            if base_name and (base_name.endswith("Scene") or base_name in scene_classes):
+                scene_classes.append(node.name)
+                break
+    return scene_classes
+
+
+def _dotted_tail(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+class _Scope:
+    def __init__(self, kind, parent):
+        self.kind = kind
+        self.parent = parent
+        self.bound = set()
+        self.loads = set()
+
+
+class _FreeNameFinder(ast.NodeVisitor):
+    """Collect the names a module reads without binding them anywhere.
+
+    Scopes follow Python's rules: a name bound anywhere in a function is
+    local to it, class bodies are not visible from their methods and
+    comprehensions get their own scope.
+    """
+
+    def __init__(self, predefined=()):
+        self.module = _Scope("module", None)
+        self.module.bound.update(predefined)
+        self.scope = self.module
+        self.scopes = [self.module]
+        self.star_imports = []
+
+    def _push(self, kind):
+        scope = _Scope(kind, self.scope)
+        self.scopes.append(scope)
+        self.scope = scope
+        return scope
+
+    def _pop(self):
+        self.scope = self.scope.parent
+
+    def free_names(self):
+        free = set()
+        for scope in self.scopes:
+            for name in scope.loads:
+                if not self._resolves(scope, name):
+                    free.add(name)
+        return free
+
+    @staticmethod
+    def _resolves(scope, name):
+        if name in scope.bound:
+            return True
+        scope = scope.parent
+        while scope is not None:
+            if scope.kind != "class" and name in scope.bound:
+                return True
+            scope = scope.parent
+        return False
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load):
+            self.scope.loads.add(node.id)
+        else:
+            self.scope.bound.add(node.id)
+
+    def visit_Import(self, node):
+        for alias in node.names:
+            self.scope.bound.add(alias.asname or alias.name.split(".")[0])
+
+    def visit_ImportFrom(self, node):
+        for alias in node.names:
+            if alias.name == "*":
+                self.star_imports.append(node.module)
+            else:
+                self.scope.bound.add(alias.asname or alias.name)
+
+    def visit_Global(self, node):
+        self.module.bound.update(node.names)
+
+    def visit_Nonlocal(self, node):
+        self.scope.bound.update(node.names)
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            self.scope.bound.add(node.name)
+        self.generic_visit(node)
+
+    def visit_NamedExpr(self, node):
+        scope = self.scope
+        while scope.kind == "comprehension":
+            scope = scope.parent
+        scope.bound.add(node.target.id)
+        self.visit(node.value)
+
+    def visit_MatchAs(self, node):
+        if node.name:
+            self.scope.bound.add(node.name)
+        self.generic_visit(node)
+
+    def visit_MatchStar(self, node):
+        if node.name:
+            self.scope.bound.add(node.name)
+
+    def visit_MatchMapping(self, node):
+        if node.rest:
+            self.scope.bound.add(node.rest)
+        self.generic_visit(node)
+
+    def _visit_arguments(self, args):
+        """Visit defaults and annotations in the enclosing scope."""
+        for default in args.defaults + [d for d in args.kw_defaults if d is not None]:
+            self.visit(default)
+        all_args = args.posonlyargs + args.args + args.kwonlyargs
+        all_args += [a for a in (args.vararg, args.kwarg) if a is not None]
+        for arg in all_args:
+            if arg.annotation is not None:
+                self.visit(arg.annotation)
+        return [arg.arg for arg in all_args]
+
+    def visit_FunctionDef(self, node):
+        self.scope.bound.add(node.name)
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        if node.returns is not None:
+            self.visit(node.returns)
+        arg_names = self._visit_arguments(node.args)
+        self._push("function").bound.update(arg_names)
+        for statement in node.body:
+            self.visit(statement)
+        self._pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        arg_names = self._visit_arguments(node.args)
+        self._push("function").bound.update(arg_names)
+        self.visit(node.body)
+        self._pop()
+
+    def visit_ClassDef(self, node):
+        self.scope.bound.add(node.name)
+        for expr in node.decorator_list + node.bases + [k.value for k in node.keywords]:
+            self.visit(expr)
+        self._push("class")
+        for statement in node.body:
+            self.visit(statement)
+        self._pop()
+
+    def _visit_comprehension(self, node, elements):
+        # The first iterable is evaluated in the enclosing scope
+        self.visit(node.generators[0].iter)
+        self._push("comprehension")
+        for index, generator in enumerate(node.generators):
+            if index:
+                self.visit(generator.iter)
+            self.visit(generator.target)
+            for condition in generator.ifs:
+                self.visit(condition)
+        for element in elements:
+            self.visit(element)
+        self._pop()
+
+    def visit_ListComp(self, node):
+        self._visit_comprehension(node, [node.elt])
+
+    visit_SetComp = visit_ListComp
+    visit_GeneratorExp = visit_ListComp
+
+    def visit_DictComp(self, node):
+        self._visit_comprehension(node, [node.key, node.value])
+
+
+def free_names(tree, predefined=()):
+    """Return (free_names, star_imported_modules) of a parsed module."""
+    finder = _FreeNameFinder(predefined)
+    finder.visit(tree)
+    return finder.free_names(), finder.star_imports
+
+
+def _has_effect(statement):
+    """Whether a statement does more than name a value."""
+    if not isinstance(statement, ast.Expr):
+        return True
+    return any(isinstance(node, (ast.Call, ast.Await, ast.Yield, ast.YieldFrom))
+               for node in ast.walk(statement.value))
+
+
+def classify_block(code_block, backend, provided_names):
+    """Classify a markdown code block.
+
+    `provided_names` is the set of names the backend's star import provides
+    (see `Backend.provided_names`). Returns a BlockInfo whose `reason` is
+    None for blocks that should be rendered.
+    """
+    if any(marker in code_block for marker in backend.cli_markers):
+        return BlockInfo(SHELL_COMMAND, "", [])
+
+    try:
+        tree = parse_block(code_block)
+    except SyntaxError as e:
+        return BlockInfo(SYNTAX_ERROR, f"line {e.lineno}: {e.msg}", [])
+
+    scene_classes = find_scene_classes(tree)
+    statements = [s for s in tree.body if not isinstance(s, (ast.Import, ast.ImportFrom))]
+    if not statements:
+        return BlockInfo(EMPTY, "", scene_classes)
+
+    if backend.is_unsupported_snippet(code_block, bool(scene_classes)):
+        return BlockInfo(UNSUPPORTED, "", scene_classes)
+
+    if not scene_classes and not any(_has_effect(s) for s in statements):
+        return BlockInfo(NO_EFFECT, "", scene_classes)
+
+    # Snippets without a scene are wrapped in `construct(self)`
+    predefined = () if scene_classes else ("self",)
+    free, star_imports = free_names(tree, predefined)
+    if all(module == backend.module for module in star_imports):
+        undefined = free - provided_names - set(dir(builtins)) - MODULE_NAMES
+        if undefined:
+            return BlockInfo(UNDEFINED_NAMES, ", ".join(sorted(undefined)), scene_classes)
+
+    return BlockInfo(None, "", scene_classes)
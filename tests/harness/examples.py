@@ -0,0 +1,90 @@
+"""Discovery of the Scene classes in a skill's examples/ and templates/.
+
+Every Scene subclass found in those Python files becomes one job, rendered
+from the file itself so that relative helper imports keep working. Files
+without a Scene (shared helper modules) produce no jobs.
+"""
+import ast
+
+from harness.classify import find_scene_classes, parse_block
+from harness.scheduler import new_file_result
+
+EXAMPLE_DIRS = ("examples", "templates")
+
+
+def find_example_files(backend):
+    """All Python files under the skill's examples/ and templates/ directories."""
+    files = []
+    for dirname in EXAMPLE_DIRS:
+        files.extend(path for path in (backend.skills_dir / dirname).rglob("*.py")
+                     if path.name != "__init__.py")
+    return sorted(files)
+
+
+def _local_import_sources(path, tree):
+    """Source of the modules next to `path` that its code imports.
+
+    Examples import shared helpers from their own directory (CE
+    `examples/attention/helpers.py`, GL `examples/helpers/`), so a helper
+    change has to invalidate the cached results of the scenes.
+    """
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level <= 1:
+            names.add(node.module.split(".")[0])
+
+    files = []
+    for name in sorted(names):
+        module = path.parent / f"{name}.py"
+        package = path.parent / name
+        if module.exists():
+            files.append(module)
+        elif (package / "__init__.py").exists():
+            files.extend(sorted(package.rglob("*.py")))
+    return "".join(file.read_text() for file in files if file != path)
+
+
+def collect_example_jobs(paths, backend):
+    """Turn every Scene class of the given files into a render job.
+
+    Returns (jobs, file_results) in the same shape as
+    `harness.scheduler.collect_jobs`.
+    """
+    jobs = []
+    file_results = {}
+    for path in paths:
+        path = path.resolve()
+        try:
+            name = str(path.relative_to(backend.skills_dir))
+        except ValueError:
+            name = path.name
+        try:
+            source = path.read_text()
+            tree = parse_block(source)
+        except (OSError, SyntaxError) as e:
+            result = new_file_result(name)
+            result['failed'] = 1
+            result['error'] = str(e)
+            file_results[name] = result
+            continue
+
+        scene_classes = find_scene_classes(tree)
+        if not scene_classes:
+            continue
+        file_results[name] = new_file_result(name)
+        cache_source = source + _local_import_sources(path, tree)
+        for scene_name in scene_classes:
+            jobs.append({
+                'idx': scene_name,
+                'item': scene_name,
+                'code': source,
+                'scene_code': source,
+                'scene_name': scene_name,
+                'source_path': str(path),
+                'cache_source': cache_source,
+                'file': name,
+                'key': f"{name}:{scene_name}",
+            })
+    return jobs, file_results
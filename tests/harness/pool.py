@@ -0,0 +1,306 @@
+"""Pool of warm render workers for the skill test harness.
+
+Each worker is a long-lived `harness.render_worker` process that imports the
+backend's manim package once and then renders scenes sent over a pipe.
+Workers that crash, hang or reach their task limit are transparently
+restarted.
+
+A render is killed when it exceeds its timeout, or when it stops making
+progress: once a scene has started playing animations, the worker reports
+progress at least every second, and a worker that goes quiet for
+`stall_timeout` seconds is considered hung.
+
+`render_batch` sends several scenes of one module in a single request and
+collects one result per scene.
+"""
+import json
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from harness.backends import worker_env
+from harness.blocks import stall_error, timeout_error
+
+
+class WorkerStartupError(RuntimeError):
+    """Raised when a render worker cannot be started."""
+
+
+class RenderWorker:
+    """A single warm render process speaking the JSON-lines protocol."""
+
+    def __init__(self, backend, startup_timeout=120, max_tasks=100, max_restarts=3):
+        self.backend = backend
+        self.startup_timeout = startup_timeout
+        self.max_tasks = max_tasks
+        self.max_restarts = max_restarts
+        self.proc = None
+        self.tasks_done = 0
+        self._messages = None
+        self._log = None
+        self._next_id = 0
+
+    @property
+    def alive(self):
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self):
+        """Start the worker process, retrying up to `max_restarts` times."""
+        last_error = None
+        for _ in range(self.max_restarts):
+            try:
+                self._spawn()
+                return
+            except WorkerStartupError as e:
+                last_error = e
+                self.stop()
+        raise WorkerStartupError(f"Render worker failed to start: {last_error}")
+
+    def _spawn(self):
+        self._log = tempfile.TemporaryFile(mode="w+")
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "harness.render_worker", self.backend.name],
+            env=worker_env(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._log,
+            text=True,
+            bufsize=1,
+        )
+        self.tasks_done = 0
+        self._messages = queue.Queue()
+        threading.Thread(
+            target=self._read_messages,
+            args=(self.proc.stdout, self._messages),
+            daemon=True,
+        ).start()
+
+        try:
+            message = self._wait_for_message(self.startup_timeout)
+        except TimeoutError:
+            raise WorkerStartupError(f"no ready message after {self.startup_timeout} seconds")
+        if message is None or message.get("type") != "ready":
+            raise WorkerStartupError(self._log_tail() or "no ready message")
+
+    @staticmethod
+    def _read_messages(stream, messages):
+        for line in stream:
+            try:
+                messages.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        messages.put(None)
+
+    def _wait_for_message(self, timeout):
+        try:
+            return self._messages.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError
+
+    def _wait_for_result(self, request_id, start, timeout, stall_timeout):
+        """Wait for the result of a request, watching its progress messages.
+
+        The stall watchdog only starts with the first progress message, so
+        slow setup code in `construct` is bounded by `timeout` alone.
+        Raises TimeoutError with the error message on a timeout or stall.
+        """
+        deadline = start + timeout
+        stall_deadline = None
+        while True:
+            now = time.perf_counter()
+            wait = deadline - now
+            if stall_deadline is not None:
+                wait = min(wait, stall_deadline - now)
+            try:
+                message = self._wait_for_message(max(wait, 0))
+            except TimeoutError:
+                if stall_deadline is not None and stall_deadline < deadline:
+                    raise TimeoutError(stall_error(stall_timeout))
+                raise TimeoutError(timeout_error(timeout))
+            if message is None or message.get("type") != "progress":
+                return message
+            if stall_timeout and message.get("id") == request_id:
+                stall_deadline = time.perf_counter() + stall_timeout
+
+    def _log_tail(self, size=2000):
+        if self._log is None:
+            return ""
+        self._log.flush()
+        self._log.seek(0)
+        return self._log.read()[-size:]
+
+    def stop(self):
+        """Terminate the worker process."""
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+            self.proc = None
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def render(self, scene_code, scene_name, timeout=30, dry_run=False, source_path=None,
+               stall_timeout=None):
+        """Render a scene and return (success, error_message, duration, stats).
+
+        `dry_run` and `source_path` are passed on to
+        `Backend.render_in_process`; `stats` holds the render statistics the
+        worker reported (empty when it timed out or crashed). With
+        `stall_timeout`, the render is also killed when the scene stops
+        reporting progress for that long.
+        """
+        if not self.alive or self.tasks_done >= self.max_tasks:
+            self.restart()
+
+        self._next_id += 1
+        request_id = self._next_id
+        start = time.perf_counter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            request = {
+                "id": request_id,
+                "code": scene_code,
+                "scene": scene_name,
+                "workdir": tmpdir,
+                "dry_run": dry_run,
+                "source_path": source_path,
+            }
+            try:
+                self.proc.stdin.write(json.dumps(request) + "\n")
+                self.proc.stdin.flush()
+                message = self._wait_for_result(request_id, start, timeout, stall_timeout)
+            except TimeoutError as e:
+                self.proc.kill()
+                self.restart()
+                return False, str(e), time.perf_counter() - start, {}
+            except OSError:
+                message = None
+
+            duration = time.perf_counter() - start
+            if message is None:
+                exit_code = self.proc.wait()
+                tail = self._log_tail()
+                self.restart()
+                return (False, f"Render worker crashed (exit code {exit_code})\n{tail}",
+                        duration, {})
+
+        self.tasks_done += 1
+        return message["success"], message["error"], duration, message.get("stats", {})
+
+    def render_batch(self, scene_code, scene_names, timeouts, dry_run=False, stall_timeout=None):
+        """Render several scenes of one module in a single request.
+
+        `timeouts` holds the timeout of each scene. Returns a dict mapping
+        scene names to (success, error_message, duration, stats) tuples;
+        scenes missing from it were not rendered, because the module failed
+        to load or the worker was killed or crashed on an earlier scene.
+        """
+        if not self.alive or self.tasks_done >= self.max_tasks:
+            self.restart()
+
+        self._next_id += 1
+        request_id = self._next_id
+        results = {}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            request = {
+                "id": request_id,
+                "code": scene_code,
+                "scenes": scene_names,
+                "workdir": tmpdir,
+                "dry_run": dry_run,
+            }
+            start = time.perf_counter()
+            try:
+                self.proc.stdin.write(json.dumps(request) + "\n")
+                self.proc.stdin.flush()
+            except OSError:
+                self.restart()
+                return results
+
+            for scene_name, timeout in zip(scene_names, timeouts):
+                try:
+                    message = self._wait_for_result(request_id, start, timeout, stall_timeout)
+                except TimeoutError as e:
+                    self.proc.kill()
+                    self.restart()
+                    results[scene_name] = (False, str(e), time.perf_counter() - start, {})
+                    return results
+
+                duration = time.perf_counter() - start
+                if message is None:
+                    exit_code = self.proc.wait()
+                    tail = self._log_tail()
+                    self.restart()
+                    results[scene_name] = (
+                        False, f"Render worker crashed (exit code {exit_code})\n{tail}",
+                        duration, {})
+                    return results
+                if message.get("scene") is None:
+                    # The module failed to load; no scene follows
+                    break
+                results[message["scene"]] = (message["success"], message["error"],
+                                             message["duration"], message.get("stats", {}))
+                start = time.perf_counter()
+
+        self.tasks_done += 1
+        return results
+
+
+class WorkerPool:
+    """A fixed set of warm render workers shared between threads."""
+
+    def __init__(self, backend, size, **worker_kwargs):
+        self.workers = [RenderWorker(backend, **worker_kwargs) for _ in range(size)]
+        self._idle = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+
+    def start(self):
+        threads = [threading.Thread(target=w.start) for w in self.workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self
+
+    def render(self, scene_code, scene_name, timeout=30, dry_run=False, source_path=None,
+               stall_timeout=None):
+        """Render on the next idle worker and return (success, error, duration, stats)."""
+        worker = self._idle.get()
+        try:
+            return worker.render(scene_code, scene_name, timeout=timeout, dry_run=dry_run,
+                                 source_path=source_path, stall_timeout=stall_timeout)
+        finally:
+            self._idle.put(worker)
+
+    def render_batch(self, scene_code, scene_names, timeouts, dry_run=False, stall_timeout=None):
+        """Render a batch on the next idle worker; see `RenderWorker.render_batch`."""
+        worker = self._idle.get()
+        try:
+            return worker.render_batch(scene_code, scene_names, timeouts, dry_run=dry_run,
+                                       stall_timeout=stall_timeout)
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        for worker in self.workers:
+            worker.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
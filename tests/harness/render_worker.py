@@ -0,0 +1,259 @@
+"""Long-lived render worker for the skill test harness.
+
+Started as `python -m harness.render_worker <backend>`. The worker imports
+the backend's manim package once and then renders scenes sent to it as JSON
+lines on stdin, answering each request with one JSON line on the original
+stdout. Everything manim prints is redirected away from that stream so it
+cannot corrupt the protocol.
+
+A request with a list of `scenes` instead of a single `scene` is a batch:
+the module is loaded once and each scene is rendered in turn, with one
+result message per scene. If the module itself fails to load, a single
+result without a scene is sent.
+
+With `--scene-file FILE --scene NAME [--dry-run] [--stats FILE]` it renders
+that one scene and exits instead, which is how dry runs work without the
+warm pool. Repeating `--scene` together with `--results FILE` renders a
+batch and appends one JSON line per scene to FILE.
+
+Every render reports statistics along with its result: the number of `play`
+calls, the frames stepped through and the peak resident memory in MB.
+While a scene renders, the worker sends at most one `progress` message per
+second as animations play and frames are stepped, which the pool's watchdog
+uses to tell a slow render from a stalled one.
+"""
+import argparse
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import tempfile
+import traceback
+from contextlib import ExitStack, redirect_stdout, redirect_stderr
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from harness.backends import get_backend
+from harness.texcache import TexCache
+
+
+def load_backend(backend, progress=None):
+    """Import the backend's package and share its LaTeX cache with other workers.
+
+    `progress` is hooked into the scene's animation and frame steps.
+    """
+    importlib.import_module(backend.module)
+    backend.install_tex_cache(TexCache(backend))
+    if progress is not None:
+        backend.install_progress_hook(progress)
+
+
+class ProgressReporter:
+    """Sends throttled progress messages for the request being rendered."""
+
+    def __init__(self, protocol, interval=1.0):
+        self.protocol = protocol
+        self.interval = interval
+        self.request_id = None
+        self.steps = 0
+        self._last_sent = 0.0
+
+    def start(self, request_id):
+        self.request_id = request_id
+        self.steps = 0
+        self._last_sent = 0.0
+
+    def stop(self):
+        self.request_id = None
+
+    def __call__(self):
+        if self.request_id is None:
+            return
+        self.steps += 1
+        now = time.monotonic()
+        if now - self._last_sent >= self.interval:
+            self._last_sent = now
+            send(self.protocol, {"type": "progress", "id": self.request_id, "steps": self.steps})
+
+
+def reset_peak_rss():
+    """Reset the kernel's peak RSS counter of this process (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb():
+    """Peak RSS since `reset_peak_rss`, in MB.
+
+    Where the counter cannot be reset this is the peak of the whole worker
+    process; None when it is not available at all.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit, 1)
+
+
+def open_protocol_stream():
+    """Reserve the real stdout for protocol messages and point fd 1 at stderr."""
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+    return protocol
+
+
+def send(protocol, message):
+    """Write a single protocol message."""
+    protocol.write(json.dumps(message) + "\n")
+    protocol.flush()
+
+
+def captured(func, *args, **kwargs):
+    """Call a render step with its output captured.
+
+    Returns (success, error_message, duration, return_value).
+    """
+    output = io.StringIO()
+    value = None
+    reset_peak_rss()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            value = func(*args, **kwargs)
+        success, error = True, ""
+    except (Exception, SystemExit):
+        success = False
+        error = f"OUTPUT:\n{output.getvalue()}\n\nTRACEBACK:\n{traceback.format_exc()}"
+    return success, error, time.perf_counter() - start, value
+
+
+def result_message(request_id, success, error, duration, stats, **extra):
+    """Build a result message, adding the peak RSS to the render statistics."""
+    return dict({
+        "type": "result",
+        "id": request_id,
+        "success": success,
+        "error": error,
+        "duration": duration,
+        "stats": dict(stats or {}, peak_rss_mb=peak_rss_mb()),
+    }, **extra)
+
+
+def handle_request(backend, request):
+    """Render the requested scene and build the response message."""
+    success, error, duration, stats = captured(
+        backend.render_in_process, request["code"], request["scene"], request["workdir"],
+        dry_run=request.get("dry_run", False), source_path=request.get("source_path"))
+    return result_message(request["id"], success, error, duration, stats)
+
+
+def handle_batch(backend, request, reply):
+    """Render every scene of a batch request, calling `reply` once per scene."""
+    with ExitStack() as stack:
+        loaded = backend.loaded_scenes(request["code"], request["scenes"], request["workdir"],
+                                       dry_run=request.get("dry_run", False))
+        success, error, duration, render_scene = captured(stack.enter_context, loaded)
+        if not success:
+            reply(result_message(request["id"], False, error, duration, {}, scene=None))
+            return
+        for scene_name in request["scenes"]:
+            success, error, duration, stats = captured(render_scene, scene_name)
+            reply(result_message(request["id"], success, error, duration, stats,
+                                 scene=scene_name))
+
+
+def render_once(backend, scene_file, scene_name, dry_run, stats_file=None):
+    """Render a single scene file and return a process exit code.
+
+    Render statistics are written to `stats_file` as JSON when given.
+    """
+    stats = {}
+    exit_code = 0
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            load_backend(backend)
+            stats = backend.render_in_process(Path(scene_file).read_text(), scene_name, tmpdir,
+                                              dry_run=dry_run, source_path=scene_file) or {}
+        except (Exception, SystemExit):
+            traceback.print_exc()
+            exit_code = 1
+    if stats_file:
+        stats["peak_rss_mb"] = peak_rss_mb()
+        Path(stats_file).write_text(json.dumps(stats))
+    return exit_code
+
+
+def render_batch_once(backend, scene_file, scene_names, dry_run, results_file):
+    """Render several scenes of one file, appending their results to `results_file`.
+
+    Results are written as they come in, so the scenes rendered before a
+    timeout are not lost. Returns a process exit code.
+    """
+    load_backend(backend)
+    with open(results_file, "a") as results, tempfile.TemporaryDirectory() as tmpdir:
+        def reply(message):
+            results.write(json.dumps(message) + "\n")
+            results.flush()
+
+        request = {"id": 0, "code": Path(scene_file).read_text(), "scenes": scene_names,
+                   "workdir": tmpdir, "dry_run": dry_run}
+        handle_batch(backend, request, reply)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill test harness render worker")
+    parser.add_argument("backend")
+    parser.add_argument("--scene-file")
+    parser.add_argument("--scene", action="append")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--stats")
+    parser.add_argument("--results")
+    args = parser.parse_args()
+    backend = get_backend(args.backend)
+
+    if args.scene_file and args.results:
+        sys.exit(render_batch_once(backend, args.scene_file, args.scene, args.dry_run,
+                                   args.results))
+    if args.scene_file:
+        sys.exit(render_once(backend, args.scene_file, args.scene[0], args.dry_run,
+                             stats_file=args.stats))
+
+    protocol = open_protocol_stream()
+    progress = ProgressReporter(protocol)
+    # The whole point of the worker is to pay this import only once
+    load_backend(backend, progress)
+
+    send(protocol, {"type": "ready", "pid": os.getpid()})
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        progress.start(request["id"])
+        try:
+            if "scenes" in request:
+                handle_batch(backend, request, lambda message: send(protocol, message))
+            else:
+                send(protocol, handle_request(backend, request))
+        finally:
+            progress.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Machine-readable JSON and JUnit XML reports of a harness run.
+
+JSON records carry the render statistics of each block (peak RSS, frames and
+`play` calls), and a saved JSON report can serve as the baseline that a
+later run's durations are compared against.
+"""
+import json
+import xml.etree.ElementTree as ET
+
+
+def build_records(outcomes, cached, file_results):
+    """One record per tested or skipped item, ordered by file."""
+    records = []
+    for job, success, error, duration, stats in outcomes:
+        records.append({
+            'file': job['file'],
+            'item': job['item'],
+            'scene': job['scene_name'],
+            'status': 'passed' if success else 'failed',
+            'duration': round(duration, 3),
+            'peak_rss_mb': stats.get('peak_rss_mb'),
+            'frames': stats.get('frames'),
+            'plays': stats.get('plays'),
+            'error': error,
+        })
+    for job in cached:
+        records.append({
+            'file': job['file'],
+            'item': job['item'],
+            'scene': job['scene_name'],
+            'status': 'cached',
+            'duration': 0.0,
+            'error': '',
+        })
+    for result in file_results:
+        for entry in result['skip_reasons']:
+            detail = f": {entry['detail']}" if entry['detail'] else ""
+            records.append({
+                'file': result['file'],
+                'item': f"block {entry['idx']}",
+                'scene': None,
+                'status': 'skipped',
+                'duration': 0.0,
+                'error': f"{entry['reason']}{detail}",
+            })
+        if result['error']:
+            records.append({
+                'file': result['file'],
+                'item': 'file',
+                'scene': None,
+                'status': 'failed',
+                'duration': 0.0,
+                'error': result['error'],
+            })
+    records.sort(key=lambda record: (record['file'], str(record['item'])))
+    return records
+
+
+def write_json(path, records, **metadata):
+    """Write the records with per-status counts and any run metadata."""
+    counts = {}
+    for record in records:
+        counts[record['status']] = counts.get(record['status'], 0) + 1
+    report = dict(metadata, summary=counts, results=records)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_junit(path, records, suite_name):
+    """Write a JUnit XML report with one test suite per file.
+
+    Cached passes are reported as passing test cases.
+    """
+    root = ET.Element("testsuites", name=suite_name)
+    suites = {}
+    for record in records:
+        suite = suites.get(record['file'])
+        if suite is None:
+            suite = suites[record['file']] = ET.SubElement(
+                root, "testsuite", name=record['file'],
+                tests="0", failures="0", skipped="0", time="0")
+        suite.set("tests", str(int(suite.get("tests")) + 1))
+        suite.set("time", f"{float(suite.get('time')) + record['duration']:.3f}")
+        case = ET.SubElement(suite, "testcase", name=str(record['item']),
+                             classname=record['file'], time=f"{record['duration']:.3f}")
+        if record['status'] == 'failed':
+            suite.set("failures", str(int(suite.get("failures")) + 1))
+            failure = ET.SubElement(case, "failure", message=record['error'].strip().splitlines()[-1]
+                                    if record['error'].strip() else "failed")
+            failure.text = record['error']
+        elif record['status'] == 'skipped':
+            suite.set("skipped", str(int(suite.get("skipped")) + 1))
+            ET.SubElement(case, "skipped", message=record['error'])
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def load_baseline(path):
+    """Durations of a saved JSON report, keyed by (file, item).
+
+    Only rendered passes are used; cached and failed entries say nothing
+    about how long a block takes.
+    """
+    with open(path) as f:
+        report = json.load(f)
+    return {(record['file'], record['item']): record['duration']
+            for record in report['results'] if record['status'] == 'passed'}
+
+
+def compare_to_baseline(records, baseline, tolerance=0.25, min_delta=0.5):
+    """Rendered passes that got slower than in `baseline`.
+
+    A block regresses when it is more than `tolerance` (relative) and
+    `min_delta` seconds slower. Returns (record, baseline_duration) pairs,
+    largest slowdown first.
+    """
+    regressions = []
+    for record in records:
+        before = baseline.get((record['file'], record['item']))
+        if record['status'] != 'passed' or before is None:
+            continue
+        delta = record['duration'] - before
+        if delta > min_delta and delta > tolerance * before:
+            regressions.append((record, before))
+    regressions.sort(key=lambda pair: pair[0]['duration'] - pair[1], reverse=True)
+    return regressions
@@ -0,0 +1,320 @@
+"""Command-line entry point shared by the per-backend `test_all_skills.py` scripts."""
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+from contextlib import nullcontext
+from functools import partial
+from multiprocessing import cpu_count
+
+from harness.blocks import format_stats, run_batch, run_scene
+from harness.cache import ResultCache
+from harness.examples import collect_example_jobs, find_example_files, EXAMPLE_DIRS
+from harness.pool import WorkerPool
+from harness.report import (build_records, compare_to_baseline, load_baseline, write_json,
+                            write_junit)
+from harness.scheduler import (DurationHistory, collect_jobs, parse_shard, select_shard,
+                               split_cached, run_jobs, aggregate)
+from harness.texcache import TexCache, collect_tex_literals, prewarm
+
+
+def print_block_result(job, success, error, duration, stats, done, total):
+    """Print progress as block results come in."""
+    status = "✓" if success else "✗"
+    print(f"{status} [{done}/{total}] {job['file']} {job['item']} "
+          f"({job['scene_name']}): {duration:.2f}s{format_stats(stats)}"
+          f"{' (retried after a timeout)' if job.get('retried') else ''}")
+    if not success:
+        print(f"    Code:\n{job['code'][:200]}...")
+        print(f"    Error: {error[:500]}")
+
+
+def _metric(stats, name):
+    value = stats.get(name)
+    return "-" if value is None else f"{value:.0f}"
+
+
+def print_slowest_blocks(results, count=20):
+    """Print the slowest rendered blocks across all files with their statistics."""
+    timings = [(duration, r['file'], idx, scene, success, stats)
+               for r in results
+               for idx, scene, duration, success, stats in r['timings']]
+    if not timings:
+        return
+    print(f"\nSlowest {min(count, len(timings))} blocks:")
+    print(f"      {'time':>8}  {'RSS MB':>7}  {'frames':>6}  {'plays':>5}  block")
+    timings.sort(key=lambda timing: timing[0], reverse=True)
+    for duration, fname, idx, scene, success, stats in timings[:count]:
+        status = "✓" if success else "✗"
+        item = f"block {idx}" if isinstance(idx, int) else idx
+        print(f"  {status}   {duration:7.2f}s  {_metric(stats, 'peak_rss_mb'):>7}  "
+              f"{_metric(stats, 'frames'):>6}  {_metric(stats, 'plays'):>5}  "
+              f"{fname} {item} ({scene})")
+
+
+def print_regressions(regressions):
+    """Print blocks that got slower than in the baseline report."""
+    if not regressions:
+        print(f"\nNo blocks slower than the baseline")
+        return
+    print(f"\nSlower than baseline ({len(regressions)} blocks):")
+    for record, before in regressions:
+        print(f"  {before:7.2f}s -> {record['duration']:7.2f}s  "
+              f"{record['file']} {record['item']} ({record['scene']})")
+
+
+def print_skip_reasons(results, verbose=False):
+    """Print why blocks were skipped, per reason code or per block."""
+    entries = [(r['file'], entry) for r in results for entry in r['skip_reasons']]
+    if not entries:
+        return
+    print(f"\nSkipped blocks by reason:")
+    for reason, count in Counter(entry['reason'] for _, entry in entries).most_common():
+        print(f"  {count:4d}  {reason}")
+    if verbose:
+        for fname, entry in entries:
+            detail = f": {entry['detail']}" if entry['detail'] else ""
+            print(f"  - {fname} block {entry['idx']}: {entry['reason']}{detail}")
+
+
+def main(backend, argv=None):
+    """Run the skill markdown tests for `backend` and exit with its status."""
+    parser = argparse.ArgumentParser(description=f"Test {backend.display_name} skill markdown files")
+    parser.add_argument(
+        "file",
+        nargs="?",
+        help="Specific markdown or example file to test (e.g., 'scenes.md', 'basic_scene.py')"
+    )
+    parser.add_argument(
+        "--suite",
+        choices=["rules", "examples", "all"],
+        default="all",
+        help="Test rules/*.md code blocks, examples/ and templates/ scenes, or both (default: all)"
+    )
+    parser.add_argument(
+        "--shard",
+        help="Only run shard i of n (e.g. 2/4); the split is deterministic across machines"
+    )
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help="Write a JSON report of every tested and skipped item"
+    )
+    parser.add_argument(
+        "--junit",
+        metavar="PATH",
+        help="Write a JUnit XML report"
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="PATH",
+        help="Compare block durations against a JSON report from an earlier run"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=cpu_count(),
+        help=f"Number of parallel jobs (default: {cpu_count()})"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Render up to this many markdown blocks from one module per worker request "
+             "(default: 1, no batching)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30,
+        help="Minimum per-block timeout in seconds; blocks known to be slow get more (default: 30)"
+    )
+    parser.add_argument(
+        "--stall-timeout",
+        type=float,
+        default=20,
+        help="Kill a pooled render whose animations make no progress for this many seconds, "
+             "0 to disable (default: 20)"
+    )
+    parser.add_argument(
+        "--no-pool",
+        action="store_true",
+        help="Start a fresh render process per block instead of using warm workers"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every block, ignoring and not updating the result cache"
+    )
+    parser.add_argument(
+        "--no-prewarm",
+        action="store_true",
+        help="Do not compile the Tex literals of the tested blocks before rendering them"
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete all cached results before running"
+    )
+    parser.add_argument(
+        "--render",
+        action="store_true",
+        help="Rasterize and write output for every block instead of a construct-only dry run"
+    )
+    parser.add_argument(
+        "--show-skipped",
+        action="store_true",
+        help="List every skipped block with the reason it was skipped"
+    )
+    args = parser.parse_args(argv)
+
+    skills_dir = backend.skills_dir / "rules"
+
+    # Determine what to test
+    markdown_files, example_files = [], []
+    if args.file:
+        candidates = [Path(args.file), skills_dir / args.file]
+        candidates += [backend.skills_dir / dirname / args.file for dirname in EXAMPLE_DIRS]
+        file_path = next((path for path in candidates if path.exists()), None)
+
+        if file_path is None:
+            print(f"Error: File {args.file} not found")
+            sys.exit(1)
+
+        if file_path.suffix == ".py":
+            example_files = [file_path]
+        else:
+            markdown_files = [file_path]
+    else:
+        if args.suite in ("rules", "all"):
+            markdown_files = sorted(skills_dir.glob("*.md"))
+        if args.suite in ("examples", "all"):
+            example_files = find_example_files(backend)
+
+    if not markdown_files and not example_files:
+        print(f"Error: No markdown or example files found in {backend.skills_dir}")
+        sys.exit(1)
+
+    # Blocks are filtered by the names the star import provides; without
+    # them every block using an undefined name would be sent to render
+    if markdown_files:
+        try:
+            backend.provided_names()
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    # Flatten every (file, block) and (file, scene) pair into one work queue
+    jobs, file_results = collect_jobs(markdown_files, backend)
+    example_jobs, example_results = collect_example_jobs(example_files, backend)
+    jobs += example_jobs
+    file_results.update(example_results)
+
+    if args.shard:
+        try:
+            shard_index, shard_count = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        jobs = select_shard(jobs, shard_index, shard_count)
+        shard_files = {job['file'] for job in jobs}
+        file_results = {name: result for name, result in file_results.items()
+                        if name in shard_files or (shard_index == 1 and result['error'])}
+        print(f"Running shard {shard_index}/{shard_count}")
+
+    history = DurationHistory(backend)
+
+    dry_run = not args.render
+
+    # Skip blocks whose exact scene code already passed with this version
+    cache = None if args.no_cache else ResultCache(backend, dry_run=dry_run)
+    if args.clear_cache:
+        ResultCache(backend, dry_run=dry_run).clear()
+    cached = []
+    if cache is not None:
+        jobs, cached = split_cached(jobs, cache)
+
+    num_workers = max(1, min(args.jobs, len(jobs)))
+    print(f"Found {len(jobs) + len(cached)} blocks and scenes in {len(file_results)} files to test")
+    if cached:
+        print(f"Skipping {len(cached)} blocks with a cached pass (use --no-cache to re-render)")
+    print(f"Using {num_workers} parallel workers"
+          f"{'' if args.no_pool else ' (warm render pool)'}, "
+          f"{'dry run (construct only)' if dry_run else 'full render'}\n")
+
+    # Run tests in parallel, longest blocks first
+    render_pool = nullcontext() if args.no_pool or not jobs else WorkerPool(backend, num_workers)
+    with render_pool as workers:
+        if workers is None:
+            render = partial(run_scene, backend=backend, dry_run=dry_run)
+            # Full renders without the pool use the CLI, which cannot batch
+            render_batch = partial(run_batch, backend=backend) if dry_run else None
+        else:
+            render = partial(workers.render, dry_run=dry_run,
+                             stall_timeout=args.stall_timeout or None)
+            render_batch = partial(workers.render_batch, dry_run=dry_run,
+                                   stall_timeout=args.stall_timeout or None)
+        # The CLI used by --no-pool --render keeps manim's own Tex cache
+        if not args.no_prewarm and (workers is not None or dry_run):
+            literals = collect_tex_literals(jobs, backend)
+            if literals:
+                print(f"Prewarming the shared Tex cache with {len(literals)} formulas\n")
+                prewarm(literals, render, backend, num_workers)
+        outcomes = run_jobs(jobs, render, num_workers, history, cache=cache,
+                            on_result=print_block_result, timeout=args.timeout,
+                            render_batch=render_batch, batch_size=args.batch_size)
+    history.save()
+    if cache is not None:
+        cache.evict()
+    TexCache(backend).evict()
+
+    results = aggregate(outcomes, file_results, cached)
+    records = build_records(outcomes, cached, results)
+    if args.json or args.junit:
+        if args.json:
+            write_json(args.json, records, backend=backend.name, shard=args.shard,
+                       dry_run=dry_run)
+        if args.junit:
+            write_junit(args.junit, records, f"{backend.name}-skills")
+    print(f"\n{'='*60}")
+    print(f"PER-FILE RESULTS")
+    print(f"{'='*60}")
+    for result in results:
+        status = "✓" if result['failed'] == 0 else "✗"
+        print(f"{status} {result['file']}: {result['passed']} passed "
+              f"({result['cached']} cached), {result['failed']} failed, "
+              f"{result['skipped']} skipped")
+        if result['error']:
+            print(f"    Error: {result['error']}")
+
+    # Calculate totals
+    total_passed = sum(r['passed'] for r in results)
+    total_failed = sum(r['failed'] for r in results)
+    total_skipped = sum(r['skipped'] for r in results)
+    total_cached = sum(r['cached'] for r in results)
+    failed_files = [r['file'] for r in results if r['failed'] > 0]
+
+    print(f"\n{'='*60}")
+    print(f"OVERALL SUMMARY")
+    print(f"{'='*60}")
+    print(f"Total: {total_passed}/{total_passed + total_failed} passed")
+    print(f"Failed: {total_failed}")
+    print(f"Skipped: {total_skipped}")
+    print(f"Cached: {total_cached}")
+    print_skip_reasons(results, verbose=args.show_skipped)
+    print_slowest_blocks(results)
+    if args.baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"\nError: could not read baseline {args.baseline}: {e}")
+        else:
+            print_regressions(compare_to_baseline(records, baseline))
+
+    if failed_files:
+        print(f"\nFiles with failures:")
+        for fname in failed_files:
+            print(f"  - {fname}")
+        sys.exit(1)
+    else:
+        print("\n✓ All tests passed!")
@@ -0,0 +1,292 @@
+"""Block-level scheduler for the skill test harness.
+
+All (markdown file, code block) pairs are flattened into a single work
+queue, ordered longest-first using the durations recorded by previous runs,
+and the results are aggregated back per file. A single large file no longer
+keeps one worker busy while the others sit idle.
+
+The same history sets each block's timeout, so a known heavy block gets
+more time than a trivial one. Blocks that time out are retried once after
+all other blocks are done, when the machine is no longer saturated.
+
+Optionally, markdown blocks are packed into batches that a worker renders
+from one module (see `pack_batches`); blocks a batch could not render are
+rendered on their own.
+"""
+import json
+import os
+import threading
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path
+
+from harness.blocks import (create_batch_module, is_timeout, prepare_markdown_blocks,
+                            top_level_names)
+
+
+class DurationHistory:
+    """Smoothed per-block render durations persisted between runs."""
+
+    def __init__(self, backend, path=None, smoothing=0.5):
+        self.path = Path(path or backend.cache_dir / "durations.json")
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        try:
+            self.durations = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.durations = {}
+
+    def get(self, key, default=None):
+        return self.durations.get(key, default)
+
+    def record(self, key, duration):
+        with self._lock:
+            previous = self.durations.get(key)
+            if previous is None:
+                self.durations[key] = duration
+            else:
+                self.durations[key] = (self.smoothing * duration
+                                       + (1 - self.smoothing) * previous)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with self._lock:
+            tmp_path.write_text(json.dumps(self.durations, indent=1, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+
+def block_key(markdown_path, idx):
+    """Stable identifier of a code block across runs."""
+    return f"{markdown_path.name}:{idx}"
+
+
+def new_file_result(name):
+    """An empty aggregated result for one tested file."""
+    return {
+        'file': name,
+        'passed': 0,
+        'failed': 0,
+        'skipped': 0,
+        'cached': 0,
+        'skip_reasons': [],
+        'timings': [],
+        'error': None
+    }
+
+
+def collect_jobs(markdown_files, backend):
+    """Flatten markdown files into block jobs.
+
+    Returns (jobs, file_results) where file_results maps each file name to
+    its (initially empty) aggregated result.
+    """
+    jobs = []
+    file_results = {}
+    for md_file in markdown_files:
+        result = new_file_result(md_file.name)
+        file_results[md_file.name] = result
+        try:
+            blocks, skipped_blocks = prepare_markdown_blocks(md_file, backend)
+            result['skipped'] = len(skipped_blocks)
+            result['skip_reasons'] = skipped_blocks
+        except Exception as e:
+            result['failed'] = 1
+            result['error'] = str(e)
+            continue
+        for block in blocks:
+            jobs.append(dict(block, file=md_file.name, item=f"block {block['idx']}",
+                             key=block_key(md_file, block['idx'])))
+    return jobs, file_results
+
+
+def order_longest_first(jobs, history):
+    """Sort jobs by their expected duration, longest first.
+
+    Blocks without history are assumed to be as slow as the slowest known
+    block so that new or renumbered blocks are not left for the end.
+    """
+    known = [history.get(job['key']) for job in jobs if history.get(job['key']) is not None]
+    default = max(known) if known else 0.0
+    return sorted(jobs, key=lambda job: history.get(job['key'], default), reverse=True)
+
+
+def adaptive_timeout(history, key, base, factor=4.0, ceiling=600):
+    """Timeout for a block: `factor` times its usual duration, at least `base`.
+
+    Blocks without history get `base` seconds; no block gets more than
+    `ceiling` seconds.
+    """
+    expected = history.get(key)
+    if expected is None:
+        return base
+    return min(ceiling, max(base, factor * expected))
+
+
+def parse_shard(text):
+    """Parse a `--shard i/n` argument into 1-based (index, count)."""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{text}', expected i/n (e.g. 2/4)")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{text}', i must be between 1 and n")
+    return index, count
+
+
+def select_shard(jobs, index, count):
+    """Deterministically keep the jobs belonging to shard `index` of `count`.
+
+    Membership depends only on the job key, so every machine computes the
+    same partition and adding a block does not reshuffle the others.
+    """
+    return [job for job in jobs if zlib.crc32(job['key'].encode()) % count == index - 1]
+
+
+def split_cached(jobs, cache):
+    """Split jobs into (to_render, cached) using the result cache.
+
+    Each job gets a `cache_key` so that passes can be recorded later.
+    """
+    to_render, cached = [], []
+    for job in jobs:
+        job['cache_key'] = cache.key(job.get('cache_source', job['scene_code']), job['scene_name'])
+        (cached if cache.has_pass(job['cache_key']) else to_render).append(job)
+    return to_render, cached
+
+
+def pack_batches(jobs, batch_size):
+    """Group jobs into batches of up to `batch_size`, keeping their order.
+
+    Only generated markdown scenes are batched; example files and blocks
+    whose top-level names clash with a batch's are kept apart. Returns a
+    list of job lists.
+    """
+    batches = []
+    open_batches = []
+    for job in jobs:
+        names = None if job.get('source_path') else top_level_names(job['scene_code'])
+        if names is None or batch_size <= 1:
+            batches.append([job])
+            continue
+        for batch, batch_names in open_batches:
+            if len(batch) < batch_size and not names & batch_names:
+                batch.append(job)
+                batch_names.update(names)
+                break
+        else:
+            batch = [job]
+            batches.append(batch)
+            open_batches.append((batch, set(names)))
+    return batches
+
+
+def run_jobs(jobs, render, num_workers, history, cache=None, on_result=None, timeout=30,
+             render_batch=None, batch_size=1):
+    """Render all jobs on `num_workers` threads.
+
+    Each job gets an `adaptive_timeout` based on `timeout`. Jobs that time
+    out are retried once, with twice the timeout, after all the others
+    finished; retried jobs are marked with `retried`.
+    With `render_batch` and a `batch_size` above one, markdown blocks are
+    rendered in batches (see `pack_batches`), and jobs a batch did not
+    render are queued on their own.
+    Passing blocks are recorded in `cache` when one is given.
+    `on_result(job, success, error, duration, stats, done, total)` is called
+    as each block finishes. Returns a list of (job, success, error, duration,
+    stats) outcomes.
+    """
+    ordered = order_longest_first(jobs, history)
+    outcomes = []
+
+    def submit(executor, job, job_timeout):
+        job['timeout'] = job_timeout
+        return executor.submit(render, job['scene_code'], job['scene_name'],
+                               source_path=job.get('source_path'), timeout=job_timeout)
+
+    def submit_batch(executor, batch):
+        for job in batch:
+            job['timeout'] = adaptive_timeout(history, job['key'], timeout)
+        return executor.submit(render_batch, create_batch_module(batch),
+                               [job['scene_name'] for job in batch],
+                               [job['timeout'] for job in batch])
+
+    def result_of(future):
+        try:
+            return future.result()
+        except Exception as e:
+            return False, f"Error running scene: {e}", 0.0, {}
+
+    def batch_results_of(future, batch):
+        try:
+            results = future.result()
+        except Exception:
+            results = {}
+        return [results.get(job['scene_name']) for job in batch]
+
+    def finish(job, success, error, duration, stats):
+        if success:
+            history.record(job['key'], duration)
+            if cache is not None:
+                cache.record_pass(job['cache_key'], file=job['file'],
+                                  idx=job['idx'], duration=duration)
+        outcomes.append((job, success, error, duration, stats))
+        if on_result is not None:
+            on_result(job, success, error, duration, stats, len(outcomes), len(ordered))
+
+    if render_batch is None:
+        batch_size = 1
+
+    with ThreadPoolExecutor(max_workers=max(1, num_workers)) as executor:
+        # The executor hands out work in submission order, so submitting
+        # longest-first keeps the slow blocks from ending up in the tail.
+        pending = {}
+        for batch in pack_batches(ordered, batch_size):
+            if len(batch) == 1:
+                job = batch[0]
+                future = submit(executor, job, adaptive_timeout(history, job['key'], timeout))
+            else:
+                future = submit_batch(executor, batch)
+            pending[future] = batch
+
+        timed_out = []
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = pending.pop(future)
+                if len(batch) == 1:
+                    results = [result_of(future)]
+                else:
+                    results = batch_results_of(future, batch)
+                for job, result in zip(batch, results):
+                    if result is None:
+                        # Not rendered by its batch; render it on its own
+                        pending[submit(executor, job, job['timeout'])] = [job]
+                    elif not result[0] and is_timeout(result[1]):
+                        timed_out.append(job)
+                    else:
+                        finish(job, *result)
+
+        # Timeouts are often caused by a loaded machine; retry them once now
+        # that the other blocks are done
+        futures = {submit(executor, job, 2 * job['timeout']): job for job in timed_out}
+        for future in as_completed(futures):
+            job = futures[future]
+            job['retried'] = True
+            finish(job, *result_of(future))
+    return outcomes
+
+
+def aggregate(outcomes, file_results, cached=()):
+    """Fold block outcomes and cached passes into the per-file results."""
+    for job in cached:
+        result = file_results[job['file']]
+        result['passed'] += 1
+        result['cached'] += 1
+    for job, success, error, duration, stats in outcomes:
+        result = file_results[job['file']]
+        result['passed' if success else 'failed'] += 1
+        result['timings'].append((job['idx'], job['scene_name'], duration, success, stats))
+    for result in file_results.values():
+        result['timings'].sort(key=lambda timing: timing[0])
+    return list(file_results.values())
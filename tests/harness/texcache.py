@@ -0,0 +1,174 @@
+"""Shared LaTeX/SVG cache for all render workers.
+
+Every render runs in its own temporary directory, so the framework's own Tex
+cache (under the media directory) starts empty for every block. Workers
+instead look compiled formulas up in one directory shared by all processes:
+
+- entries are content addressed by the formula, its template and the
+  installed framework version
+- a per-entry file lock makes concurrent workers compile a formula once,
+  the others wait for it and read the result
+- results are written to a temporary file and renamed into place, so a
+  worker killed mid-compile never leaves a truncated SVG behind
+
+Before a run, the Tex literals found in the blocks and scenes to be tested
+are compiled by a few prewarm renders (see `prewarm`).
+"""
+import ast
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: renames stay atomic, concurrent compiles are just duplicated
+    fcntl = None
+
+from harness.backends import installed_version
+from harness.classify import parse_block
+
+PREWARM_SCENE_NAME = "PrewarmTex"
+
+
+class TexCache:
+    """Content-addressed directory of compiled SVGs shared between processes.
+
+    Entries not used for `max_age_days` are removed by `evict`.
+    """
+
+    def __init__(self, backend, directory=None, max_age_days=30):
+        self.version = installed_version(backend.distribution)
+        self.directory = Path(directory or backend.cache_dir / "tex")
+        self.max_age = max_age_days * 24 * 60 * 60
+
+    def key(self, *parts):
+        payload = json.dumps([self.version, *parts])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.svg"
+
+    @contextmanager
+    def _locked(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(path.with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, key, compile_svg):
+        """Path of the SVG for `key`, calling `compile_svg()` on a miss.
+
+        `compile_svg` returns the SVG content; it runs at most once per key
+        across all processes sharing the directory.
+        """
+        path = self._path(key)
+        if path.exists():
+            os.utime(path)
+            return path
+        with self._locked(path):
+            # Another worker may have compiled it while we waited
+            if path.exists():
+                return path
+            svg = compile_svg()
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(svg)
+            os.replace(tmp_path, path)
+        return path
+
+    def evict(self):
+        """Remove entries unused for longer than `max_age_days`.
+
+        Returns the number of removed entries.
+        """
+        now = time.time()
+        removed = 0
+        for path in self.directory.glob("*/*.svg"):
+            try:
+                if now - path.stat().st_mtime > self.max_age:
+                    path.unlink()
+                    path.with_suffix(".lock").unlink(missing_ok=True)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def find_tex_literals(source, backend):
+    """Tex constructor calls in `source` whose arguments are all literals.
+
+    Returns a list of (class_name, args, kwargs) tuples.
+    """
+    try:
+        tree = parse_block(source)
+    except SyntaxError:
+        return []
+    literals = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in backend.tex_classes and node.args):
+            continue
+        try:
+            args = [ast.literal_eval(arg) for arg in node.args]
+            kwargs = {k.arg: ast.literal_eval(k.value) for k in node.keywords}
+        except (ValueError, TypeError, SyntaxError):
+            continue
+        if None in kwargs or not all(isinstance(arg, str) for arg in args):
+            continue
+        literals.append((node.func.id, args, kwargs))
+    return literals
+
+
+def collect_tex_literals(jobs, backend):
+    """Distinct Tex literals used by the code of the given jobs."""
+    seen = set()
+    literals = []
+    for source in dict.fromkeys(job['code'] for job in jobs):
+        for literal in find_tex_literals(source, backend):
+            marker = json.dumps(literal, sort_keys=True, default=repr)
+            if marker not in seen:
+                seen.add(marker)
+                literals.append(literal)
+    return literals
+
+
+def create_prewarm_scene(literals, backend):
+    """Scene code that constructs every literal, ignoring failing ones."""
+    return f"""{backend.import_line}
+
+PREWARM_TEX = {literals!r}
+
+
+class {PREWARM_SCENE_NAME}({backend.default_scene_class}):
+    def construct(self):
+        for class_name, args, kwargs in PREWARM_TEX:
+            try:
+                globals()[class_name](*args, **kwargs)
+            except Exception:
+                pass
+"""
+
+
+def prewarm(literals, render, backend, num_workers):
+    """Compile Tex literals into the shared cache.
+
+    The literals are split over `num_workers` prewarm scenes rendered with
+    `render`, so they compile in parallel before the real blocks start.
+    """
+    if not literals:
+        return
+    chunks = [literals[i::num_workers] for i in range(min(num_workers, len(literals)))]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        list(executor.map(
+            lambda chunk: render(create_prewarm_scene(chunk, backend), PREWARM_SCENE_NAME,
+                                 timeout=300),
+            chunks))